@@ -0,0 +1,54 @@
+"""
+
+Compare the cost of the float, Fraction and Decimal arithmetic modes in inspyre_toolbox.conversions.bytes.
+
+Usage:
+    python benchmarks/bench_byte_arithmetic.py [--number N]
+
+"""
+import random
+from argparse import ArgumentParser
+from timeit import timeit
+
+from inspyre_toolbox.conversions.bytes import (
+    convert_value,
+    convert_value_exact,
+    lowest_safe_conversion,
+    lowest_safe_conversion_exact,
+    )
+
+
+def report(label, baseline, timing, number, mode):
+    print(f'{label:<24} {mode:<9} {timing / number * 1e6:8.3f} µs | {timing / baseline:6.1f}x the float cost')
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=100000)
+    args = parser.parse_args()
+    number = args.number
+
+    rng = random.Random(0)
+    sizes = [rng.randrange(0, 10 ** rng.randrange(1, 16)) for _ in range(number)]
+
+    baseline = timeit(lambda: [convert_value(size, 'byte', 'megabit') for size in sizes], number=1)
+    report('convert', baseline, baseline, number, 'float')
+
+    timing = timeit(lambda: [convert_value_exact(size, 'byte', 'megabit') for size in sizes], number=1)
+    report('convert', baseline, timing, number, 'fraction')
+
+    timing = timeit(lambda: [convert_value_exact(size, 'byte', 'megabit', True) for size in sizes], number=1)
+    report('convert', baseline, timing, number, 'decimal')
+
+    baseline = timeit(lambda: [lowest_safe_conversion(size, 'byte', True) for size in sizes], number=1)
+    report('lowest_safe_conversion', baseline, baseline, number, 'float')
+
+    timing = timeit(lambda: [lowest_safe_conversion_exact(size, 'byte', True) for size in sizes], number=1)
+    report('lowest_safe_conversion', baseline, timing, number, 'fraction')
+
+    timing = timeit(lambda: [lowest_safe_conversion_exact(size, 'byte', True, True) for size in sizes], number=1)
+    report('lowest_safe_conversion', baseline, timing, number, 'decimal')
+
+
+if __name__ == '__main__':
+    main()
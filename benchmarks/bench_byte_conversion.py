@@ -0,0 +1,57 @@
+"""
+
+Compare bulk byte conversions through a ByteConverter per value against the logger-free conversion core and the
+bulk API in inspyre_toolbox.conversions.bytes.
+
+Usage:
+    python benchmarks/bench_byte_conversion.py [--number N]
+
+"""
+import random
+from argparse import ArgumentParser
+from timeit import timeit
+
+from inspyre_toolbox.conversions.bytes import ByteConverter, convert_value, lowest_safe_conversion, lowest_units_many
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def report(label, baseline, fast, number, fast_label='core'):
+    print(f'{label:<28} ByteConverter: {baseline / number * 1e6:8.2f} µs | '
+          f'{fast_label}: {fast / number * 1e6:8.3f} µs | {baseline / fast:6.1f}x')
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=100000)
+    args = parser.parse_args()
+    number = args.number
+
+    rng = random.Random(0)
+    sizes = [rng.randrange(0, 10 ** rng.randrange(1, 16)) for _ in range(number)]
+
+    baseline = timeit(lambda: [ByteConverter(size, 'byte').convert('megabyte') for size in sizes], number=1)
+    fast = timeit(lambda: [convert_value(size, 'byte', 'megabyte') for size in sizes], number=1)
+    report('convert', baseline, fast, number)
+
+    baseline = timeit(
+            lambda: [ByteConverter(size, 'byte').get_lowest_safe_conversion(True) for size in sizes],
+            number=1
+            )
+    fast = timeit(lambda: [lowest_safe_conversion(size, 'byte', True) for size in sizes], number=1)
+    report('get_lowest_safe_conversion', baseline, fast, number)
+
+    fast = timeit(lambda: lowest_units_many(sizes), number=1)
+    report('get_lowest_safe_conversion', baseline, fast, number, 'lowest_units_many')
+
+    if np is not None:
+        array = np.array(sizes, dtype=np.float64)
+        fast = timeit(lambda: lowest_units_many(array), number=1)
+        report('get_lowest_safe_conversion', baseline, fast, number, 'lowest_units_many (NumPy)')
+
+
+if __name__ == '__main__':
+    main()
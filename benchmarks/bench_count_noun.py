@@ -0,0 +1,59 @@
+"""
+
+Measure the throughput of inspyre_toolbox.humanize.Numerical.count_noun, against the previous implementation, which
+created (and logged to) a logger on every construction and call, and pluralized with inflect on every call. The batch
+count_nouns is then compared against calling count_noun per value.
+
+Usage:
+    python benchmarks/bench_count_noun.py [--number N]
+
+"""
+import random
+from argparse import ArgumentParser
+from timeit import timeit
+
+from inspyre_toolbox.core_helpers.logging import ROOT_ISL_DEVICE
+from inspyre_toolbox.humanize import INF, Numerical, count_nouns
+
+NOUNS = ['file', 'directory', 'process', 'byte', 'child', 'mouse', 'index', 'match']
+
+
+def legacy_count_noun(number, noun):
+    """What `Numerical(number, noun).count_noun()` used to do."""
+    log = ROOT_ISL_DEVICE.get_child('Inspyre-Toolbox.humanize.Numerical')
+    log.debug('Started logger: Inspyre-Toolbox.humanize.Numerical')
+    ROOT_ISL_DEVICE.get_child('inspyre_toolbox.humanize')
+
+    return f'{number:,} {INF.plural_noun(noun, number)}'
+
+
+def report(label, baseline, fast, number):
+    print(f'{label:<24} before: {baseline / number * 1e6:9.2f} µs | after: {fast / number * 1e6:7.2f} µs | '
+          f'{number / fast:10,.0f} calls/s | {baseline / fast:6.1f}x')
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=2000)
+    args = parser.parse_args()
+    number = args.number
+
+    rng = random.Random(0)
+    pairs = [(rng.randrange(0, 10 ** 6), rng.choice(NOUNS)) for _ in range(number)]
+
+    baseline = timeit(lambda: [legacy_count_noun(n, noun) for n, noun in pairs], number=1)
+    fast = timeit(lambda: [Numerical(n, noun).count_noun() for n, noun in pairs], number=1)
+    report('count_noun', baseline, fast, number)
+
+    baseline = timeit(lambda: [INF.plural_noun(noun, n) for n, noun in pairs], number=1)
+    fast = timeit(lambda: [Numerical(n, noun).count_noun() for n, noun in pairs], number=1)
+    report('vs. bare inflect call', baseline, fast, number)
+
+    counts = [n for n, _ in pairs]
+    baseline = timeit(lambda: [Numerical(n, 'file').count_noun() for n in counts], number=1)
+    fast = timeit(lambda: count_nouns(counts, 'file'), number=1)
+    report('count_nouns (batch)', baseline, fast, number)
+
+
+if __name__ == '__main__':
+    main()
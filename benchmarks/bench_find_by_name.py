@@ -0,0 +1,77 @@
+"""
+
+Measure inspyre_toolbox.proc_man.find_all_by_name against the previous implementation, which called
+`psutil.Process.as_dict` (name, create time and username) for every process on the system, and logged each one.
+
+The process table can be padded with idle children, to see how each scales with the number of processes.
+
+Usage:
+    python benchmarks/bench_find_by_name.py [--number N] [--spawn N] [--name NAME]
+
+"""
+import contextlib
+import subprocess
+from argparse import ArgumentParser
+from timeit import timeit
+
+import psutil
+
+from inspyre_toolbox.core_helpers.logging import add_isl_child
+from inspyre_toolbox.proc_man import find_all_by_name
+from inspyre_toolbox.proc_man.scanner import HAS_PROCFS, iter_processes
+
+
+def legacy_find_all_by_name(name):
+    """What `find_all_by_name(name)` used to do (less its colors)."""
+    log = add_isl_child('InspyreToolbox.proc_man.find_by_name')
+    name = name.lower()
+    found = []
+
+    for proc in psutil.process_iter():
+        with contextlib.suppress(psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            info = proc.as_dict(attrs=['pid', 'name', 'create_time', 'username'])
+            log.debug(info)
+
+            if name in info['name'].lower():
+                found.append(info)
+
+    return found
+
+
+def report(label, baseline, fast, number):
+    print(f'{label:<28} before: {baseline / number * 1e3:9.2f} ms | after: {fast / number * 1e3:7.2f} ms | '
+          f'{baseline / fast:6.1f}x')
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=5)
+    parser.add_argument('--spawn', type=int, default=0, help='The number of idle children to add to the table.')
+    parser.add_argument('--name', default='sleep', help='The name to search for.')
+    args = parser.parse_args()
+    number = args.number
+
+    children = [subprocess.Popen(['sleep', '600']) for _ in range(args.spawn)]
+
+    try:
+        print(f'{len(list(iter_processes()))} processes | /proc fast path: {HAS_PROCFS}')
+
+        # Warm up, so one-off costs (e.g. loading inflect, for the log line) aren't counted.
+        legacy_find_all_by_name(args.name)
+        find_all_by_name(args.name)
+
+        baseline = timeit(lambda: legacy_find_all_by_name(args.name), number=number)
+        fast = timeit(lambda: find_all_by_name(args.name), number=number)
+        report(f'find_all_by_name({args.name!r})', baseline, fast, number)
+
+        baseline = timeit(lambda: list(iter_processes(use_procfs=False)), number=number)
+        fast = timeit(lambda: list(iter_processes()), number=number)
+        report('scan only (psutil vs. /proc)', baseline, fast, number)
+    finally:
+        for child in children:
+            child.kill()
+            child.wait()
+
+
+if __name__ == '__main__':
+    main()
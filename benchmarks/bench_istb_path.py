@@ -0,0 +1,45 @@
+"""
+
+Compare construction and prepare() costs of inspyre_toolbox.path_man.ISTB_Path and ISTB_FastPath.
+
+Usage:
+    python benchmarks/bench_istb_path.py [--number N]
+
+"""
+import tempfile
+from argparse import ArgumentParser
+from pathlib import Path
+from timeit import timeit
+
+from inspyre_toolbox.path_man import ISTB_FastPath, ISTB_Path
+
+
+def report(label, baseline, fast, number):
+    print(f'{label:<24} ISTB_Path: {baseline / number * 1e6:8.2f} µs | '
+          f'ISTB_FastPath: {fast / number * 1e6:8.2f} µs | {baseline / fast:6.1f}x')
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=20000)
+    args = parser.parse_args()
+    number = args.number
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [str(Path(tmp, f'dir_{i % 64}')) for i in range(number)]
+
+        baseline = timeit(lambda: [ISTB_Path(p) for p in paths], number=1)
+        fast = timeit(lambda: [ISTB_FastPath(p) for p in paths], number=1)
+        report('construct', baseline, fast, number)
+
+        baseline = timeit(lambda: [ISTB_Path(p).prepare() for p in paths], number=1)
+        fast = timeit(lambda: [ISTB_FastPath(p).prepare() for p in paths], number=1)
+        report('construct + prepare()', baseline, fast, number)
+
+        ISTB_FastPath.clear_prepared_cache()
+        fast = timeit(lambda: ISTB_FastPath.prepare_all(paths), number=1)
+        report('prepare_all()', baseline, fast, number)
+
+
+if __name__ == '__main__':
+    main()
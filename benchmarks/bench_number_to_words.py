@@ -0,0 +1,42 @@
+"""
+
+Compare inspyre_toolbox.humanize.number_to_words against inflect's number_to_words.
+
+Usage:
+    python benchmarks/bench_number_to_words.py [--number N]
+
+"""
+import random
+from argparse import ArgumentParser
+from timeit import timeit
+
+from inspyre_toolbox.humanize import INF, number_to_words
+
+
+def report(label, baseline, fast, number):
+    print(f'{label:<12} inflect: {baseline / number * 1e6:8.2f} µs | '
+          f'number_to_words: {fast / number * 1e6:6.2f} µs | {baseline / fast:6.1f}x')
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=20000)
+    args = parser.parse_args()
+    number = args.number
+
+    rng = random.Random(0)
+
+    corpora = {
+            'small ints': [rng.randrange(0, 10000) for _ in range(number)],
+            'large ints': [rng.randrange(-10 ** 30, 10 ** 30) for _ in range(number)],
+            'floats':     [round(rng.uniform(-10 ** 6, 10 ** 6), rng.randrange(1, 6)) for _ in range(number)],
+            }
+
+    for label, values in corpora.items():
+        baseline = timeit(lambda: [INF.number_to_words(str(value)) for value in values], number=1)
+        fast = timeit(lambda: [number_to_words(value) for value in values], number=1)
+        report(label, baseline, fast, number)
+
+
+if __name__ == '__main__':
+    main()
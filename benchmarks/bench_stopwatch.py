@@ -0,0 +1,59 @@
+"""
+
+Compare the overhead of inspyre_toolbox.live_timer.Timer and Stopwatch.
+
+Usage:
+    python benchmarks/bench_stopwatch.py [--number N]
+
+"""
+from argparse import ArgumentParser
+from timeit import timeit
+
+from inspyre_toolbox.live_timer import Stopwatch, Timer
+
+
+def report(label, baseline, fast, number):
+    print(f'{label:<32} Timer: {baseline / number * 1e6:9.2f} µs | '
+          f'Stopwatch: {fast / number * 1e6:6.3f} µs | {baseline / fast:7.1f}x')
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=2000)
+    args = parser.parse_args()
+    number = args.number
+
+    baseline = timeit(lambda: Timer(), number=number)
+    fast = timeit(lambda: Stopwatch(), number=number)
+    report('construct', baseline, fast, number)
+
+    timers = [Timer() for _ in range(number)]
+    stopwatches = [Stopwatch() for _ in range(number)]
+
+    def start_stop(instances):
+        for instance in instances:
+            instance.start()
+            instance.stop()
+
+    baseline = timeit(lambda: start_stop(timers), number=1)
+    fast = timeit(lambda: start_stop(stopwatches), number=1)
+    report('start + stop', baseline, fast, number)
+
+    timer = Timer(auto_start=True)
+    stopwatch = Stopwatch(auto_start=True)
+
+    baseline = timeit(lambda: timer.get_elapsed(seconds=True), number=number)
+    fast = timeit(lambda: stopwatch.elapsed, number=number)
+    report('read elapsed', baseline, fast, number)
+
+    def pause_unpause(instance):
+        instance.pause()
+        instance.unpause()
+
+    baseline = timeit(lambda: pause_unpause(timer), number=number)
+    fast = timeit(lambda: pause_unpause(stopwatch), number=number)
+    report('pause + unpause', baseline, fast, number)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,10 +4,35 @@ This module provides a class to convert values between different byte units.
 Classes:
     ByteConverter
 
+    ThroughputMeter:
+        Measures the rate of a stream of byte counts. (See :mod:`inspyre_toolbox.conversions.bytes.throughput`)
+
 Functions:
+    convert_many:
+        Convert many values from one unit to another. (See :mod:`inspyre_toolbox.conversions.bytes.bulk`)
+
+    convert_value:
+        Convert a value from one unit to another, without building a `ByteConverter`.
+
+    convert_value_exact:
+        Convert a value from one unit to another exactly, returning a `Fraction` or `Decimal`.
+
     get_lowest_unit_size:
         Get the lowest unit size for a given size.
 
+    humanize_rate:
+        Format a rate in bytes per second, e.g. '1.50 MB/s'. (See :mod:`inspyre_toolbox.conversions.bytes.throughput`)
+
+    lowest_safe_conversion:
+        Get the largest unit a value can be expressed in without dropping below 1, without building a
+        `ByteConverter`.
+
+    lowest_safe_conversion_exact:
+        Like `lowest_safe_conversion`, but using exact arithmetic.
+
+    lowest_units_many:
+        Get the lowest safe unit for many values. (See :mod:`inspyre_toolbox.conversions.bytes.bulk`)
+
 Variables:
     VERSION:
         The version of the module.
@@ -18,6 +43,31 @@ Variables:
     MOD_LOGGER_NAME:
         The name of the logger for the module.
 
+    UNIT_CONVERSIONS:
+        A dictionary that maps unit names to their conversion factors relative to 1 byte.
+
+    UNIT_BITS:
+        A dictionary that maps unit names to the (integer) number of bits in one of that unit. Used for exact
+        arithmetic.
+
+    ARITHMETIC_MODES:
+        The arithmetic modes a `ByteConverter` can use; 'float' (the default), 'fraction' and 'decimal'.
+
+    UNIT_FAMILIES:
+        A dictionary that organizes units into families ('byte' and 'bit').
+
+    UNIT_FAMILY_MAP:
+        A dictionary that maps each unit name to the name of its family.
+
+    SI_BYTE_UNITS:
+        The SI byte units (powers of 1000), smallest first.
+
+    IEC_BYTE_UNITS:
+        The IEC byte units (powers of 1024), smallest first. Used by `get_lowest_unit_size`.
+
+    UNIT_ABBREVIATIONS:
+        A dictionary that maps byte unit names to their abbreviations.
+
 
 ByteConverter:
     A class to convert values between different byte units.
@@ -61,6 +111,10 @@ ByteConverter:
 
 
 """
+import sys
+from decimal import Decimal
+from fractions import Fraction
+from math import log10
 from typing import Any, Union
 
 from inspy_logger import InspyLogger, Loggable
@@ -74,6 +128,294 @@ MOD_LOGGER = InspyLogger('inspyre_toolbox.conversions.bytes')
 
 MOD_LOGGER.debug(f'Byte conversion module loaded. | Inspyre-Toolbox v{VERSION}')
 
+# Dictionary holding the conversion units
+UNIT_CONVERSIONS = {
+        'bit':       1/8,
+        'byte':      1,
+        'kilobit':   125,
+        'kilobyte':  1000,
+        'megabit':   125000,
+        'megabyte':  1000000,
+        'gigabit':   125000000,
+        'gigabyte':  1000000000,
+        'terabit':   125000000000,
+        'terabyte':  1000000000000,
+        'petabit':   125000000000000,
+        'petabyte':  1000000000000000,
+        'exabit':    125000000000000000,
+        'exabyte':   1000000000000000000,
+        'zetabit':   125000000000000000000,
+        'zetabyte':  1000000000000000000000,
+        'yottabit':  125000000000000000000000,
+        'yottabyte': 1000000000000000000000000
+        }
+
+UNIT_FAMILIES = {
+        'byte': ['byte', 'kilobyte', 'megabyte', 'gigabyte', 'terabyte', 'petabyte', 'exabyte', 'zetabyte',
+                 'yottabyte'],
+        'bit':  ['bit', 'kilobit', 'megabit', 'gigabit', 'terabit', 'petabit', 'exabit', 'zetabit', 'yottabit']
+        }
+
+UNIT_FAMILY_MAP = {unit: family for family, units in UNIT_FAMILIES.items() for unit in units}
+
+# Every unit is a whole number of bits, so exact conversions can be done on integers (and Fractions of them) without
+# the rounding that creeps in from the float factors above.
+UNIT_BITS = {unit: int(Fraction(factor) * 8) for unit, factor in UNIT_CONVERSIONS.items()}
+
+ARITHMETIC_MODES = ('float', 'fraction', 'decimal')
+
+SI_BYTE_UNITS = tuple(UNIT_FAMILIES['byte'])
+
+IEC_BYTE_UNITS = ('byte', 'kibibyte', 'mebibyte', 'gibibyte', 'tebibyte', 'pebibyte', 'exbibyte', 'zebibyte',
+                  'yobibyte')
+
+UNIT_ABBREVIATIONS = {
+        'byte':      'B',
+        'kilobyte':  'KB',
+        'megabyte':  'MB',
+        'gigabyte':  'GB',
+        'terabyte':  'TB',
+        'petabyte':  'PB',
+        'exabyte':   'EB',
+        'zetabyte':  'ZB',
+        'yottabyte': 'YB',
+        'kibibyte':  'KiB',
+        'mebibyte':  'MiB',
+        'gibibyte':  'GiB',
+        'tebibyte':  'TiB',
+        'pebibyte':  'PiB',
+        'exbibyte':  'EiB',
+        'zebibyte':  'ZiB',
+        'yobibyte':  'YiB',
+        }
+
+_SI_BYTE_FACTORS = tuple(UNIT_CONVERSIONS[unit] for unit in SI_BYTE_UNITS)
+
+_IEC_BYTE_FACTORS = tuple(1024 ** power for power in range(len(IEC_BYTE_UNITS)))
+
+# (unit, factor) pairs, largest factor first, precomputed so lookups don't have to sort the unit table.
+_ALL_FACTORS_DESCENDING = tuple(sorted(UNIT_CONVERSIONS.items(), key=lambda item: item[1], reverse=True))
+
+_FAMILY_FACTORS_DESCENDING = {
+        family: tuple(item for item in _ALL_FACTORS_DESCENDING if item[0] in units)
+        for family, units in UNIT_FAMILIES.items()
+        }
+
+
+def _invalid_unit_error(unit) -> ValueError:
+    return ValueError(f"Invalid unit: {unit}. Valid units are: {list(UNIT_CONVERSIONS.keys())}")
+
+
+def convert_value(value: Union[int, float], from_unit: str, to_unit: str) -> float:
+    """
+    Convert a value from one unit to another.
+
+    This is the conversion core used by :class:`ByteConverter`. It does no logging and allocates nothing, so prefer it
+    when converting many values.
+
+    Parameters:
+        value (Union[int, float]):
+            The value to convert.
+
+        from_unit (str):
+            The unit `value` is in, e.g. 'byte'.
+
+        to_unit (str):
+            The unit to convert to, e.g. 'megabyte'.
+
+    Returns:
+        float:
+            The converted value.
+
+    Raises:
+        ValueError:
+            If either unit is invalid.
+
+    Example:
+        >>> convert_value(2048, 'byte', 'kilobyte')
+        2.048
+    """
+    try:
+        return value * UNIT_CONVERSIONS[from_unit] / UNIT_CONVERSIONS[to_unit]
+    except KeyError as e:
+        raise _invalid_unit_error(e.args[0]) from None
+
+
+def lowest_safe_conversion(
+        value: Union[int, float],
+        unit: str,
+        keep_family: bool = False
+        ) -> tuple[str, Union[int, float]]:
+    """
+    Get the largest unit that `value` can be expressed in without dropping below 1.
+
+    This is the conversion core used by :meth:`ByteConverter.get_lowest_safe_conversion`. It walks a precomputed table
+    of factors (largest first) instead of sorting the unit table and building a converter for every unit.
+
+    Parameters:
+        value (Union[int, float]):
+            The value to convert.
+
+        unit (str):
+            The unit `value` is in, e.g. 'byte'.
+
+        keep_family (bool):
+            A flag indicating whether to only consider units in the same family as `unit`.
+
+    Returns:
+        tuple[str, Union[int, float]]:
+            The unit and the converted value. If no unit gives a value of at least 1, `unit` and `value` are returned
+            unchanged.
+
+    Raises:
+        ValueError:
+            If `unit` is invalid.
+
+    Example:
+        >>> lowest_safe_conversion(1500000, 'byte', keep_family=True)
+        ('megabyte', 1.5)
+    """
+    try:
+        base = value * UNIT_CONVERSIONS[unit]
+    except KeyError:
+        raise _invalid_unit_error(unit) from None
+
+    table = _FAMILY_FACTORS_DESCENDING[UNIT_FAMILY_MAP[unit]] if keep_family else _ALL_FACTORS_DESCENDING
+
+    for to_unit, factor in table:
+        converted = base / factor
+        if converted >= 1:
+            return to_unit, converted
+
+    return unit, value
+
+
+def _to_fraction(value) -> Fraction:
+    if isinstance(value, (int, Fraction)):
+        return Fraction(value)
+
+    if isinstance(value, (float, Decimal, str)):
+        try:
+            return Fraction(value)
+        except (ValueError, OverflowError) as e:
+            raise ValueError(f'Cannot convert {value!r} exactly: {e}') from None
+
+    raise TypeError(f'Expected an int, float, Fraction, Decimal or str, got {type(value).__name__}.')
+
+
+def _exact_result(value: Fraction, as_decimal: bool) -> Union[Fraction, Decimal]:
+    return Decimal(value.numerator) / value.denominator if as_decimal else value
+
+
+def convert_value_exact(
+        value: Union[int, float, Fraction, Decimal, str],
+        from_unit: str,
+        to_unit: str,
+        as_decimal: bool = False
+        ) -> Union[Fraction, Decimal]:
+    """
+    Convert a value from one unit to another, exactly.
+
+    The value is converted to a count of bits (using the integer factors in `UNIT_BITS`) and then to the target unit,
+    using `Fraction` arithmetic throughout, so large units and bit/byte round-trips don't lose precision. This is an order
+    of magnitude slower than :func:`convert_value` (see ``benchmarks/bench_byte_arithmetic.py``); use it when the
+    result has to be exact.
+
+    Parameters:
+        value (Union[int, float, Fraction, Decimal, str]):
+            The value to convert. Floats are taken at their exact binary value, so pass a `str` or `Decimal` (e.g.
+            '0.1') to convert a decimal value exactly.
+
+        from_unit (str):
+            The unit `value` is in, e.g. 'byte'.
+
+        to_unit (str):
+            The unit to convert to, e.g. 'megabyte'.
+
+        as_decimal (bool):
+            A flag indicating whether to return a `Decimal` instead of a `Fraction`. The `Decimal` is rounded to the
+            precision of the current `decimal` context. Defaults to False.
+
+    Returns:
+        Union[Fraction, Decimal]:
+            The converted value.
+
+    Raises:
+        ValueError:
+            If either unit is invalid, or `value` is not finite.
+
+        TypeError:
+            If `value` is not a number or string.
+
+    Example:
+        >>> convert_value_exact(3, 'yottabyte', 'bit')
+        Fraction(24000000000000000000000000, 1)
+        >>> convert_value_exact(1, 'bit', 'kilobyte', as_decimal=True)
+        Decimal('0.000125')
+    """
+    try:
+        from_bits = UNIT_BITS[from_unit]
+        to_bits = UNIT_BITS[to_unit]
+    except KeyError as e:
+        raise _invalid_unit_error(e.args[0]) from None
+
+    value = _to_fraction(value)
+
+    return _exact_result(Fraction(value.numerator * from_bits, value.denominator * to_bits), as_decimal)
+
+
+def lowest_safe_conversion_exact(
+        value: Union[int, float, Fraction, Decimal, str],
+        unit: str,
+        keep_family: bool = False,
+        as_decimal: bool = False
+        ) -> tuple[str, Union[Fraction, Decimal]]:
+    """
+    Get the largest unit that `value` can be expressed in without dropping below 1, using exact arithmetic.
+
+    Parameters:
+        value (Union[int, float, Fraction, Decimal, str]):
+            The value to convert. (See :func:`convert_value_exact`)
+
+        unit (str):
+            The unit `value` is in, e.g. 'byte'.
+
+        keep_family (bool):
+            A flag indicating whether to only consider units in the same family as `unit`.
+
+        as_decimal (bool):
+            A flag indicating whether to return a `Decimal` instead of a `Fraction`. Defaults to False.
+
+    Returns:
+        tuple[str, Union[Fraction, Decimal]]:
+            The unit and the converted value. If no unit gives a value of at least 1, `unit` and `value` are returned,
+            with `value` as a `Fraction` (or `Decimal`).
+
+    Raises:
+        ValueError:
+            If `unit` is invalid, or `value` is not finite.
+
+        TypeError:
+            If `value` is not a number or string.
+
+    Example:
+        >>> lowest_safe_conversion_exact(1500000, 'byte', keep_family=True)
+        ('megabyte', Fraction(3, 2))
+    """
+    try:
+        bits = _to_fraction(value) * UNIT_BITS[unit]
+    except KeyError:
+        raise _invalid_unit_error(unit) from None
+
+    table = _FAMILY_FACTORS_DESCENDING[UNIT_FAMILY_MAP[unit]] if keep_family else _ALL_FACTORS_DESCENDING
+
+    for to_unit, _ in table:
+        unit_bits = UNIT_BITS[to_unit]
+        if bits >= unit_bits:
+            return to_unit, _exact_result(bits / unit_bits, as_decimal)
+
+    return unit, _exact_result(bits / UNIT_BITS[unit], as_decimal)
+
 
 class ByteConverter(Loggable):
     """
@@ -103,52 +445,46 @@ class ByteConverter(Loggable):
 
     get_lowest_safe_conversion(keep_family=True):
         Returns the smallest unit (in terms of scale) that represents the value without falling below 1 in the desired family.
+
+    Note:
+        By default, conversions use float arithmetic, which is fast but loses precision for the largest units. Pass
+        `arithmetic='fraction'` or `arithmetic='decimal'` to convert exactly (see :func:`convert_value_exact`) and get
+        `Fraction` or `Decimal` results instead.
     """
-    # Dictionary holding the conversion units
-    UNIT_CONVERSIONS = {
-        'bit': 1/8,
-            'byte':      1,
-            'kilobit':   125,
-            'kilobyte':  1000,
-            'megabit':   125000,
-            'megabyte':  1000000,
-            'gigabit':   125000000,
-            'gigabyte':  1000000000,
-            'terabit':   125000000000,
-            'terabyte':  1000000000000,
-            'petabit':   125000000000000,
-            'petabyte':  1000000000000000,
-            'exabit':    125000000000000000,
-            'exabyte':   1000000000000000000,
-            'zetabit':  125000000000000000000,
-            'zetabyte': 1000000000000000000000,
-            'yottabit':  125000000000000000000000,
-            'yottabyte': 1000000000000000000000000
-            }
-
-    UNIT_FAMILIES = {
-            'byte': ['byte', 'kilobyte', 'megabyte', 'gigabyte', 'terabyte', 'petabyte', 'exabyte', 'zetabyte',
-                     'yottabyte'],
-            'bit':  ['bit', 'kilobit', 'megabit', 'gigabit', 'terabit', 'petabit', 'exabit', 'zetabit', 'yottabit']
-            }
+    UNIT_CONVERSIONS = UNIT_CONVERSIONS
+
+    UNIT_FAMILIES = UNIT_FAMILIES
 
     def __init__(
             self,
-            value: Union[int, float],
-            unit: str
+            value: Union[int, float, Fraction, Decimal],
+            unit: str,
+            arithmetic: str = 'float'
             ):
         """
         Initialize a ByteConverter object with a specific value and unit.
 
         Parameters:
         ----------
-        value (Union[int, float]):
-            The numeric value of the data amount.
+        value (Union[int, float, Fraction, Decimal]):
+            The numeric value of the data amount. With 'float' arithmetic, a `Decimal` is converted to a float.
 
         unit : str
             The unit of the data amount, e.g., 'byte', 'kilobyte', etc.
+
+        arithmetic (str):
+            The arithmetic to convert with; one of 'float' (fast, the default), 'fraction' or 'decimal' (exact).
+
+        Raises:
+        ------
+        ValueError:
+            If `arithmetic` is not one of `ARITHMETIC_MODES`.
         """
-        super().__init__(parent_log_device=MOD_LOGGER)
+        if arithmetic not in ARITHMETIC_MODES:
+            raise ValueError(f'Invalid arithmetic mode: {arithmetic}. Valid modes are: {list(ARITHMETIC_MODES)}')
+
+        # The logger is set up lazily (see `log_device`), as most converters never log anything.
+        self.__logging_started = False
         # self.__keep_family = None
         #
         # unit = unit.removesuffix('s')
@@ -174,7 +510,33 @@ class ByteConverter(Loggable):
 
         self.unit = unit.lower()
 
-        self.__family_factors = self.__calculate_family_factors()
+        self.__arithmetic = arithmetic
+
+        self.__family_factors = None
+
+    def __start_logging(self) -> None:
+        if not self.__logging_started:
+            super().__init__(parent_log_device=MOD_LOGGER)
+            self.__logging_started = True
+
+    @property
+    def log_device(self):
+        self.__start_logging()
+        return super().log_device
+
+    @log_device.setter
+    def log_device(self, new):
+        self.__start_logging()
+        Loggable.log_device.fset(self, new)
+
+    def create_child_logger(self, name=None, **kwargs):
+        self.__start_logging()
+        return super().create_child_logger(name=name or sys._getframe(1).f_code.co_name, **kwargs)
+
+    def __float_value(self) -> Union[int, float, Fraction]:
+        # Decimals can't be multiplied or divided by the (float) conversion factors.
+        value = self.value
+        return float(value) if isinstance(value, Decimal) else value
 
     def __calculate_family_factors(self) -> dict:
         """
@@ -207,31 +569,21 @@ class ByteConverter(Loggable):
 
         Returns:
         -------
-        float:
-            The converted value.
+        Union[float, Fraction, Decimal]:
+            The converted value; a float, unless the converter uses exact arithmetic.
         """
-        log = self.create_child_logger()
-
         if not strict_case:
-            log.debug(f'Lowering the case of the target unit; {to_unit}')
             to_unit = to_unit.lower()
-        else:
-            log.debug(f'Strict case sensitivity is enabled. Target unit: {to_unit}')
 
-        if to_unit not in self.UNIT_CONVERSIONS:
-            log.error(f"Invalid unit: {to_unit}. Valid units are: {list(self.UNIT_CONVERSIONS.keys())}")
-            raise ValueError(f"Invalid unit: {to_unit}. Valid units are: {list(self.UNIT_CONVERSIONS.keys())}")
+        if to_unit not in UNIT_CONVERSIONS:
+            error = _invalid_unit_error(to_unit)
+            self.create_child_logger('convert').error(str(error))
+            raise error
 
-        from_factor = self.UNIT_CONVERSIONS[self.unit]
+        if self.__arithmetic != 'float':
+            return convert_value_exact(self.value, self.unit, to_unit, as_decimal=self.__arithmetic == 'decimal')
 
-        to_factor = self.UNIT_CONVERSIONS[to_unit]
-
-        log.debug(f"To factor: {to_factor} | From factor: {from_factor}")
-
-        converted_value = self.value * from_factor / to_factor
-        log.debug(f"Converted {self.value} {self.unit} to {converted_value} {to_unit}")
-
-        return converted_value
+        return self.__float_value() * UNIT_CONVERSIONS[self.unit] / UNIT_CONVERSIONS[to_unit]
 
     def get_lowest_safe_conversion(
             self,
@@ -248,33 +600,22 @@ class ByteConverter(Loggable):
             tuple:
                 The lowest safe conversion value and unit.
         """
-        log_name = f'{self.log_device.name}:get_lowest_safe_conversion'
-        log = self.log_device.find_child_by_name(log_name)[0] if self.log_device.has_child(
-            log_name) else self.create_child_logger()
-
-        sorted_units = None
-
-        if keep_family:
-            log.debug(f'Keeping the family of the initial unit: {self.__initial_unit}')
-            for family, units in self.UNIT_FAMILIES.items():
-                if self.unit in units:
-                    sorted_units = sorted(units, key=lambda x: self.UNIT_CONVERSIONS[x], reverse=True)
-                    break
-        else:
-            sorted_units = sorted(self.UNIT_CONVERSIONS.keys(), key=lambda x: self.UNIT_CONVERSIONS[x], reverse=True)
-
-        if sorted_units is None:
-            log.error(f'No units found for the initial unit: {self.__initial_unit}')
-            raise ValueError(f'No units found for the initial unit: {self.__initial_unit}')
-
-        for unit in sorted_units:
-            converted_value = self.convert(unit)
-            if converted_value >= 1:
-                log.debug(
-                    f'Lowest safe conversion: {converted_value} {unit} | Original value: {self.__initial_value} {self.__initial_unit}')
-                return unit, converted_value
-
-        return self.unit, self.value
+        try:
+            if self.__arithmetic == 'float':
+                unit, converted_value = lowest_safe_conversion(self.__float_value(), self.unit, keep_family=keep_family)
+            else:
+                unit, converted_value = lowest_safe_conversion_exact(
+                        self.value,
+                        self.unit,
+                        keep_family=keep_family,
+                        as_decimal=self.__arithmetic == 'decimal'
+                        )
+        except (KeyError, ValueError) as e:
+            error = ValueError(f'No units found for the initial unit: {self.__initial_unit}')
+            self.create_child_logger('get_lowest_safe_conversion').error(str(error))
+            raise error from e
+
+        return unit, converted_value
 
         #     family = self.BYTE_FAMILY if self.__initial_unit in self.BYTE_FAMILY else self.BIT_FAMILY
         #     log.debug(f'Family of the initial unit: {family}')
@@ -321,6 +662,17 @@ class ByteConverter(Loggable):
         #
         # return lowest_value, lowest_unit
 
+    @property
+    def arithmetic(self) -> str:
+        """
+        Returns the arithmetic mode the converter uses.
+
+        Returns:
+            str:
+                One of 'float', 'fraction' or 'decimal'.
+        """
+        return self.__arithmetic
+
     @property
     def family_factors(self) -> list[float]:
         """
@@ -331,6 +683,9 @@ class ByteConverter(Loggable):
                 The factors of the family of the initial unit.
 
         """
+        if self.__family_factors is None:
+            self.__family_factors = self.__calculate_family_factors()
+
         return self.__family_factors
 
     @property
@@ -548,42 +903,70 @@ class ByteConverter(Loggable):
             )
 
 
-def get_lowest_unit_size(size: int) -> tuple[Union[int, float], str]:
+def get_lowest_unit_size(
+        size: Union[int, float],
+        binary: bool = False,
+        abbreviate: bool = False
+        ) -> tuple[Union[int, float], str]:
     """
     Get the lowest unit size for a given size.
 
+    The unit is found in constant time, rather than by trying each unit from the largest down; SI units are bucketed
+    by the size's ``log10`` and IEC (binary) units by its ``bit_length()``.
+
     Parameters:
-        size (int):
-            The size to convert.
+        size (Union[int, float]):
+            The size to convert, in bytes.
+
+        binary (bool):
+            A flag indicating whether to use IEC units (KiB, MiB, ...; powers of 1024) instead of SI units (KB, MB,
+            ...; powers of 1000). Defaults to False.
+
+        abbreviate (bool):
+            A flag indicating whether to return the unit's abbreviation (e.g. 'MB', 'MiB') rather than its name
+            (e.g. 'MEGABYTE', 'MEBIBYTE'). Defaults to False.
 
     Returns:
         tuple[Union[int, float], str]:
-            The converted size and the unit.
+            The converted size and the unit. Sizes below one byte are returned unchanged, with 'BYTE' as the unit.
 
     Examples:
-        >>> get_lowest_unit_size(1024)
-        (1.0, 'KB')
-        >>> get_lowest_unit_size(1024 * 1024)
-        (1.0, 'MB')
-        >>> get_lowest_unit_size(1024 * 1024 * 1024)
-        (1.0, 'GB')
-        >>> get_lowest_unit_size(1024 * 1024 * 1024 * 1024)
-        (1.0, 'TB')
-        >>> get_lowest_unit_size(1024 * 1024 * 1024 * 1024 * 1024)
-        (1.0, 'PB')
-        >>> get_lowest_unit_size(1024 * 1024 * 1024 * 1024 * 1024 * 1024)
-        (1.0, 'EB')
-        >>> get_lowest_unit_size(1024 * 1024 * 1024 * 1024 * 1024 * 1024 * 1024)
-        (1.0, 'ZB')
-        >>> get_lowest_unit_size(1024 * 1024 * 1024 * 1024 * 1024 * 1024 * 1024 * 1024)
-        (1.0, 'YB')
+        >>> get_lowest_unit_size(1000)
+        (1.0, 'KILOBYTE')
+        >>> get_lowest_unit_size(1500000, abbreviate=True)
+        (1.5, 'MB')
+        >>> get_lowest_unit_size(1024, binary=True)
+        (1.0, 'KIBIBYTE')
+        >>> get_lowest_unit_size(1024 * 1024 * 1024, binary=True, abbreviate=True)
+        (1.0, 'GiB')
     """
-    units = ['byte', 'kilobyte', 'megabyte', 'gigabyte', 'terabyte', 'petabyte', 'exabyte', 'zetabyte', 'yottabyte']
-    units.reverse()
-    converter = ByteConverter(size, 'byte')
+    units, factors = (IEC_BYTE_UNITS, _IEC_BYTE_FACTORS) if binary else (SI_BYTE_UNITS, _SI_BYTE_FACTORS)
+
+    if not size >= 1:
+        power = 0
+        converted = size
+    else:
+        last = len(factors) - 1
+
+        if size >= factors[last]:
+            power = last
+        elif binary:
+            power = (int(size).bit_length() - 1) // 10
+        else:
+            power = int(log10(size)) // 3
 
-    for unit in units:
-        converted = converter.convert(unit.lower())
+        # Correct for rounding at the edges of a bucket, so the result always matches dividing by each factor in turn.
+        if size / factors[power] < 1:
+            power -= 1
+        elif power < last and size / factors[power + 1] >= 1:
+            power += 1
 
-        if converted >= 1:
-            return converted, unit.upper(),
+        converted = size / factors[power]
+
+    unit = units[power]
+
+    return converted, (UNIT_ABBREVIATIONS[unit] if abbreviate else unit.upper())
+
+
+from inspyre_toolbox.conversions.bytes.bulk import convert_many, lowest_units_many
+from inspyre_toolbox.conversions.bytes.throughput import ThroughputMeter, humanize_rate
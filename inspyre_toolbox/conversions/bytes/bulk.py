@@ -0,0 +1,234 @@
+"""
+Bulk byte conversions.
+
+This module converts whole sequences of values at once, rather than building a :class:`ByteConverter` per value. Values
+may be given as any sequence of numbers, an `array.array`, or (if NumPy is installed) a NumPy array. The result is
+returned in the same kind of container that was passed in.
+
+Rather than trying each unit in turn, the lowest safe unit for a value is found by bucketing: every unit family grows
+by a fixed factor (1000) from one unit to the next, so ``log10`` of a value tells us which unit it falls under
+directly. The bucket is then checked against its neighbours, so floating-point rounding at a unit boundary can never
+pick a different unit than :func:`lowest_safe_conversion` would.
+
+Functions:
+    convert_many:
+        Convert many values from one unit to another.
+
+    lowest_units_many:
+        Get the lowest safe unit (and the converted value) for many values.
+
+Since:
+    1.6.0
+"""
+from array import array
+from math import log10
+from typing import Iterable, List, Sequence, Tuple, Union
+
+from inspyre_toolbox.conversions.bytes import UNIT_CONVERSIONS, UNIT_FAMILIES, UNIT_FAMILY_MAP, _invalid_unit_error
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional.
+    np = None
+
+
+def _build_bucket_table(family: str) -> Tuple[Tuple[str, ...], Tuple[float, ...], float]:
+    """Build the (units, factors, log10 step) table for a unit family, smallest unit first."""
+    units = tuple(sorted(UNIT_FAMILIES[family], key=UNIT_CONVERSIONS.__getitem__))
+    factors = tuple(UNIT_CONVERSIONS[unit] for unit in units)
+
+    return units, factors, log10(factors[1] / factors[0])
+
+
+_BUCKET_TABLES = {family: _build_bucket_table(family) for family in UNIT_FAMILIES}
+
+
+def _bucket_index(base: float, factors: Sequence[float], step: float) -> int:
+    """
+    Find the index of the largest factor that `base` can be divided by without dropping below 1.
+
+    Returns -1 if `base` is below the smallest factor.
+    """
+    if not base / factors[0] >= 1:
+        return -1
+
+    last = len(factors) - 1
+    guess = log10(base / factors[0]) / step
+    index = last if guess >= last else int(guess)
+
+    # Correct for floating-point error at the edges of a bucket.
+    if base / factors[index] < 1:
+        index -= 1
+    elif index < last and base / factors[index + 1] >= 1:
+        index += 1
+
+    return index
+
+
+def _tables_for(unit: str, keep_family: bool):
+    try:
+        family = UNIT_FAMILY_MAP[unit]
+    except KeyError:
+        raise _invalid_unit_error(unit) from None
+
+    return [_BUCKET_TABLES[family]] if keep_family else list(_BUCKET_TABLES.values())
+
+
+def _is_ndarray(values) -> bool:
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def convert_many(
+        values: Union[Iterable[Union[int, float]], array],
+        from_unit: str,
+        to_unit: str
+        ) -> Union[List[float], array]:
+    """
+    Convert many values from one unit to another.
+
+    Parameters:
+        values (Union[Iterable[Union[int, float]], array.array, numpy.ndarray]):
+            The values to convert.
+
+        from_unit (str):
+            The unit the values are in, e.g. 'byte'.
+
+        to_unit (str):
+            The unit to convert to, e.g. 'megabyte'.
+
+    Returns:
+        Union[List[float], array.array, numpy.ndarray]:
+            The converted values, as a NumPy array of floats if a NumPy array was passed, an `array.array` of doubles
+            if an `array.array` was passed, or a list otherwise.
+
+    Raises:
+        ValueError:
+            If either unit is invalid.
+
+    Example:
+        >>> convert_many([1000, 2500000], 'byte', 'kilobyte')
+        [1.0, 2500.0]
+    """
+    try:
+        from_factor = UNIT_CONVERSIONS[from_unit]
+        to_factor = UNIT_CONVERSIONS[to_unit]
+    except KeyError as e:
+        raise _invalid_unit_error(e.args[0]) from None
+
+    if _is_ndarray(values):
+        return np.asarray(values, dtype=np.float64) * from_factor / to_factor
+
+    converted = [value * from_factor / to_factor for value in values]
+
+    return array('d', converted) if isinstance(values, array) else converted
+
+
+def _lowest_units_ndarray(values, unit: str, tables):
+    base = np.asarray(values, dtype=np.float64) * UNIT_CONVERSIONS[unit]
+
+    # Unit names for every table, with the original unit last for values that don't fit any of them.
+    names = np.array([name for units, _, _ in tables for name in units] + [unit])
+    best_name = np.full(base.shape, len(names) - 1, dtype=np.intp)
+    best_factor = np.zeros(base.shape, dtype=np.float64)
+    offset = 0
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for units, factors, step in tables:
+            factors = np.asarray(factors, dtype=np.float64)
+            last = len(factors) - 1
+
+            in_range = base / factors[0] >= 1
+            guess = np.log10(np.where(in_range, base / factors[0], 1.0)) / step
+            index = np.clip(np.floor(guess), 0, last).astype(np.intp)
+
+            # Correct for floating-point error at the edges of a bucket.
+            index -= base / factors[index] < 1
+            np.clip(index, 0, last, out=index)
+            index += (index < last) & (base / factors[np.minimum(index + 1, last)] >= 1)
+
+            candidate = np.where(in_range, factors[index], 0.0)
+            better = candidate > best_factor
+
+            best_factor = np.where(better, candidate, best_factor)
+            best_name = np.where(better, index + offset, best_name)
+            offset += len(units)
+
+        found = best_factor > 0
+        converted = np.where(found, base / np.where(found, best_factor, 1.0), values)
+
+    return converted, names[best_name]
+
+
+def lowest_units_many(
+        values: Union[Iterable[Union[int, float]], array],
+        unit: str = 'byte',
+        keep_family: bool = True
+        ) -> Tuple[Union[List[float], array], Union[List[str], 'np.ndarray']]:
+    """
+    Get the lowest safe unit for many values.
+
+    For each value this finds the same unit as :func:`lowest_safe_conversion` would; the largest unit the value can be
+    expressed in without dropping below 1. Values that are below 1 of the smallest unit are returned unchanged, in
+    their original unit.
+
+    Parameters:
+        values (Union[Iterable[Union[int, float]], array.array, numpy.ndarray]):
+            The values.
+
+        unit (str):
+            The unit the values are in. Defaults to 'byte'.
+
+        keep_family (bool):
+            A flag indicating whether to only consider units in the same family as `unit`. Defaults to True, so that
+            sizes in bytes aren't humanized as bits.
+
+    Returns:
+        Tuple[Union[List[float], array.array, numpy.ndarray], Union[List[str], numpy.ndarray]]:
+            The converted values and their units, as parallel containers. If a NumPy array was passed, both are NumPy
+            arrays; if an `array.array` was passed, the values are an `array.array` of doubles; otherwise both are
+            lists.
+
+    Raises:
+        ValueError:
+            If `unit` is invalid.
+
+    Example:
+        >>> lowest_units_many([512, 1500000, 3 * 10 ** 12])
+        ([512.0, 1.5, 3.0], ['byte', 'megabyte', 'terabyte'])
+    """
+    tables = _tables_for(unit, keep_family)
+
+    if _is_ndarray(values):
+        return _lowest_units_ndarray(values, unit, tables)
+
+    from_factor = UNIT_CONVERSIONS[unit]
+
+    converted = []
+    units = []
+
+    for value in values:
+        base = value * from_factor
+        best_unit = None
+        best_factor = 0
+
+        for table_units, factors, step in tables:
+            index = _bucket_index(base, factors, step)
+
+            if index >= 0 and factors[index] > best_factor:
+                best_unit = table_units[index]
+                best_factor = factors[index]
+
+        if best_unit is None:
+            converted.append(value)
+            units.append(unit)
+        else:
+            converted.append(base / best_factor)
+            units.append(best_unit)
+
+    return (array('d', converted) if isinstance(values, array) else converted), units
+
+
+__all__ = [
+    'convert_many',
+    'lowest_units_many',
+    ]
@@ -0,0 +1,309 @@
+"""
+Streaming throughput measurement.
+
+This module provides :class:`ThroughputMeter`, which is fed byte counts as data is copied, downloaded or hashed, and
+reports the transfer rate (and, if the expected total is known, the time remaining). One meter can be shared between
+worker threads.
+
+Two rates are kept, both in constant memory:
+
+    - An exponentially weighted moving average (EWMA), which reacts smoothly to changes in speed.
+    - A windowed rate over the last `window` seconds, kept in a fixed ring of time slots.
+
+Classes:
+    ThroughputMeter:
+        Measures the throughput of a stream of byte counts.
+
+Since:
+    1.6.0
+"""
+from math import exp
+from threading import Lock
+from time import monotonic
+from typing import Callable, Optional, Union
+
+from inspyre_toolbox.conversions.bytes import get_lowest_unit_size
+
+
+class ThroughputMeter:
+    """
+    Measure the throughput of a stream of byte counts.
+
+    Call :meth:`update` with the number of bytes processed each time a chunk is done. All methods are thread-safe.
+
+    Parameters:
+        total (Optional[int]):
+            The total number of bytes expected, if known. Needed for :attr:`remaining`, :attr:`eta` and
+            :meth:`eta_str`.
+
+        window (float):
+            The length of the window for :attr:`window_rate`, in seconds. Defaults to 10.
+
+        half_life (float):
+            The half-life of the moving average for :attr:`ewma_rate`, in seconds; the time it takes for an old
+            reading to carry half its weight. Defaults to 3.
+
+        slots (int):
+            The number of time slots the window is split into. More slots give a smoother windowed rate. Defaults
+            to 20.
+
+        clock (Callable[[], float]):
+            The clock to read time from, in seconds. Defaults to `time.monotonic`.
+
+    Example:
+        >>> meter = ThroughputMeter(total=len(data))
+        >>> for chunk in chunks:
+        ...     out.write(chunk)
+        ...     meter.update(len(chunk))
+        ...     print(f'{meter.rate_str()} | ETA {meter.eta_str()}')
+    """
+    def __init__(
+            self,
+            total: Optional[int] = None,
+            window: float = 10.0,
+            half_life: float = 3.0,
+            slots: int = 20,
+            clock: Callable[[], float] = monotonic
+            ):
+        if window <= 0 or half_life <= 0:
+            raise ValueError('window and half_life must be greater than 0.')
+
+        if slots < 1:
+            raise ValueError('slots must be at least 1.')
+
+        self.__lock = Lock()
+        self.__clock = clock
+
+        self.__total = total
+        self.__window = window
+        self.__slot_width = window / slots
+        self.__tau = half_life / 0.6931471805599453  # ln(2)
+
+        self.__slot_bytes = [0] * slots
+        self.__slot_ids = [-1] * slots
+
+        self.__started = clock()
+        self.__last = self.__started
+        self.__done = 0
+        self.__pending = 0
+        self.__ewma = None
+
+    def update(self, n: int) -> None:
+        """
+        Record that `n` more bytes have been processed.
+
+        Parameters:
+            n (int):
+                The number of bytes.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            now = self.__clock()
+            self.__done += n
+
+            slot_id = int(now / self.__slot_width)
+            slot = slot_id % len(self.__slot_ids)
+
+            if self.__slot_ids[slot] != slot_id:
+                self.__slot_ids[slot] = slot_id
+                self.__slot_bytes[slot] = 0
+
+            self.__slot_bytes[slot] += n
+
+            # Updates that land on the same clock tick are folded into the next reading, rather than dividing by zero.
+            self.__pending += n
+            elapsed = now - self.__last
+
+            if elapsed > 0:
+                rate = self.__pending / elapsed
+
+                if self.__ewma is None:
+                    self.__ewma = rate
+                else:
+                    self.__ewma += (1 - exp(-elapsed / self.__tau)) * (rate - self.__ewma)
+
+                self.__pending = 0
+                self.__last = now
+
+    def reset(self, total: Optional[int] = None) -> None:
+        """
+        Reset the meter, optionally with a new expected total.
+
+        Parameters:
+            total (Optional[int]):
+                The total number of bytes expected, if known.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__total = total
+            self.__slot_bytes = [0] * len(self.__slot_bytes)
+            self.__slot_ids = [-1] * len(self.__slot_ids)
+            self.__started = self.__clock()
+            self.__last = self.__started
+            self.__done = 0
+            self.__pending = 0
+            self.__ewma = None
+
+    @property
+    def done(self) -> int:
+        """The number of bytes processed so far."""
+        return self.__done
+
+    @property
+    def total(self) -> Optional[int]:
+        """The total number of bytes expected, or None if it isn't known."""
+        return self.__total
+
+    @total.setter
+    def total(self, new: Optional[int]):
+        with self.__lock:
+            self.__total = new
+
+    @property
+    def elapsed(self) -> float:
+        """The number of seconds since the meter was started (or reset)."""
+        return self.__clock() - self.__started
+
+    @property
+    def average_rate(self) -> float:
+        """The average rate since the meter was started, in bytes per second."""
+        with self.__lock:
+            elapsed = self.__clock() - self.__started
+            return self.__done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def ewma_rate(self) -> float:
+        """The exponentially weighted moving average of the rate, in bytes per second."""
+        with self.__lock:
+            return self.__ewma or 0.0
+
+    @property
+    def window_rate(self) -> float:
+        """The rate over the last `window` seconds (or since the meter started, if sooner), in bytes per second."""
+        with self.__lock:
+            now = self.__clock()
+            current = int(now / self.__slot_width)
+            oldest = current - len(self.__slot_ids) + 1
+
+            window_bytes = sum(
+                    n for n, slot_id in zip(self.__slot_bytes, self.__slot_ids) if oldest <= slot_id <= current
+                    )
+
+            span = min(self.__window, now - self.__started)
+
+        return window_bytes / span if span > 0 else 0.0
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """The number of bytes left to process, or None if the total isn't known."""
+        if self.__total is None:
+            return None
+
+        return max(self.__total - self.__done, 0)
+
+    @property
+    def eta(self) -> Optional[float]:
+        """
+        The estimated number of seconds until the total is reached, based on the moving average rate.
+
+        None if the total isn't known, or no rate has been measured yet.
+        """
+        remaining = self.remaining
+
+        if remaining is None:
+            return None
+
+        if remaining == 0:
+            return 0.0
+
+        rate = self.ewma_rate
+
+        return remaining / rate if rate > 0 else None
+
+    def rate_str(self, windowed: bool = False, binary: bool = False, precision: int = 2) -> str:
+        """
+        Get the rate as a human-readable string, e.g. '12.34 MB/s'.
+
+        Parameters:
+            windowed (bool):
+                A flag indicating whether to report the windowed rate instead of the moving average. Defaults to
+                False.
+
+            binary (bool):
+                A flag indicating whether to use IEC units (KiB/s, MiB/s, ...). Defaults to False.
+
+            precision (int):
+                The number of decimal places. Defaults to 2.
+
+        Returns:
+            str:
+                The rate.
+        """
+        return humanize_rate(self.window_rate if windowed else self.ewma_rate, binary=binary, precision=precision)
+
+    def eta_str(self, unknown: str = '--:--:--') -> str:
+        """
+        Get the estimated time remaining in HH:MM:SS format.
+
+        Parameters:
+            unknown (str):
+                What to return if the ETA can't be estimated. Defaults to '--:--:--'.
+
+        Returns:
+            str:
+                The estimated time remaining.
+        """
+        eta = self.eta
+
+        if eta is None:
+            return unknown
+
+        # Formatted here, rather than with `live_timer.format_seconds_to_hhmmss`, so the conversions don't import the
+        # timers.
+        minutes, seconds = divmod(int(eta), 60)
+        hours, minutes = divmod(minutes, 60)
+
+        return f'{hours:02d}:{minutes:02d}:{seconds:02d}'
+
+    def __repr__(self):
+        return (
+                f'<ThroughputMeter@{hex(id(self))}: {self.__done} bytes done | '
+                f'{self.rate_str()} | ETA {self.eta_str()}>'
+        )
+
+
+def humanize_rate(rate: Union[int, float], binary: bool = False, precision: int = 2) -> str:
+    """
+    Format a rate in bytes per second as a human-readable string.
+
+    Parameters:
+        rate (Union[int, float]):
+            The rate, in bytes per second.
+
+        binary (bool):
+            A flag indicating whether to use IEC units (KiB/s, MiB/s, ...). Defaults to False.
+
+        precision (int):
+            The number of decimal places. Defaults to 2.
+
+    Returns:
+        str:
+            The rate.
+
+    Example:
+        >>> humanize_rate(1500000)
+        '1.50 MB/s'
+    """
+    value, unit = get_lowest_unit_size(rate, binary=binary, abbreviate=True)
+
+    return f'{value:.{precision}f} {unit}/s'
+
+
+__all__ = [
+    'ThroughputMeter',
+    'humanize_rate',
+    ]
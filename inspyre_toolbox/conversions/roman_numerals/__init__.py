@@ -1,4 +1,6 @@
+import re
 from collections import OrderedDict
+from typing import Iterable, List
 
 from inspyre_toolbox.conversions.roman_numerals.errors import InvalidRomanNumeralStringError
 from inspyre_toolbox.core_helpers.logging import ROOT_ISL_DEVICE, add_isl_child
@@ -44,36 +46,215 @@ ROMAN_NUMERALS = OrderedDict(
 """
 
 
-def validate_roman_numeral_str(roman_numeral: str):
+MAX_ROMAN_NUMERAL = 3999
+""" The largest number that can be written in standard Roman numerals. """
+
+ROMAN_NUMERAL_PATTERN = re.compile(r'M{0,3}(?:CM|CD|D?C{0,3})(?:XC|XL|L?X{0,3})(?:IX|IV|V?I{0,3})')
+"""
+A compiled pattern that only fully matches standard (subtractive, upper-case) Roman numerals, from 'I' to 'MMMCMXCIX'.
+Note that it also matches the empty string.
+"""
+
+_ROMAN_DIGITS = (
+        ('', 'I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX'),
+        ('', 'X', 'XX', 'XXX', 'XL', 'L', 'LX', 'LXX', 'LXXX', 'XC'),
+        ('', 'C', 'CC', 'CCC', 'CD', 'D', 'DC', 'DCC', 'DCCC', 'CM'),
+        ('', 'M', 'MM', 'MMM'),
+)
+
+# Every standard numeral from 1 to MAX_ROMAN_NUMERAL, indexed by its value (index 0 is unused), and the reverse.
+_INT_TO_ROMAN = tuple(
+        f'{_ROMAN_DIGITS[3][n // 1000]}{_ROMAN_DIGITS[2][n // 100 % 10]}'
+        f'{_ROMAN_DIGITS[1][n // 10 % 10]}{_ROMAN_DIGITS[0][n % 10]}'
+        for n in range(MAX_ROMAN_NUMERAL + 1)
+)
+
+_ROMAN_TO_INT = {numeral: n for n, numeral in enumerate(_INT_TO_ROMAN) if n}
+
+
+def validate_roman_numeral_str(roman_numeral: str, strict: bool = False):
     """
     The 'validate_roman_numeral_str' function checks to see if the parameter 'roman_numeral' is a string.
     If it is, then each character in the string will be checked against 'ROMAN_NUMERALS'. If any characters are not
-    found in :ref:`rn_constant`, an :class:`InvalidRomanNumeralStringError` exception will be raised
+    found in :ref:`rn_constant`, the string isn't valid.
 
     Args:
         roman_numeral:str: Pass the roman numeral string to be validated
 
+        strict (bool):
+            Only accept standard numerals (e.g. 'IV', but not 'IIII'), using :data:`ROMAN_NUMERAL_PATTERN`. (Optional;
+            defaults to False)
+
     Returns:
         True if the roman_numeral is a valid roman numeral string
     """
-    log_device = ROOT_ISL_DEVICE.get_child(f'{LOG_NAME}.validate_roman_numeral_str')
-    log = log_device.logger
+    if not isinstance(roman_numeral, str):
+        LOG.error(f"The parameter 'roman_numeral' for 'validate_roman_numeral_str' must be of type 'str' "
+                  f"not {type(roman_numeral)}'")
+        return False
+
+    if strict:
+        valid = bool(roman_numeral) and ROMAN_NUMERAL_PATTERN.fullmatch(roman_numeral) is not None
+    else:
+        valid = all(char in ROMAN_NUMERALS for char in roman_numeral)
+
+    if not valid:
+        LOG.error(InvalidRomanNumeralStringError(roman_numeral).message)
+
+    return valid
+
+
+def _parse_lenient(numeral: str) -> int:
+    """Add up a numeral's values, taking subtractive pairs where they appear, without checking its form."""
+    num = 0
+    i = 0
+    length = len(numeral)
+
+    while i < length:
+        pair = numeral[i:i + 2]
+
+        if len(pair) == 2 and pair in ROMAN_NUMERALS:
+            num += ROMAN_NUMERALS[pair]
+            i += 2
+        else:
+            try:
+                num += ROMAN_NUMERALS[numeral[i]]
+            except KeyError:
+                raise InvalidRomanNumeralStringError(numeral) from None
+
+            i += 1
+
+    return num
+
+
+def to_roman(number: int) -> str:
+    """
+    Convert an integer to a (standard) Roman numeral.
+
+    Args:
+        number (int):
+            The number to convert, from 1 to :data:`MAX_ROMAN_NUMERAL`.
+
+    Returns:
+        str:
+            The Roman numeral, e.g. 'MCMXCIV' for 1994.
+
+    Raises:
+        TypeError:
+            If `number` isn't an integer.
+
+        ValueError:
+            If `number` is out of range.
+    """
+    if not isinstance(number, int) or isinstance(number, bool):
+        raise TypeError(f'Parameter value for "number" must be of type "int" not "{type(number)}"')
+
+    if not 0 < number <= MAX_ROMAN_NUMERAL:
+        raise ValueError(f'Only numbers from 1 to {MAX_ROMAN_NUMERAL} can be written as Roman numerals, not {number}.')
+
+    return _INT_TO_ROMAN[number]
+
+
+def from_roman(roman_numeral: str, strict: bool = True) -> int:
+    """
+    Convert a Roman numeral to an integer.
+
+    Args:
+        roman_numeral (str):
+            The Roman numeral. Case is ignored.
+
+        strict (bool):
+            Only accept standard numerals (see :data:`ROMAN_NUMERAL_PATTERN`). If False, any string of Roman numeral
+            characters is added up, as :attr:`RomanNumeral.as_int` does (so 'IIII' is 4). (Optional; defaults to True)
+
+    Returns:
+        int:
+            The value of the numeral.
+
+    Raises:
+        TypeError:
+            If `roman_numeral` isn't a string.
+
+        InvalidRomanNumeralStringError:
+            If `roman_numeral` isn't a valid numeral.
+    """
+    if not isinstance(roman_numeral, str):
+        raise TypeError(f'Parameter value for "roman_numeral" must be of type "str" not "{type(roman_numeral)}"')
+
+    numeral = roman_numeral.upper()
 
     try:
-        if not isinstance(roman_numeral, str):
-            raise TypeError(f"The parameter 'roman_numeral' for 'validate_roman_numeral_str' must be of type 'str' "
-                            f"not {type(roman_numeral)}'")
-
-        for char in list(roman_numeral):
-            if char not in ROMAN_NUMERALS:
-                raise InvalidRomanNumeralStringError(roman_numeral, skip_print=True)
-    except TypeError as e:
-        log.error(e)
-        return False
-    except InvalidRomanNumeralStringError as e:
-        log.error(e)
-        return False
-    return True
+        return _ROMAN_TO_INT[numeral]
+    except KeyError:
+        if strict or not numeral:
+            raise InvalidRomanNumeralStringError(roman_numeral) from None
+
+    return _parse_lenient(numeral)
+
+
+def to_roman_many(numbers: Iterable[int]) -> List[str]:
+    """
+    Convert many integers to Roman numerals.
+
+    Args:
+        numbers (Iterable[int]):
+            The numbers to convert, each from 1 to :data:`MAX_ROMAN_NUMERAL`.
+
+    Returns:
+        List[str]:
+            The Roman numerals, in the same order.
+
+    Raises:
+        TypeError:
+            If any of the numbers isn't an integer.
+
+        ValueError:
+            If any of the numbers is out of range.
+    """
+    table = _INT_TO_ROMAN
+    numerals = []
+
+    for number in numbers:
+        if type(number) is int and 0 < number <= MAX_ROMAN_NUMERAL:
+            numerals.append(table[number])
+        else:
+            numerals.append(to_roman(number))  # Raises the appropriate error (or converts an int subclass).
+
+    return numerals
+
+
+def from_roman_many(roman_numerals: Iterable[str], strict: bool = True) -> List[int]:
+    """
+    Convert many Roman numerals to integers.
+
+    Args:
+        roman_numerals (Iterable[str]):
+            The Roman numerals. Case is ignored.
+
+        strict (bool):
+            Only accept standard numerals. (See :func:`from_roman`; optional, defaults to True)
+
+    Returns:
+        List[int]:
+            The values, in the same order.
+
+    Raises:
+        TypeError:
+            If any of the numerals isn't a string.
+
+        InvalidRomanNumeralStringError:
+            If any of the numerals isn't valid.
+    """
+    table = _ROMAN_TO_INT
+    numbers = []
+
+    for numeral in roman_numerals:
+        try:
+            numbers.append(table[numeral])
+        except (KeyError, TypeError):
+            numbers.append(from_roman(numeral, strict=strict))
+
+    return numbers
 
 
 class RomanNumeral(object):
@@ -126,19 +307,33 @@ class RomanNumeral(object):
 
     @property
     def as_int(self):
-        i = 0
-        num = 0
-        while i < len(self.formatted):
-            if i + 1 < len(self.formatted) and self.formatted[i:i + 2] in ROMAN_NUMERALS:
-                num += ROMAN_NUMERALS[self.formatted[i:i + 2]]
-                i += 2
-            else:
-                num += ROMAN_NUMERALS[self.formatted[i]]
-                i += 1
-        self.__integer = num
+        formatted = self.formatted
+
+        try:
+            self.__integer = _ROMAN_TO_INT[formatted]
+        except KeyError:
+            self.__integer = _parse_lenient(formatted)
 
         return self.__integer
 
+    @classmethod
+    def from_int(cls, number: int, noun: str = None):
+        """
+        Create a RomanNumeral from an integer.
+
+        Args:
+            number (int):
+                The number, from 1 to :data:`MAX_ROMAN_NUMERAL`.
+
+            noun (str):
+                Specify a noun for the roman numeral. (Optional, defaults to NoneType)
+
+        Returns:
+            RomanNumeral:
+                The new RomanNumeral.
+        """
+        return cls(to_roman(number), noun=noun)
+
 
 def roman_numeral_to_integer(roman_numeral: str, noun: str = None, return_object=False, commify: bool = False):
     """
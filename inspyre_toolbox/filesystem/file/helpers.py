@@ -2,7 +2,7 @@ import hashlib
 from pathlib import Path
 from typing import List, Optional, Union
 
-from inspyre_toolbox.conversions.bytes import ByteConverter
+from inspyre_toolbox.conversions.bytes import get_lowest_unit_size
 from inspyre_toolbox.path_man import provision_path
 
 
@@ -72,47 +72,6 @@ def get_file_checksum(file_path, algorithm='sha256'):
     return hash_func.hexdigest()
 
 
-def get_lowest_unit_size(size: int) -> tuple[Union[int, float], str]:
-    """
-    Get the lowest unit size for a given size.
-
-    Parameters:
-        size (int):
-            The size to convert.
-
-    Returns:
-        tuple[Union[int, float], str]:
-            The converted size and the unit.
-
-    Examples:
-        >>> get_lowest_unit_size(1024)
-        (1.0, 'KB')
-        >>> get_lowest_unit_size(1024 * 1024)
-        (1.0, 'MB')
-        >>> get_lowest_unit_size(1024 * 1024 * 1024)
-        (1.0, 'GB')
-        >>> get_lowest_unit_size(1024 * 1024 * 1024 * 1024)
-        (1.0, 'TB')
-        >>> get_lowest_unit_size(1024 * 1024 * 1024 * 1024 * 1024)
-        (1.0, 'PB')
-        >>> get_lowest_unit_size(1024 * 1024 * 1024 * 1024 * 1024 * 1024)
-        (1.0, 'EB')
-        >>> get_lowest_unit_size(1024 * 1024 * 1024 * 1024 * 1024 * 1024 * 1024)
-        (1.0, 'ZB')
-        >>> get_lowest_unit_size(1024 * 1024 * 1024 * 1024 * 1024 * 1024 * 1024 * 1024)
-        (1.0, 'YB')
-    """
-    units = ['byte', 'kilobyte', 'megabyte', 'gigabyte', 'terabyte', 'petabyte', 'exabyte', 'zetabyte', 'yottabyte']
-    units.reverse()
-    converter = ByteConverter(size, 'byte')
-
-    for unit in units:
-        converted = converter.convert(unit.lower())
-
-        if converted >= 1:
-            return converted, unit.upper(),
-
-
 def get_file_object(file_path, skip_path_provision=False):
     """
     Get a file object for the specified file path.
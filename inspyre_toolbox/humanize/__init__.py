@@ -8,19 +8,102 @@ Created on Wed Jun  9 01:23:36 2021
 
 import typing
 from decimal import Decimal
+from functools import lru_cache
+from math import isfinite
+from threading import Lock
 from typing import Callable, ContextManager, Optional, Union
 
-from inflect import engine
-
 from inspyre_toolbox.core_helpers.logging import ROOT_ISL_DEVICE
 from inspyre_toolbox.humanize.errors import HumanizeErrors
 
-# Instantiate inflect.engine as 'INF'
-INF = engine()
+# The inflect engine (available as 'INF') is slow to import, so it's only created when something is pluralized. See
+# `get_engine`.
+_ENGINE = None
+
+_ENGINE_LOCK = Lock()
 
 NUM_ERR = HumanizeErrors.NumericalErrors
 
 
+def get_engine():
+    """
+
+    Return the shared `inflect.engine`, importing inflect and creating it on first use.
+
+    The engine is also available as `inspyre_toolbox.humanize.INF`.
+
+    Returns:
+        inflect.engine:
+            The shared engine.
+
+    """
+    global _ENGINE
+
+    if _ENGINE is None:
+        with _ENGINE_LOCK:
+            if _ENGINE is None:
+                from inflect import engine
+
+                _ENGINE = engine()
+
+    return _ENGINE
+
+
+def __getattr__(name):
+    if name == 'INF':
+        return get_engine()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+PLURAL_CACHE_SIZE = 4096
+""" The number of (noun, count-class) pluralizations kept by `plural_noun`. """
+
+
+@lru_cache(maxsize=PLURAL_CACHE_SIZE)
+def _plural_noun_for_count_class(noun: str, count_class: Union[int, str]) -> str:
+    return get_engine().plural_noun(noun, count_class)
+
+
+def plural_noun(noun: str, count: Optional[Union[int, float, str]] = None) -> str:
+    """
+
+    Return `noun`, pluralized for `count`, as `inflect.engine().plural_noun` would.
+
+    Inflect only cares whether a count is 'one' or not, so results are cached by the noun and that count-class; each
+    noun is only pluralized once however many different counts it's used with.
+
+    Note:
+        If you change inflect's settings on `INF` (e.g. `INF.classical()` or `INF.defnoun()`), call
+        `clear_plural_cache` afterwards.
+
+    Parameters:
+        noun (str):
+            The noun to pluralize.
+
+        count (Optional[Union[int, float, str]]):
+            The number of 'noun'. If None, the plural is returned.
+
+    Returns:
+        str:
+            The noun, pluralized if `count` calls for it.
+
+    """
+    return _plural_noun_for_count_class(noun, get_engine().get_count(count))
+
+
+def clear_plural_cache():
+    """
+
+    Clear the cache of pluralized nouns used by `plural_noun` (and so `Numerical.count_noun`).
+
+    Returns:
+        None
+
+    """
+    _plural_noun_for_count_class.cache_clear()
+
+
 class NumericalStrings(object):
     """
 
@@ -69,9 +152,279 @@ class NumericalStrings(object):
             "",
             "Thousand",
             "Million",
-            "Billion"
+            "Billion",
+            "Trillion",
+            "Quadrillion",
+            "Quintillion",
+            "Sextillion",
+            "Septillion",
+            "Octillion",
+            "Nonillion",
+            "Decillion",
+            "Undecillion",
+            "Duodecillion",
+            "Tredecillion",
+            "Quattuordecillion",
+            "Quindecillion",
+            "Sexdecillion",
+            "Septendecillion",
+            "Octodecillion",
+            "Novemdecillion",
+            "Vigintillion",
     ]
-    """ Contains thousand, million, and billion strings """
+    """ Contains the names of each power of one thousand, from thousand up to vigintillion (10^63) """
+
+
+# Lower-cased lookup tables for `number_to_words`, built once from the ones above.
+_UNIT_WORDS = tuple(word.lower() for word in NumericalStrings.less_than_20)
+
+_TENS_WORDS = tuple(word.lower() for word in NumericalStrings.tens)
+
+_MAGNITUDE_WORDS = tuple(word.lower() for word in NumericalStrings.thousands)
+
+_DIGIT_WORDS = {str(digit): _UNIT_WORDS[digit] or 'zero' for digit in range(10)}
+
+
+def _below_hundred_words(number: int) -> str:
+    if number < 20:
+        return _UNIT_WORDS[number]
+
+    tens, units = divmod(number, 10)
+
+    return f'{_TENS_WORDS[tens]}-{_UNIT_WORDS[units]}' if units else _TENS_WORDS[tens]
+
+
+def _below_thousand_words(number: int) -> str:
+    hundreds, rest = divmod(number, 100)
+
+    if not hundreds:
+        return _below_hundred_words(rest)
+
+    return f'{_UNIT_WORDS[hundreds]} hundred and {_below_hundred_words(rest)}' if rest else \
+        f'{_UNIT_WORDS[hundreds]} hundred'
+
+
+# The words for every group of three digits (0 is an empty string), so each group is a single lookup.
+_GROUP_WORDS = tuple(_below_thousand_words(number) for number in range(1000))
+
+MAX_WORDS_NUMBER = 1000 ** len(_MAGNITUDE_WORDS) - 1
+""" The largest number (in magnitude) that `number_to_words` can spell out. """
+
+
+def _integer_to_words(number: int) -> str:
+    if number < 1000:
+        return _GROUP_WORDS[number] or 'zero'
+
+    if number > MAX_WORDS_NUMBER:
+        raise ValueError(f'Numbers larger than {MAX_WORDS_NUMBER:,} can not be converted to words.')
+
+    groups = []
+    magnitude = 0
+    lowest_magnitude = None
+
+    while number:
+        number, group = divmod(number, 1000)
+
+        if group:
+            groups.append(f'{_GROUP_WORDS[group]} {_MAGNITUDE_WORDS[magnitude]}' if magnitude else _GROUP_WORDS[group])
+
+            if lowest_magnitude is None:
+                lowest_magnitude = magnitude
+
+        magnitude += 1
+
+    groups.reverse()
+
+    # As inflect does; a final group of units with no hundreds is joined with 'and' rather than a comma.
+    if len(groups) > 1 and lowest_magnitude == 0 and ' ' not in groups[-1]:
+        return f"{', '.join(groups[:-1])} and {groups[-1]}"
+
+    return ', '.join(groups)
+
+
+def number_to_words(number: Union[int, float]) -> str:
+    """
+
+    Return `number` written out in words, as `inflect.engine().number_to_words(str(number))` would.
+
+    This is table-driven, and many times faster than inflect. Unlike inflect, it handles numbers up to
+    `MAX_WORDS_NUMBER` (vigintillions), and spells out floats that Python writes in scientific notation (e.g. 1e+20)
+    rather than garbling them.
+
+    Parameters:
+        number (Union[int, float]):
+            The number to write out.
+
+    Returns:
+        str:
+            The number in words, e.g. 'one thousand, two hundred and thirty-four point five'.
+
+    Raises:
+        ValueError:
+            If `number` is not an integer or a finite float, or is too large.
+
+    Example:
+        >>> number_to_words(1000001)
+        'one million and one'
+        >>> number_to_words(-12.05)
+        'minus twelve point zero five'
+
+    """
+    if isinstance(number, int) and not isinstance(number, bool):
+        if number < 0:
+            return f'minus {_integer_to_words(-number)}'
+
+        return _integer_to_words(number)
+
+    if not isinstance(number, float) or not isfinite(number):
+        raise ValueError("The parameter 'number' needs to be an integer or a finite float")
+
+    text = repr(number)
+
+    if 'e' in text:
+        text = format(Decimal(text), 'f')
+
+        if '.' not in text:
+            text += '.0'
+
+    sign = ''
+
+    if text[0] == '-':
+        sign = 'minus '
+        text = text[1:]
+
+    integer, _, fraction = text.partition('.')
+
+    return f"{sign}{_integer_to_words(int(integer))} point {' '.join([_DIGIT_WORDS[digit] for digit in fraction])}"
+
+
+def _emit(lines: list, stream: Optional[typing.TextIO], end: str) -> Optional[list]:
+    if stream is None:
+        return lines
+
+    stream.write(''.join([f'{line}{end}' for line in lines]))
+
+
+def count_nouns(
+        values: typing.Iterable[Union[int, float]],
+        noun: str,
+        only_noun: bool = False,
+        skip_commify: bool = False,
+        capitalize: bool = False,
+        to_words: bool = False,
+        full_stop: bool = False,
+        period: bool = False,
+        round_num: Optional[int] = None,
+        as_int: bool = False,
+        stream: Optional[typing.TextIO] = None,
+        end: str = '\n'
+) -> Optional[typing.List[str]]:
+    """
+
+    Count `noun` for many values at once; the batch version of `Numerical.count_noun`.
+
+    Each statement is the same as `Numerical(value, noun).count_noun(**opts)` would return, but no `Numerical` objects
+    are built, and the noun is only pluralized once for 'one' and once for 'many'.
+
+    Parameters:
+        values (Iterable[Union[int, float]]):
+            The counts.
+
+        noun (str):
+            The thing being counted.
+
+        only_noun, skip_commify, capitalize, to_words, full_stop, period, round_num, as_int:
+            As for `Numerical.count_noun`.
+
+        stream (Optional[TextIO]):
+            A stream to write the statements to (e.g. `sys.stdout`), instead of returning them. Defaults to None.
+
+        end (str):
+            What to write after each statement, if writing to `stream`. Defaults to a newline.
+
+    Returns:
+        Optional[List[str]]:
+            The statements, or None if they were written to `stream`.
+
+    Raises:
+        ValueError:
+            Raised when a value is provided for 'noun' that is not a string.
+
+    Example:
+        >>> count_nouns([1, 2, 1500], 'file')
+        ['1 file', '2 files', '1,500 files']
+
+    """
+    if not isinstance(noun, str):
+        raise ValueError("Noun must be of type: str")
+
+    get_count = get_engine().get_count
+    forms = {}
+    suffix = '.' if full_stop or period else ''
+    round_num = round_num if isinstance(round_num, int) else None
+
+    lines = []
+
+    for count in values:
+        if as_int:
+            count = int(count)
+
+        if round_num is not None:
+            count = round(count, round_num)
+
+        count_class = get_count(count)
+
+        try:
+            n_noun = forms[count_class]
+        except KeyError:
+            n_noun = forms[count_class] = plural_noun(noun, count)
+
+        if only_noun:
+            statement = n_noun
+        elif to_words:
+            statement = f'{number_to_words(count)} {n_noun}'
+        elif skip_commify:
+            statement = f'{count} {n_noun}'
+        else:
+            statement = f'{count:,} {n_noun}'
+
+        if capitalize:
+            statement = statement.capitalize()
+
+        lines.append(statement + suffix)
+
+    return _emit(lines, stream, end)
+
+
+def commify_many(
+        values: typing.Iterable[Union[int, float]],
+        stream: Optional[typing.TextIO] = None,
+        end: str = '\n'
+) -> Optional[typing.List[str]]:
+    """
+
+    Add commas to many numbers at once; the batch version of `Numerical.commify`.
+
+    Parameters:
+        values (Iterable[Union[int, float]]):
+            The numbers.
+
+        stream (Optional[TextIO]):
+            A stream to write the numbers to, instead of returning them. Defaults to None.
+
+        end (str):
+            What to write after each number, if writing to `stream`. Defaults to a newline.
+
+    Returns:
+        Optional[List[str]]:
+            The commified numbers, or None if they were written to `stream`.
+
+    Example:
+        >>> commify_many([1000, 1234567.5])
+        ['1,000', '1,234,567.5']
+
+    """
+    return _emit([f'{value:,}' for value in values], stream, end)
 
 
 class Numerical(object):
@@ -119,8 +472,25 @@ class Numerical(object):
 
         self.log_name = 'Inspyre-Toolbox.humanize.Numerical'
 
-        self.cls_logger = ROOT_ISL_DEVICE.get_child(self.log_name)
-        self.cls_logger.debug(f"Started logger: {self.log_name}")
+        # The logger is only set up when something is logged (see `cls_logger`); constructing a `Numerical` (which is
+        # often done once per log line) shouldn't itself log.
+        self.__cls_logger = None
+
+    @property
+    def cls_logger(self):
+        """
+
+        The logger for this instance, created on first use.
+
+        """
+        if self.__cls_logger is None:
+            self.__cls_logger = ROOT_ISL_DEVICE.get_child(self.log_name)
+
+        return self.__cls_logger
+
+    @cls_logger.setter
+    def cls_logger(self, new):
+        self.__cls_logger = new
 
     def count_noun(
             self,
@@ -400,7 +770,6 @@ class Numerical(object):
 
         """
         # Make sure our noun is a string or raise ValueError
-        log = ROOT_ISL_DEVICE.get_child(__name__)
         if not isinstance(noun, str):
             raise ValueError("Noun must be of type: str")
 
@@ -417,8 +786,8 @@ class Numerical(object):
         if round_num is not None and isinstance(round_num, int):
             count = round(count, round_num)
 
-        # Pluralize the noun string
-        n_noun = INF.plural_noun(noun, count)
+        # Pluralize the noun string (cached; see `plural_noun`)
+        n_noun = plural_noun(noun, count)
 
         # If the parameter 'to_words' is true, we need to convert the number to words (using the
         # 'to_words' function of this class before we finally concatenate our results.
@@ -475,9 +844,9 @@ class Numerical(object):
     def to_words(self, target_num=None):
         """
 
-        An alias to inflect.engine().number_to_words()
+        Return a number written out in words.
 
-        Literally just passes 'target_num' to INF.number_to_words and returns the result of that
+        Gives the same result as inflect.engine().number_to_words(), but faster. (See `number_to_words`)
 
         Parameters:
             target_num (int, optional): The number you'd like returned in word-form. Defaults to `Numerical.number`.
@@ -494,7 +863,7 @@ class Numerical(object):
             target_num = self.number
 
         if isinstance(target_num, (int, float)):
-            return INF.number_to_words(str(target_num))
+            return number_to_words(target_num)
         else:
             raise ValueError(
                     "The parameter 'target_num' needs to be an integer or a float"
@@ -5,7 +5,12 @@ Created: ??
 Description:
     inspyre_toolbox.live_timer gives you access to a class and functions that make running a live
     timer that's not only easily to initialize, but easy to query, reset, and pause your timers.
-    This module also contains a class named 'TimerHistory' that keeps a history of all timer actions.
+    This module also contains a class named 'TimerHistory' that keeps a history of all timer actions (which
+    'HistorySink' and 'load_history' stream to and from disk), a lightweight 'Stopwatch' for timing hot code paths,
+    a rate-limited live terminal display ('LiveTimerDisplay', or 'Timer.live'), and a registry of named timers
+    ('timed', 'REGISTRY') that records latency histograms and reports percentiles ('MetricsExporter' exports them,
+    and other counters, in the OpenMetrics text format). Timers may be shared between threads, and the timings of
+    several processes can be combined with 'send_timings' and 'collect_timings'.
 
     To find out more about usage please see:
 
@@ -13,13 +18,21 @@ Description:
 
 """
 
-from time import time
+from threading import RLock
 
 from inspy_logger import Loggable
 
 from inspyre_toolbox.core_helpers.logging import add_isl_child
+from inspyre_toolbox.live_timer.aggregate import collect_timings, send_timings
+from inspyre_toolbox.live_timer.clock import DEFAULT_CLOCK, NS_PER_SECOND, WALL_CLOCK, ns_to_seconds, seconds_to_ns
+from inspyre_toolbox.live_timer.display import LiveTimerDisplay
 from inspyre_toolbox.live_timer.errors import TimerNotRunningError, TimerNotStartedError
-from inspyre_toolbox.live_timer.history import TimerHistory
+from inspyre_toolbox.live_timer.history import DEFAULT_CAPACITY as DEFAULT_HISTORY_CAPACITY, TimerHistory
+from inspyre_toolbox.live_timer.histogram import LatencyHistogram, ShardedHistogram
+from inspyre_toolbox.live_timer.openmetrics import MetricsExporter
+from inspyre_toolbox.live_timer.persistence import HistorySink, load_history
+from inspyre_toolbox.live_timer.registry import NamedTimer, REGISTRY, TimerRegistry, get_timer, timed
+from inspyre_toolbox.live_timer.stopwatch import Stopwatch
 
 LOG_NAME = 'live_timer'
 
@@ -62,11 +75,37 @@ class Timer(Loggable):
         start_info = f"Started at: {self.start_time}" if self.started else "Not Started"
         runtime_info = ""
         if self.started:
-            runtime = time() - self.start_time
+            runtime = ns_to_seconds(self.__clock() - self.__start_ns)
             runtime_info = f" | Runtime: {format_seconds_to_hhmmss(runtime)}"
         return f"Timer(Status: {status} | State: {state} | {start_info}{runtime_info})"
 
-    def __init__(self, auto_start=False, history=None):
+    def __init__(self, auto_start=False, history=None, history_capacity=DEFAULT_HISTORY_CAPACITY,
+                 record_queries=True, clock=None, wall_clock=None):
+        """
+        Create a new timer.
+
+        Args:
+            auto_start (bool):
+                Start the timer straight away. (Optional; defaults to False)
+
+            history (TimerHistory):
+                An existing history to add this timer's actions to. (Optional; a new one is created by default)
+
+            history_capacity (int):
+                The number of actions a new history keeps; None keeps every action. Ignored if 'history' is
+                passed. (Optional; defaults to 1024)
+
+            record_queries (bool):
+                Whether a new history keeps an entry each time the elapsed time is queried. They're counted either
+                way. Ignored if 'history' is passed. (Optional; defaults to True)
+
+            clock (Callable[[], int]):
+                The monotonic clock, returning integer nanoseconds, to measure elapsed time with. (Optional; defaults
+                to time.perf_counter_ns. See :mod:`inspyre_toolbox.live_timer.clock`)
+
+            wall_clock (Callable[[], float]):
+                The clock to record the start time with, for display only. (Optional; defaults to time.time)
+        """
         super().__init__(parent_log_device=LOG)
 
         self.log = self.class_logger
@@ -78,22 +117,39 @@ class Timer(Loggable):
 
         # Define some default attribute values
 
+        # Elapsed time is kept in integer nanoseconds of `clock`; the wall clock is only used for `start_time`.
+        self.__clock = clock or DEFAULT_CLOCK
+        self.__wall_clock = wall_clock or WALL_CLOCK
+
+        # Guards the timer's state, so a timer can be started, paused, stopped and read from several threads. It's
+        # re-entrant, as reading the elapsed time happens inside other actions.
+        self.__lock = RLock()
+
         self.running = False
-        self.mark_2 = None
-        self.pause_end = None
-        self.pause_start = time()
+        self.__mark_ns = None
+        self.__pause_end_ns = None
+        self.__pause_start_ns = self.__clock()
         self.paused = False
+        self.__start_ns = None
         self.start_time = None
         self.started = False
 
         self.stopped = False
-        self.total_pause_time = 0
+        self.__total_pause_ns = 0
         self.was_paused = False
 
         self.log.debug('Set up class attributes.')
 
         # Start a Timer history object to track times for resets
-        self.history = TimerHistory(self.__get_elapsed) if history is None else history
+        if history is None:
+            history = TimerHistory(
+                    capacity=history_capacity,
+                    record_queries=record_queries,
+                    clock=self.__clock,
+                    wall_clock=self.__wall_clock
+            )
+
+        self.history = history
 
         self.log.debug('Timer class instantiated!')
 
@@ -114,6 +170,91 @@ class Timer(Loggable):
     def elapsed(self):
         return self.get_elapsed(seconds=True)
 
+    @property
+    def elapsed_ns(self) -> int:
+        """
+        The time elapsed since the timer was started, less any time spent paused, in integer nanoseconds.
+
+        Unlike `elapsed`, this doesn't add a 'QUERY' entry to the history.
+        """
+        with self.__lock:
+            if not self.started:
+                raise TimerNotStartedError(skip_print=True)
+
+            return self.__elapsed_ns()
+
+    @property
+    def clock(self):
+        """
+        The monotonic clock (returning nanoseconds) the timer measures elapsed time with.
+        """
+        return self.__clock
+
+    @property
+    def mark_2(self):
+        """
+        The reading of the timer's clock, in seconds, when the elapsed time was last measured (or the timer stopped).
+        """
+        return None if self.__mark_ns is None else ns_to_seconds(self.__mark_ns)
+
+    @mark_2.setter
+    def mark_2(self, new):
+        with self.__lock:
+            self.__mark_ns = None if new is None else seconds_to_ns(new)
+
+    @property
+    def pause_start(self):
+        """
+        The reading of the timer's clock, in seconds, when the timer was last paused.
+        """
+        return ns_to_seconds(self.__pause_start_ns)
+
+    @pause_start.setter
+    def pause_start(self, new):
+        with self.__lock:
+            self.__pause_start_ns = seconds_to_ns(new)
+
+    @property
+    def pause_end(self):
+        """
+        The reading of the timer's clock, in seconds, when the timer was last unpaused.
+        """
+        return None if self.__pause_end_ns is None else ns_to_seconds(self.__pause_end_ns)
+
+    @pause_end.setter
+    def pause_end(self, new):
+        with self.__lock:
+            self.__pause_end_ns = None if new is None else seconds_to_ns(new)
+
+    @property
+    def total_pause_time(self) -> float:
+        """
+        The total number of seconds the timer has spent paused (not counting a pause still in progress).
+        """
+        return ns_to_seconds(self.__total_pause_ns)
+
+    @total_pause_time.setter
+    def total_pause_time(self, new):
+        with self.__lock:
+            self.__total_pause_ns = seconds_to_ns(new)
+
+    def __elapsed_ns(self, origin_ns=None, sans_pause=False) -> int:
+        # If we were running but are now stopped, we will skip marking
+        if not self.stopped:
+            self.__mark_ns = self.__clock()
+
+        diff = self.__mark_ns - (self.__start_ns if origin_ns is None else origin_ns)
+
+        if sans_pause:
+            return diff
+
+        pause_ns = self.__total_pause_ns
+
+        if self.paused:
+            pause_ns += self.__mark_ns - self.__pause_start_ns
+
+        return diff - pause_ns
+
     @property
     def num_resets(self):
         return self.history.num_resets
@@ -130,7 +271,8 @@ class Timer(Loggable):
                 Access variables that belongs to the class
 
             ts (int|float):
-                Pass in the current timestamp, (Optional, defaults to time.time())
+                The reading of the timer's clock, in seconds, to measure from. (Optional, defaults to the time the
+                timer was started)
 
             sans_pause (bool):
                 Determine whether or not to include the time that the timer was
@@ -143,27 +285,13 @@ class Timer(Loggable):
         Returns:
             The time elapsed since the start of the timer
         """
-        log = self.create_child_logger()
-
-        diff_time = self.start_time if ts is None else ts
-
-        # ver1.2.7
-        # If we were running but are now stopped, we will skip marking
-        if not self.stopped:
-            self.mark_2 = time()
+        origin_ns = None if ts is None else int(ts * NS_PER_SECOND)
 
-        diff = self.mark_2 - diff_time
+        with self.__lock:
+            if sans_pause:
+                return format_seconds_to_hhmmss(ns_to_seconds(self.__elapsed_ns(origin_ns, sans_pause=True)))
 
-        if sans_pause:
-            return format_seconds_to_hhmmss(diff)
-
-        tpt = 0
-        # print(self.total_pause_time)
-        if self.paused:
-            tpt += time() - self.pause_start
-
-        tpt += self.total_pause_time
-        diff = diff - tpt
+            diff = ns_to_seconds(self.__elapsed_ns(origin_ns))
 
         return diff if seconds else format_seconds_to_hhmmss(diff)
 
@@ -182,14 +310,15 @@ class Timer(Loggable):
             The current elapsed time since the timer was started
 
         """
-        if not self.running and self.stopped or self.running:
-            self.history.add("QUERY")
-            return self.__get_elapsed(*args, **kwargs)
-        else:
-            try:
-                raise TimerNotStartedError(skip_print=True)
-            except TimerNotStartedError as e:
-                print(e.message)
+        with self.__lock:
+            if not self.running and self.stopped or self.running:
+                self.history.add("QUERY")
+                return self.__get_elapsed(*args, **kwargs)
+
+        try:
+            raise TimerNotStartedError(skip_print=True)
+        except TimerNotStartedError as e:
+            print(e.message)
 
     def reset(self):
         """
@@ -199,7 +328,7 @@ class Timer(Loggable):
         """
         self.history.add(action="RESET")
 
-        return Timer(history=self.history)
+        return Timer(history=self.history, clock=self.__clock, wall_clock=self.__wall_clock)
 
         # if self.running:
         #     self.stop()
@@ -208,6 +337,33 @@ class Timer(Loggable):
         # self.pause_end = None
         # self.started = False
 
+    def live(self, fps=4.0, label=None, **kwargs):
+        """
+        Get a live display of this timer's elapsed time, drawn in the terminal from a background thread.
+
+        The display reads the timer at no more than 'fps' frames a second and only redraws when the text shown
+        changes, so there's no need to poll 'get_elapsed' (which adds to the history) to show a running timer.
+
+        Args:
+            fps (float):
+                The most frames a second to draw. (Optional; defaults to 4)
+
+            label (str):
+                Text to show before the elapsed time. (Optional)
+
+            **kwargs:
+                Passed on to :class:`~inspyre_toolbox.live_timer.display.LiveTimerDisplay`.
+
+        Returns:
+            LiveTimerDisplay:
+                The display, not yet started. Use it as a context manager, or call its 'start' and 'stop' methods.
+
+        Example:
+            >>> with timer.live(label='Elapsed'):
+            ...     do_work()
+        """
+        return LiveTimerDisplay(self, fps=fps, label=label, **kwargs)
+
     def restart(self):
         """
         The restart function resets the timer to its original state and starts it running.
@@ -217,11 +373,13 @@ class Timer(Loggable):
         Returns:
             None
         """
-        self.reset()
-        if not self.started:
+        with self.__lock:
+            # Update the current instance instead of creating a new one, keeping its lock, as other threads may be
+            # waiting on it.
+            state = self.reset().__dict__
+            state.pop('_Timer__lock')
+            self.__dict__.update(state)
             self.start()
-        # Update the current instance instead of creating a new one
-        self.__dict__.update(Timer(history=self.history).__dict__)
 
     def start(self):
         """
@@ -229,10 +387,12 @@ class Timer(Loggable):
         Store the time the thread was started and assign the attribute 'self.started' to 'True' to indicate this.
 
         """
-        self.start_time = time()
-        self.started = True
-        self.history.add()
-        self.running = True
+        with self.__lock:
+            self.__start_ns = self.__clock()
+            self.start_time = self.__wall_clock()
+            self.started = True
+            self.history.add()
+            self.running = True
 
     def pause(self):
         """
@@ -250,16 +410,17 @@ class Timer(Loggable):
             This function also sets the 'self.paused' variable to 'True'.
 
         """
-        if not self.started:
-            raise TimerNotStartedError()
-        if not self.running:
-            raise TimerNotRunningError()
-        if self.paused:
-            return False
-        self.pause_start = time()
-        self.paused = True
-        self.was_paused = True
-        self.history.add("PAUSE")
+        with self.__lock:
+            if not self.started:
+                raise TimerNotStartedError()
+            if not self.running:
+                raise TimerNotRunningError()
+            if self.paused:
+                return False
+            self.__pause_start_ns = self.__clock()
+            self.paused = True
+            self.was_paused = True
+            self.history.add("PAUSE")
 
     def unpause(self):
         """
@@ -285,19 +446,19 @@ class Timer(Loggable):
                         The timer was no successfully un-paused (most likely due to its
                         state not actually being paused),
         """
-        if not self.started:
-            raise TimerNotStartedError()
-        if not self.running:
-            raise TimerNotRunningError()
-        if self.paused:
-            self.pause_end = time()
-            diff = self.pause_end - self.pause_start
-            self.total_pause_time += diff
-            self.paused = False
-            self.history.add("UNPAUSE")
-            return True
-        else:
-            return False
+        with self.__lock:
+            if not self.started:
+                raise TimerNotStartedError()
+            if not self.running:
+                raise TimerNotRunningError()
+            if self.paused:
+                self.__pause_end_ns = self.__clock()
+                self.__total_pause_ns += self.__pause_end_ns - self.__pause_start_ns
+                self.paused = False
+                self.history.add("UNPAUSE")
+                return True
+            else:
+                return False
 
     def stop(self):
         """
@@ -310,12 +471,13 @@ class Timer(Loggable):
         Returns:
             The time when the timer is stopped
         """
-        if not self.started:
-            raise TimerNotStartedError()
-        if self.running:
-            self.running = False
-            self.paused = False
-            self.stopped = True
-            self.mark_2 = time()
-        else:
-            raise TimerNotRunningError()
+        with self.__lock:
+            if not self.started:
+                raise TimerNotStartedError()
+            if self.running:
+                self.running = False
+                self.paused = False
+                self.stopped = True
+                self.__mark_ns = self.__clock()
+            else:
+                raise TimerNotRunningError()
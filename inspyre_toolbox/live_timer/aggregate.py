@@ -0,0 +1,111 @@
+"""
+
+Combine the timings of several processes.
+
+Each process has its own :data:`~inspyre_toolbox.live_timer.registry.REGISTRY`, so the timings a worker process records
+are lost when it exits unless they're sent back. Workers call :func:`send_timings` with a queue (e.g. a
+`multiprocessing.Queue`, or a `multiprocessing.Manager().Queue()` for pools) before they finish, and the parent calls
+:func:`collect_timings` to merge them into its own registry:
+
+    >>> from multiprocessing import Process, Queue
+    >>> from inspyre_toolbox.live_timer import REGISTRY, collect_timings, send_timings, timed
+    >>>
+    >>> def work(queue):
+    ...     for item in items:
+    ...         with timed('work.item'):
+    ...             process(item)
+    ...     send_timings(queue)
+    >>>
+    >>> queue = Queue()
+    >>> workers = [Process(target=work, args=(queue,)) for _ in range(4)]
+    >>> for worker in workers:
+    ...     worker.start()
+    >>> collect_timings(queue, expected=len(workers))
+    4
+    >>> REGISTRY.report()['work.item']['p99']
+
+Only the histograms' non-empty buckets are pickled, so a batch is small however many durations it holds.
+
+"""
+import os
+from queue import Empty
+from typing import Optional
+
+from inspyre_toolbox.live_timer.registry import REGISTRY, TimerRegistry
+
+
+def send_timings(queue, registry: Optional[TimerRegistry] = None, reset: bool = True) -> None:
+    """
+    Send a registry's timings to another process, through a queue.
+
+    Parameters:
+        queue:
+            The queue to put the timings on; anything with a `put` method, e.g. a `multiprocessing.Queue`.
+
+        registry (Optional[TimerRegistry]):
+            The registry to send the timings of. Defaults to the process-wide :data:`REGISTRY`.
+
+        reset (bool):
+            A flag indicating whether to forget the timings sent, so they aren't sent (and counted) twice if this is
+            called again. Each timer is read and cleared in one step (see :meth:`TimerRegistry.drain`), so durations
+            recorded meanwhile by other threads are kept for the next call. Defaults to True.
+
+    Returns:
+        None
+    """
+    registry = REGISTRY if registry is None else registry
+    histograms = registry.drain() if reset else registry.histograms()
+
+    queue.put((os.getpid(), histograms))
+
+
+def collect_timings(
+        queue,
+        registry: Optional[TimerRegistry] = None,
+        expected: Optional[int] = None,
+        timeout: Optional[float] = None
+) -> int:
+    """
+    Merge timings sent by other processes (see :func:`send_timings`) into a registry.
+
+    Parameters:
+        queue:
+            The queue the timings were sent on.
+
+        registry (Optional[TimerRegistry]):
+            The registry to merge the timings into. Defaults to the process-wide :data:`REGISTRY`.
+
+        expected (Optional[int]):
+            The number of batches to wait for (e.g. the number of workers). If None, only the batches already on the
+            queue are merged, without waiting.
+
+        timeout (Optional[float]):
+            The number of seconds to wait for each expected batch. None waits for as long as it takes.
+
+    Returns:
+        int:
+            The number of batches merged.
+
+    Raises:
+        queue.Empty:
+            If an expected batch didn't arrive in time. Any batches that did arrive have been merged.
+    """
+    registry = REGISTRY if registry is None else registry
+    merged = 0
+
+    while expected is None or merged < expected:
+        try:
+            if expected is None:
+                _, histograms = queue.get_nowait()
+            else:
+                _, histograms = queue.get(timeout=timeout)
+        except Empty:
+            if expected is None:
+                break
+
+            raise
+
+        registry.merge(histograms)
+        merged += 1
+
+    return merged
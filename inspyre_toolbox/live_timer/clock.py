@@ -0,0 +1,54 @@
+"""
+
+Clocks for inspyre_toolbox.live_timer.
+
+Timers measure elapsed time with a monotonic, nanosecond-resolution clock, which never jumps when the system time is
+adjusted (e.g. by NTP). The wall clock is only read to show when something happened.
+
+Any callable that takes no arguments and returns an integer number of nanoseconds can be used as a clock, which makes
+timers easy to test with a fake one.
+
+"""
+from time import perf_counter_ns, time
+from typing import Callable
+
+Clock = Callable[[], int]
+""" A callable that returns the current time, in (integer) nanoseconds. """
+
+NS_PER_SECOND = 1_000_000_000
+
+DEFAULT_CLOCK: Clock = perf_counter_ns
+""" The clock timers use for elapsed time by default. """
+
+WALL_CLOCK: Callable[[], float] = time
+""" The clock timers use to record when things happened (for display), in seconds since the epoch. """
+
+
+def ns_to_seconds(ns: int) -> float:
+    """
+    Convert a number of nanoseconds to seconds.
+
+    Args:
+        ns (int):
+            The number of nanoseconds.
+
+    Returns:
+        float:
+            The number of seconds.
+    """
+    return ns / NS_PER_SECOND
+
+
+def seconds_to_ns(seconds: float) -> int:
+    """
+    Convert a number of seconds to (integer) nanoseconds.
+
+    Args:
+        seconds (float):
+            The number of seconds.
+
+    Returns:
+        int:
+            The number of nanoseconds, rounded to the nearest one.
+    """
+    return round(seconds * NS_PER_SECOND)
@@ -0,0 +1,213 @@
+"""
+
+A rate-limited live display for timers.
+
+:class:`LiveTimerDisplay` redraws a timer's elapsed time in the terminal, using `rich.live`, from a background thread,
+at no more than `fps` frames a second. Each frame reads the timer's `elapsed_ns` (which adds nothing to its history)
+and formats it; the terminal is only redrawn when the formatted string has changed, so a display showing whole seconds
+redraws once a second, whatever its frame rate. The code being timed never touches the display.
+
+    >>> timer = Timer(auto_start=True)
+    >>>
+    >>> with LiveTimerDisplay(timer, label='Crunching'):
+    ...     crunch_numbers()
+
+"""
+from threading import Event, Lock, Thread
+from typing import Callable, Optional
+
+from rich.console import Console
+from rich.live import Live
+from rich.text import Text
+
+from inspyre_toolbox.live_timer.clock import ns_to_seconds
+from inspyre_toolbox.live_timer.errors import TimerNotStartedError
+
+DEFAULT_FPS = 4.0
+""" The number of frames a second a `LiveTimerDisplay` draws at most, by default. """
+
+
+class LiveTimerDisplay:
+    """
+    Show a timer's elapsed time live in the terminal, redrawn from a background thread.
+
+    Parameters:
+        timer:
+            The timer to show; anything with an `elapsed_ns` property, e.g. a
+            :class:`~inspyre_toolbox.live_timer.Timer` or :class:`~inspyre_toolbox.live_timer.stopwatch.Stopwatch`.
+            Until it's started, the display shows what `formatter` makes of 0 seconds.
+
+        fps (float):
+            The most frames a second to draw. Defaults to 4.
+
+        formatter (Optional[Callable[[float], str]]):
+            Formats the elapsed number of seconds for display. Defaults to
+            :func:`~inspyre_toolbox.live_timer.format_seconds_to_hhmmss`.
+
+        label (Optional[str]):
+            Text to show before the elapsed time, e.g. 'Elapsed'.
+
+        console (Optional[Console]):
+            The console to draw on. Defaults to a new `rich.console.Console`.
+
+        transient (bool):
+            A flag indicating whether to clear the display when it's stopped. Defaults to False.
+
+    Example:
+        >>> display = LiveTimerDisplay(timer, fps=10, label='Elapsed')
+        >>> display.start()
+        >>> ...
+        >>> display.stop()
+    """
+
+    def __init__(
+            self,
+            timer,
+            fps: float = DEFAULT_FPS,
+            formatter: Optional[Callable[[float], str]] = None,
+            label: Optional[str] = None,
+            console: Optional[Console] = None,
+            transient: bool = False
+    ):
+        if fps <= 0:
+            raise ValueError('fps must be greater than 0.')
+
+        if formatter is None:
+            from inspyre_toolbox.live_timer import format_seconds_to_hhmmss as formatter
+
+        self.__timer = timer
+        self.__interval = 1 / fps
+        self.__formatter = formatter
+        self.__label = label
+        self.__console = console
+        self.__transient = transient
+
+        self.__lock = Lock()
+        self.__stop = Event()
+        self.__thread = None
+        self.__live = None
+        self.__last = None
+        self.__renders = 0
+
+    @property
+    def fps(self) -> float:
+        """The most frames a second the display draws."""
+        return 1 / self.__interval
+
+    @property
+    def running(self) -> bool:
+        """Whether the display is running."""
+        return self.__thread is not None
+
+    @property
+    def renders(self) -> int:
+        """The number of times the display has been redrawn (which is only when the text shown changed)."""
+        return self.__renders
+
+    @property
+    def text(self) -> Optional[str]:
+        """The text last drawn, or None if nothing has been drawn yet."""
+        return self.__last
+
+    def render(self) -> str:
+        """
+        Get the text the display would show right now.
+
+        Returns:
+            str:
+                The text.
+        """
+        try:
+            elapsed_ns = self.__timer.elapsed_ns
+        except TimerNotStartedError:
+            elapsed_ns = 0
+
+        text = self.__formatter(ns_to_seconds(elapsed_ns))
+
+        return text if self.__label is None else f'{self.__label}: {text}'
+
+    def refresh(self) -> bool:
+        """
+        Draw a frame now, if the text shown has changed.
+
+        Returns:
+            bool:
+                True if the display was redrawn, False if the text hadn't changed (or the display isn't running).
+        """
+        with self.__lock:
+            text = self.render()
+
+            if text == self.__last or self.__live is None:
+                return False
+
+            self.__live.update(Text(text), refresh=True)
+            self.__last = text
+            self.__renders += 1
+
+            return True
+
+    def start(self) -> 'LiveTimerDisplay':
+        """
+        Start drawing the display, from a background thread.
+
+        Returns:
+            LiveTimerDisplay:
+                The display.
+        """
+        with self.__lock:
+            if self.__thread is not None:
+                return self
+
+            # Rich's own refresh thread is turned off; ours only redraws when the text changes.
+            self.__live = Live(
+                    Text(''),
+                    console=self.__console,
+                    auto_refresh=False,
+                    transient=self.__transient
+            )
+            self.__live.start()
+            self.__last = None
+            self.__stop.clear()
+            self.__thread = Thread(target=self.__run, name='LiveTimerDisplay', daemon=True)
+            self.__thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        """
+        Draw a last frame, and stop the display.
+
+        Returns:
+            None
+        """
+        thread = self.__thread
+
+        if thread is None:
+            return
+
+        self.__stop.set()
+        thread.join()
+        self.refresh()
+
+        with self.__lock:
+            self.__live.stop()
+            self.__live = None
+            self.__thread = None
+
+    def __run(self) -> None:
+        while True:
+            self.refresh()
+
+            if self.__stop.wait(self.__interval):
+                break
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def __repr__(self):
+        state = 'Running' if self.running else 'Stopped'
+
+        return f'<LiveTimerDisplay@{hex(id(self))}: {state} | {self.fps:g} fps | {self.__renders} renders>'
@@ -0,0 +1,486 @@
+"""
+
+Fixed-memory latency histograms.
+
+:class:`LatencyHistogram` records durations (in integer nanoseconds) into log-linear buckets, in the style of HDR
+histograms: every power of two is split into the same number of equal-width sub-buckets, so each bucket is at most
+``1 / 2**(significant_bits - 1)`` of its value wide, whatever the scale. With the default of 7 significant bits, that's
+about 1.6%, across the whole range from 1 ns to centuries, in under 4,000 counters.
+
+Inserting a value is O(1) (a `bit_length()` and a shift to find its bucket). Histograms with the same precision can
+be merged, e.g. to combine the timings of several threads or processes. A histogram isn't itself thread-safe; see
+:class:`ShardedHistogram` for one that many threads can record into at once.
+
+"""
+from array import array
+from math import ceil
+from threading import Lock, current_thread, local
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_SIGNIFICANT_BITS = 7
+
+MAX_VALUE = (1 << 64) - 1
+""" The largest value a histogram can record; larger values are recorded as this. """
+
+
+class LatencyHistogram:
+    """
+    A log-linear histogram of durations, in integer nanoseconds.
+
+    Parameters:
+        significant_bits (int):
+            The number of significant bits of each value kept; higher is more precise, but uses more memory (the
+            histogram has ``2**(significant_bits - 1) * (66 - significant_bits)`` counters). Must be from 2 to 16.
+            Defaults to 7.
+
+    Example:
+        >>> histogram = LatencyHistogram()
+        >>> for duration_ns in durations:
+        ...     histogram.record(duration_ns)
+        >>> histogram.percentile(99)
+    """
+    __slots__ = ('__bits', '__half', '__linear', '__counts', '__count', '__sum', '__min', '__max')
+
+    def __init__(self, significant_bits: int = DEFAULT_SIGNIFICANT_BITS):
+        if not 2 <= significant_bits <= 16:
+            raise ValueError('significant_bits must be from 2 to 16.')
+
+        self.__bits = significant_bits
+        self.__linear = 1 << significant_bits
+        self.__half = self.__linear >> 1
+        self.__counts = array('Q', bytes(8 * (self.__linear + (64 - significant_bits) * self.__half)))
+        self.__count = 0
+        self.__sum = 0
+        self.__min = None
+        self.__max = None
+
+    def __index(self, value: int) -> int:
+        if value < self.__linear:
+            return value
+
+        shift = value.bit_length() - self.__bits
+
+        return self.__linear + (shift - 1) * self.__half + (value >> shift) - self.__half
+
+    def bucket_bounds(self, index: int) -> Tuple[int, int]:
+        """
+        Get the range of values a bucket covers.
+
+        Parameters:
+            index (int):
+                The index of the bucket.
+
+        Returns:
+            Tuple[int, int]:
+                The lowest and highest value (inclusive) that fall in the bucket.
+        """
+        if index < self.__linear:
+            return index, index
+
+        shift, sub_bucket = divmod(index - self.__linear, self.__half)
+        shift += 1
+        low = (sub_bucket + self.__half) << shift
+
+        return low, low + (1 << shift) - 1
+
+    def record(self, value: int, count: int = 1) -> None:
+        """
+        Record a value.
+
+        Parameters:
+            value (int):
+                The value (e.g. a duration in nanoseconds). Negative values are recorded as 0.
+
+            count (int):
+                The number of times to record it. Defaults to 1.
+
+        Returns:
+            None
+        """
+        value = 0 if value < 0 else MAX_VALUE if value > MAX_VALUE else int(value)
+
+        # Inlined `__index`, as this is the hot path.
+        if value < self.__linear:
+            index = value
+        else:
+            shift = value.bit_length() - self.__bits
+            index = self.__linear + (shift - 1) * self.__half + (value >> shift) - self.__half
+
+        self.__counts[index] += count
+        self.__count += count
+        self.__sum += value * count
+
+        if self.__min is None:
+            self.__min = self.__max = value
+        elif value < self.__min:
+            self.__min = value
+        elif value > self.__max:
+            self.__max = value
+
+    def merge(self, other: 'LatencyHistogram') -> 'LatencyHistogram':
+        """
+        Add the values recorded in another histogram to this one.
+
+        Parameters:
+            other (LatencyHistogram):
+                The histogram to merge in. It must have the same `significant_bits`.
+
+        Returns:
+            LatencyHistogram:
+                This histogram.
+
+        Raises:
+            ValueError:
+                If the histograms have different precisions.
+        """
+        if other.significant_bits != self.__bits:
+            raise ValueError('Only histograms with the same significant_bits can be merged.')
+
+        if not other.count:
+            return self
+
+        counts = self.__counts
+
+        for index, count in other.nonzero_buckets():
+            counts[index] += count
+
+        self.__count += other.count
+        self.__sum += other.sum
+        self.__min = other.min if self.__min is None else min(self.__min, other.min)
+        self.__max = other.max if self.__max is None else max(self.__max, other.max)
+
+        return self
+
+    def copy(self) -> 'LatencyHistogram':
+        """
+        Get a copy of this histogram.
+
+        Returns:
+            LatencyHistogram:
+                The copy.
+        """
+        return LatencyHistogram(self.__bits).merge(self)
+
+    def clear(self) -> None:
+        """
+        Forget every recorded value.
+
+        Returns:
+            None
+        """
+        self.__counts = array('Q', bytes(8 * len(self.__counts)))
+        self.__count = 0
+        self.__sum = 0
+        self.__min = None
+        self.__max = None
+
+    def nonzero_buckets(self) -> Iterable[Tuple[int, int]]:
+        """
+        Iterate over the buckets that have values in them.
+
+        Returns:
+            Iterable[Tuple[int, int]]:
+                (index, count) pairs, lowest bucket first.
+        """
+        return ((index, count) for index, count in enumerate(self.__counts) if count)
+
+    def percentile(self, percentile: float) -> Optional[int]:
+        """
+        Get a percentile of the recorded values.
+
+        The result is the midpoint of the bucket the percentile falls in (clamped to the lowest and highest recorded
+        values), so it's within the histogram's precision of the exact value.
+
+        Parameters:
+            percentile (float):
+                The percentile, from 0 to 100.
+
+        Returns:
+            Optional[int]:
+                The value at that percentile, or None if nothing has been recorded.
+        """
+        return self.percentiles((percentile,))[percentile]
+
+    def percentiles(self, percentiles: Iterable[float] = (50, 95, 99)) -> Dict[float, Optional[int]]:
+        """
+        Get several percentiles of the recorded values, in one pass over the buckets.
+
+        Parameters:
+            percentiles (Iterable[float]):
+                The percentiles, from 0 to 100. Defaults to (50, 95, 99).
+
+        Returns:
+            Dict[float, Optional[int]]:
+                The value at each percentile (see `percentile`).
+        """
+        percentiles = list(percentiles)
+
+        if any(not 0 <= p <= 100 for p in percentiles):
+            raise ValueError('Percentiles must be from 0 to 100.')
+
+        if not self.__count:
+            return dict.fromkeys(percentiles)
+
+        wanted = sorted((max(ceil(p / 100 * self.__count), 1), p) for p in percentiles)
+        results = {}
+        seen = 0
+        next_wanted = 0
+
+        for index, count in self.nonzero_buckets():
+            seen += count
+
+            while next_wanted < len(wanted) and wanted[next_wanted][0] <= seen:
+                low, high = self.bucket_bounds(index)
+                results[wanted[next_wanted][1]] = min(max(low + (high - low) // 2, self.__min), self.__max)
+                next_wanted += 1
+
+            if next_wanted == len(wanted):
+                break
+
+        return results
+
+    @property
+    def significant_bits(self) -> int:
+        """The number of significant bits kept of each value."""
+        return self.__bits
+
+    @property
+    def count(self) -> int:
+        """The number of values recorded."""
+        return self.__count
+
+    @property
+    def sum(self) -> int:
+        """The (exact) sum of the values recorded."""
+        return self.__sum
+
+    @property
+    def min(self) -> Optional[int]:
+        """The (exact) lowest value recorded, or None."""
+        return self.__min
+
+    @property
+    def max(self) -> Optional[int]:
+        """The (exact) highest value recorded, or None."""
+        return self.__max
+
+    @property
+    def mean(self) -> Optional[float]:
+        """The (exact) mean of the values recorded, or None."""
+        return self.__sum / self.__count if self.__count else None
+
+    def __len__(self):
+        return self.__count
+
+    # Only the buckets in use are pickled, so histograms are cheap to send between processes.
+    def __getstate__(self):
+        return self.__bits, tuple(self.nonzero_buckets()), self.__count, self.__sum, self.__min, self.__max
+
+    def __setstate__(self, state):
+        bits, buckets, count, total, minimum, maximum = state
+
+        self.__init__(bits)
+
+        for index, bucket_count in buckets:
+            self.__counts[index] = bucket_count
+
+        self.__count, self.__sum, self.__min, self.__max = count, total, minimum, maximum
+
+    def __repr__(self):
+        return f'<LatencyHistogram@{hex(id(self))}: {self.__count} values | {self.__bits} significant bits>'
+
+
+class ShardedHistogram:
+    """
+    A latency histogram that many threads can record into at once.
+
+    Each thread records into its own :class:`LatencyHistogram` (its shard), guarded by a lock of its own, so recording
+    never waits for another recording thread; the lock is only ever contended by a reader. Reading (:meth:`snapshot`)
+    takes each shard's lock in turn and merges it into a new histogram, so no shard is ever seen half-updated;
+    :meth:`nonzero_buckets` reads the shards the same way, but only gathers their non-empty buckets, for readers that
+    don't need a whole histogram. The shards of threads that have finished are folded into a single histogram when
+    read, so short-lived threads don't pile up.
+
+    Parameters:
+        significant_bits (int):
+            The precision of the histogram. (See :class:`LatencyHistogram`)
+    """
+
+    def __init__(self, significant_bits: int = DEFAULT_SIGNIFICANT_BITS):
+        self.__bits = significant_bits
+        self.__lock = Lock()
+        self.__local = local()
+        self.__generation = 0
+        self.__shards: List[Tuple[object, Lock, LatencyHistogram]] = []
+        self.__retired = LatencyHistogram(significant_bits)
+
+    @property
+    def significant_bits(self) -> int:
+        """The number of significant bits kept of each value."""
+        return self.__bits
+
+    def __shard(self) -> Tuple[Lock, LatencyHistogram]:
+        local_state = self.__local
+
+        if getattr(local_state, 'generation', None) != self.__generation:
+            shard = (Lock(), LatencyHistogram(self.__bits))
+
+            with self.__lock:
+                self.__shards.append((current_thread(),) + shard)
+                local_state.generation = self.__generation
+
+            local_state.shard = shard
+
+        return local_state.shard
+
+    def record(self, value: int, count: int = 1) -> None:
+        """
+        Record a value, in the calling thread's shard. (See :meth:`LatencyHistogram.record`)
+
+        Returns:
+            None
+        """
+        lock, shard = self.__shard()
+
+        with lock:
+            shard.record(value, count)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """
+        Add the values recorded in a histogram to this one.
+
+        Parameters:
+            other (LatencyHistogram):
+                The histogram to merge in. It must have the same `significant_bits`.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__retired.merge(other)
+
+    def __collect(self, reset: bool) -> LatencyHistogram:
+        # Must be called with `self.__lock` held.
+        live = []
+
+        for thread, lock, shard in self.__shards:
+            if thread.is_alive():
+                live.append((thread, lock, shard))
+            else:
+                with lock:
+                    self.__retired.merge(shard)
+
+        self.__shards = live
+        merged = self.__retired.copy()
+
+        if reset:
+            self.__retired.clear()
+
+        for _, lock, shard in live:
+            with lock:
+                merged.merge(shard)
+
+                if reset:
+                    shard.clear()
+
+        return merged
+
+    def bucket_bounds(self, index: int) -> Tuple[int, int]:
+        """
+        Get the range of values a bucket covers. (See :meth:`LatencyHistogram.bucket_bounds`)
+
+        Returns:
+            Tuple[int, int]:
+                The lowest and highest value (inclusive) that fall in the bucket.
+        """
+        return self.__retired.bucket_bounds(index)
+
+    def nonzero_buckets(self) -> List[Tuple[int, int]]:
+        """
+        Get the buckets that have values in them, across every shard, without merging the shards into a histogram.
+
+        Each shard is read under its lock, so no shard is seen half-updated.
+
+        Returns:
+            List[Tuple[int, int]]:
+                (index, count) pairs, lowest bucket first.
+        """
+        counts: Dict[int, int] = {}
+
+        with self.__lock:
+            # The retired shards are guarded by the main lock; each live shard by its own.
+            for index, count in self.__retired.nonzero_buckets():
+                counts[index] = count
+
+            for _, lock, shard in self.__shards:
+                with lock:
+                    buckets = list(shard.nonzero_buckets())
+
+                for index, count in buckets:
+                    counts[index] = counts.get(index, 0) + count
+
+        return sorted(counts.items())
+
+    def snapshot(self) -> LatencyHistogram:
+        """
+        Get every shard's values, merged into a new histogram.
+
+        Returns:
+            LatencyHistogram:
+                The merged histogram.
+        """
+        with self.__lock:
+            return self.__collect(reset=False)
+
+    def drain(self) -> LatencyHistogram:
+        """
+        Get every shard's values, merged into a new histogram, and forget them.
+
+        Each shard is read and cleared under its lock, so every value is returned by exactly one call to `drain`, even
+        while other threads are recording.
+
+        Returns:
+            LatencyHistogram:
+                The merged histogram.
+        """
+        with self.__lock:
+            return self.__collect(reset=True)
+
+    def clear(self) -> None:
+        """
+        Forget every recorded value. Each thread starts a new shard the next time it records.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__generation += 1
+            self.__shards = []
+            self.__retired = LatencyHistogram(self.__bits)
+
+    @property
+    def count(self) -> int:
+        """The number of values recorded, across every shard."""
+        with self.__lock:
+            count = self.__retired.count
+
+            for _, lock, shard in self.__shards:
+                with lock:
+                    count += shard.count
+
+        return count
+
+    @property
+    def sum(self) -> int:
+        """The (exact) sum of the values recorded, across every shard."""
+        with self.__lock:
+            total = self.__retired.sum
+
+            for _, lock, shard in self.__shards:
+                with lock:
+                    total += shard.sum
+
+        return total
+
+    def __repr__(self):
+        return f'<ShardedHistogram@{hex(id(self))}: {self.count} values | {len(self.__shards)} live shards>'
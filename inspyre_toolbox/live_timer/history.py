@@ -1,24 +1,188 @@
-from os import makedirs
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from time import time
+from threading import Lock
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+from warnings import warn
+
+from inspyre_toolbox.live_timer.clock import Clock, DEFAULT_CLOCK, NS_PER_SECOND, WALL_CLOCK
+
+DEFAULT_CAPACITY = 1024
+""" The number of entries a `TimerHistory` keeps by default before dropping the oldest. """
+
+DEFAULT_DATA_DIR = Path("~/Inspyre-Softworks/Inspyre-Toolbox/data").expanduser()
+""" The directory `TimerHistory.write` writes to when the history has no sink of its own. """
+
+ACTIONS = (
+        "START",
+        "STOP",
+        "PAUSE",
+        "UNPAUSE",
+        "RESET",
+        "CREATE",
+        "QUERY"
+)
+
+# The actions that end a pause (besides 'UNPAUSE'), as the timer starts counting afresh.
+PAUSE_ENDING_ACTIONS = ("UNPAUSE", "START", "RESET")
+
+
+def _format_hhmmss(ns: int) -> str:
+    # As `live_timer.format_seconds_to_hhmmss`, which can't be imported here without a circular import.
+    seconds = ns // NS_PER_SECOND
+    hours, seconds = divmod(seconds, 60 * 60)
+    minutes, seconds = divmod(seconds, 60)
+    return "%02i:%02i:%02i" % (hours, minutes, seconds)
+
+
+class HistoryEntry(NamedTuple):
+    """
+    A single entry in a `TimerHistory`.
+
+    Attributes:
+        time (float):
+            The (wall clock) time the action happened, in seconds since the epoch. For display only.
+
+        action (str):
+            The action, e.g. 'START'.
+
+        elapsed_since_last (Union[str, float]):
+            The time since the previous action, less any time the timer spent paused meanwhile, in HH:MM:SS format
+            (0.0 for the 'CREATE' entry).
+
+        rt_at_create (str):
+            The time since the history was created (the runtime at this action), less the time the timer has spent
+            paused, in HH:MM:SS format ('' for the 'CREATE' entry).
+
+        elapsed_since_last_ns (Optional[int]):
+            The number of nanoseconds since the previous action, paused time included, measured with the history's
+            (monotonic) clock. None for entries loaded from files written before it was recorded.
+
+        rt_at_create_ns (Optional[int]):
+            The number of nanoseconds since the history was created, paused time included, measured with the
+            history's (monotonic) clock. None for entries loaded from files written before it was recorded.
+    """
+    time: float
+    action: str
+    elapsed_since_last: Union[str, float]
+    rt_at_create: str
+    elapsed_since_last_ns: Optional[int] = None
+    rt_at_create_ns: Optional[int] = None
 
 
 class TimerHistory(object):
+    """
+    A bounded history of timer actions.
+
+    Entries are kept in a ring buffer of `capacity` compact tuples (see `HistoryEntry`); once it's full, the oldest
+    entry is dropped for each one added. The number of times each action has happened is kept separately, so counts
+    like `num_resets` cover the whole history, including dropped entries, and cost nothing to read. Entries can be
+    added from several threads at once.
+
+    Each entry is timed from a single clock reading. The time paused is worked out from the history's own 'PAUSE' and
+    'UNPAUSE' entries, so it's left out of the HH:MM:SS times without asking the timer.
+
+    Parameters:
+        elapsed_method (Optional[Callable]):
+            Deprecated, and ignored (a `DeprecationWarning` is issued if it's given); the history times its entries
+            itself.
+
+        capacity (Optional[int]):
+            The number of entries to keep. None keeps every entry. Defaults to `DEFAULT_CAPACITY`.
+
+        record_queries (bool):
+            A flag indicating whether to keep entries for 'QUERY' actions (which a polled timer adds very often). They
+            are counted either way. Defaults to True.
+
+        clock (Optional[Clock]):
+            The monotonic clock (returning nanoseconds) to time entries with. Defaults to
+            :data:`~inspyre_toolbox.live_timer.clock.DEFAULT_CLOCK`.
+
+        wall_clock (Optional[Callable[[], float]]):
+            The clock to record the time of entries with, for display. Defaults to
+            :data:`~inspyre_toolbox.live_timer.clock.WALL_CLOCK`.
+
+        sink (Optional[HistorySink]):
+            The sink :meth:`write` appends entries to. (See :class:`~inspyre_toolbox.live_timer.persistence.HistorySink`)
+            Defaults to a new file in `DEFAULT_DATA_DIR`, made on the first write.
+    """
+
+    def __init__(
+            self,
+            elapsed_method=None,
+            capacity: Optional[int] = DEFAULT_CAPACITY,
+            record_queries: bool = True,
+            clock: Optional[Clock] = None,
+            wall_clock: Optional[Callable[[], float]] = None,
+            sink=None
+    ):
+        if capacity is not None and capacity < 1:
+            raise ValueError('capacity must be at least 1, or None to keep every entry.')
+
+        if elapsed_method is not None:
+            warn('TimerHistory no longer uses elapsed_method, which is deprecated and ignored; it times its entries '
+                 'itself.', DeprecationWarning, stacklevel=2)
 
-    def __init__(self, elapsed_method):
         self.get_elapsed = elapsed_method
-        self.ledger = []
-        self.actions = [
-                "START",
-                "STOP",
-                "PAUSE",
-                "UNPAUSE",
-                "RESET",
-                "CREATE",
-                "QUERY"
-        ]
+        self.actions = list(ACTIONS)
+
+        self.__capacity = capacity
+        self.__record_queries = record_queries
+        self.__clock = clock or DEFAULT_CLOCK
+        self.__wall_clock = wall_clock or WALL_CLOCK
+        self.__lock = Lock()
+        self.__entries = deque(maxlen=capacity)
+        self.__counts = dict.fromkeys(ACTIONS, 0)
+        self.__created = None
+        self.__last = None
+
+        # The time spent paused, up to the last entry and up to when the current pause (if any) started.
+        self.__paused_at_last = 0
+        self.__paused_total = 0
+        self.__pause_started = None
+
+        # The number of entries kept, ever, and how many of those have been written to the sink.
+        self.__sink = sink
+        self.__kept = 0
+        self.__written = 0
+
         self.add("CREATE")
 
+    @property
+    def capacity(self) -> Optional[int]:
+        """
+        The maximum number of entries kept, or None if there's no limit.
+        """
+        return self.__capacity
+
+    @property
+    def record_queries(self) -> bool:
+        """
+        Whether entries are kept for 'QUERY' actions.
+        """
+        return self.__record_queries
+
+    @property
+    def entries(self) -> List[HistoryEntry]:
+        """
+        The entries currently kept, oldest first.
+        """
+        return list(self.__entries)
+
+    @property
+    def ledger(self) -> List[dict]:
+        """
+        The entries currently kept, oldest first, as dictionaries.
+        """
+        return [entry._asdict() for entry in self.__entries]
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """
+        The number of times each action has happened, including entries no longer kept.
+        """
+        return dict(self.__counts)
+
     @property
     def num_resets(self) -> int:
         """
@@ -28,9 +192,22 @@ class TimerHistory(object):
             The number of times the timer has been reset
 
         """
-        return len([entry for entry in self.ledger if entry['action'] == "RESET"])
+        return self.__counts["RESET"]
+
+    def count(self, action: str) -> int:
+        """
+        Get the number of times an action has happened.
+
+        Args:
+            action (str):
+                The action, e.g. 'PAUSE'.
+
+        Returns:
+            The number of times the action has happened.
+        """
+        return self.__counts.get(action.upper(), 0)
 
-    def add(self, action: str = "START") -> dict:
+    def add(self, action: str = "START") -> HistoryEntry:
         """
         The add function adds a new entry to the ledger.
 
@@ -41,58 +218,102 @@ class TimerHistory(object):
                 The action you'd like to log to the ledger. (Optional; defaults to 'START')
 
         Returns:
-            The entry that was just added to the ledger
+            The entry that was just added to the ledger (whether it was kept or not)
 
         """
         action = action.upper()
-        entry = {
-                "time":               time(),
-                "elapsed_since_last": "",
-                "action":             action,
-                "rt_at_create":       ""
-        }
-        if action == "CREATE":
-            entry['elapsed_since_last'] = 0.00
-        else:
-            entry['elapsed_since_last'] = self.get_elapsed(self.ledger[-1]['time'])
-            entry['rt_at_create'] = self.get_elapsed(self.ledger[0]['time'])
-
-        self.ledger.append(entry)
+
+        with self.__lock:
+            now = self.__clock()
+
+            if self.__created is None:
+                self.__created = self.__last = now
+
+            paused = self.__paused_total
+
+            if self.__pause_started is not None:
+                paused += now - self.__pause_started
+
+            since_last_ns = now - self.__last
+            runtime_ns = now - self.__created
+
+            if action == "CREATE":
+                entry = HistoryEntry(self.__wall_clock(), action, 0.0, "", since_last_ns, runtime_ns)
+            else:
+                entry = HistoryEntry(
+                        self.__wall_clock(),
+                        action,
+                        _format_hhmmss(since_last_ns - (paused - self.__paused_at_last)),
+                        _format_hhmmss(runtime_ns - paused),
+                        since_last_ns,
+                        runtime_ns
+                )
+
+            if action == "PAUSE" and self.__pause_started is None:
+                self.__pause_started = now
+            elif action in PAUSE_ENDING_ACTIONS and self.__pause_started is not None:
+                self.__paused_total = paused
+                self.__pause_started = None
+
+            self.__last = now
+            self.__paused_at_last = paused
+            self.__counts[action] = self.__counts.get(action, 0) + 1
+
+            if action != "QUERY" or self.__record_queries:
+                self.__entries.append(entry)
+                self.__kept += 1
 
         return entry
 
-    def write(self):
+    @property
+    def sink(self):
         """
-        The write function writes the ledger to a file.
+        The sink `write` appends entries to, or None if nothing has been written yet and no sink was given.
+        """
+        return self.__sink
+
+    def write(self, flush: bool = True) -> int:
+        """
+        Append the entries added since the last write to the history's sink (a JSON Lines file; see
+        :class:`~inspyre_toolbox.live_timer.persistence.HistorySink`).
+
+        Only new entries are written, so checkpointing a long-lived timer's history costs the same however long it
+        has run. Entries dropped from the history (as it's bounded by `capacity`) before being written are lost.
 
         Args:
-            self:
-                Refer to the object itself
+            flush (bool):
+                Write the sink's buffer to its file, rather than leaving it until the buffer fills. (Optional;
+                defaults to True)
 
         Returns:
-            None
+            The number of entries written.
         """
-        data_path = Path("~/Inspyre-Softworks/Inspyre-Toolbox/data").expanduser()
+        from inspyre_toolbox.live_timer.persistence import HistorySink
 
-        filename = f'ledger_{str(time()).split(".")[0]}'
-        filepath = str(f'{str(data_path)}/{filename}.txt')
+        with self.__lock:
+            if self.__sink is None:
+                self.__sink = HistorySink()
 
-        filepath = str(Path(filepath).resolve())
+            pending = min(self.__kept - self.__written, len(self.__entries))
+            written = self.__sink.write(islice(self.__entries, len(self.__entries) - pending, None))
+            self.__written = self.__kept
 
-        if not data_path.exists():
-            makedirs(data_path)
+            if flush:
+                self.__sink.flush()
 
-        with open(filepath, "w") as fp:
-            fp.write(str(self.ledger))
+        return written
 
     def reset(self) -> None:
         """
-        Clear the ledger
+        Clear the ledger, and the action counts.
 
-        This literally just runs '.clear()' on 'self.ledger'
+        The time the history was created is kept, so later entries still report the total runtime.
 
         Returns:
             None
 
         """
-        self.ledger.clear()
+        with self.__lock:
+            self.__entries.clear()
+            self.__counts = dict.fromkeys(ACTIONS, 0)
+            self.__written = self.__kept
@@ -0,0 +1,494 @@
+"""
+
+Export the toolbox's timers and counters in the OpenMetrics (Prometheus) text format.
+
+A :class:`MetricsExporter` gathers metric families from a timer registry (each named timer becomes a histogram, with
+the timer's name as a label) and from any counters and gauges added to it, such as a
+:class:`~inspyre_toolbox.path_man.index.DirectoryIndex`'s cache hits and misses or the bytes a
+:class:`~inspyre_toolbox.conversions.bytes.throughput.ThroughputMeter` has seen. The exposition is generated line by
+line, straight from each histogram's non-empty buckets (a timer's histogram is never copied, nor its threads' shards
+merged into a new one), and can be written to a file for a textfile collector or served
+over HTTP for a scraper:
+
+    >>> exporter = MetricsExporter()
+    >>> exporter.add_directory_index(index)
+    >>> exporter.add_throughput_meter(hash_meter, 'hashed')
+    >>>
+    >>> exporter.write_textfile('/var/lib/node_exporter/toolbox.prom')
+    >>>
+    >>> server = exporter.serve(port=9464)
+    >>> ...
+    >>> server.shutdown()
+
+"""
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from math import inf, isinf, isnan
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from inspyre_toolbox.live_timer.clock import NS_PER_SECOND
+from inspyre_toolbox.live_timer.histogram import LatencyHistogram, ShardedHistogram
+from inspyre_toolbox.live_timer.registry import REGISTRY, TimerRegistry
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+""" The content type of an OpenMetrics exposition. """
+
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+""" The upper bounds, in seconds, of the histogram buckets exported for each timer (besides '+Inf'). """
+
+DEFAULT_PREFIX = 'istb'
+""" The prefix of every exported metric's name. """
+
+Labels = Dict[str, str]
+Source = Callable[[], Union[int, float]]
+
+
+def format_value(value: Union[int, float]) -> str:
+    """
+    Format a sample value (or a bucket bound) as OpenMetrics expects.
+
+    Parameters:
+        value (Union[int, float]):
+            The value.
+
+    Returns:
+        str:
+            The value, e.g. '3', '0.25', '+Inf' or 'NaN'.
+    """
+    if isinstance(value, int):
+        return str(value)
+
+    if isnan(value):
+        return 'NaN'
+
+    if isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+
+    return repr(float(value))
+
+
+def format_labels(labels: Optional[Labels]) -> str:
+    """
+    Format a set of labels, escaping their values.
+
+    Parameters:
+        labels (Optional[Labels]):
+            The labels, by name.
+
+    Returns:
+        str:
+            The labels, e.g. '{timer="db.query"}', or an empty string if there are none.
+    """
+    if not labels:
+        return ''
+
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def histogram_lines(
+        name: str,
+        histogram: Union[LatencyHistogram, ShardedHistogram],
+        labels: Optional[Labels] = None,
+        buckets: Iterable[float] = DEFAULT_BUCKETS
+) -> Iterator[str]:
+    """
+    Generate the samples of a latency histogram (in nanoseconds) as an OpenMetrics histogram, in seconds.
+
+    The cumulative bucket counts (and the total count) are found in one pass over the histogram's non-empty buckets.
+    A histogram bucket is counted under the first exported bound its whole range fits beneath, so counts are exact to
+    within the histogram's precision.
+
+    Parameters:
+        name (str):
+            The name of the metric family.
+
+        histogram (Union[LatencyHistogram, ShardedHistogram]):
+            The histogram. A sharded histogram's buckets are read without merging its shards.
+
+        labels (Optional[Labels]):
+            Labels to add to every sample.
+
+        buckets (Iterable[float]):
+            The upper bounds of the buckets to export, in seconds. Defaults to `DEFAULT_BUCKETS`.
+
+    Returns:
+        Iterator[str]:
+            The sample lines, without trailing newlines.
+    """
+    labels = dict(labels or {})
+    bounds = sorted(buckets)
+    bounds_ns = [bound * NS_PER_SECOND for bound in bounds]
+    cumulative = [0] * len(bounds)
+    position = 0
+    seen = 0
+
+    for index, count in histogram.nonzero_buckets():
+        high = histogram.bucket_bounds(index)[1]
+
+        while position < len(bounds) and bounds_ns[position] < high:
+            cumulative[position] = seen
+            position += 1
+
+        seen += count
+
+    while position < len(bounds):
+        cumulative[position] = seen
+        position += 1
+
+    for bound, count in zip(bounds + [inf], cumulative + [seen]):
+        yield f'{name}_bucket{format_labels({**labels, "le": format_value(float(bound))})} {count}'
+
+    yield f'{name}_count{format_labels(labels)} {seen}'
+    yield f'{name}_sum{format_labels(labels)} {format_value(histogram.sum / NS_PER_SECOND)}'
+
+
+class MetricsExporter:
+    """
+    Gather the toolbox's timers and counters, and export them in the OpenMetrics text format.
+
+    Sources are only read when the metrics are generated, so an exporter can be set up once and scraped for as long
+    as the process runs. Adding sources and generating metrics are both thread-safe.
+
+    Parameters:
+        timers (Optional[TimerRegistry]):
+            The timer registry to export, as the histogram family '<prefix>_timer_seconds' with a 'timer' label.
+            Defaults to the process-wide :data:`~inspyre_toolbox.live_timer.registry.REGISTRY`. Pass False to export
+            no timers.
+
+        prefix (str):
+            The prefix of every metric's name. Defaults to 'istb'.
+
+        buckets (Iterable[float]):
+            The upper bounds of the timer histograms' buckets, in seconds. Defaults to `DEFAULT_BUCKETS`.
+
+    Example:
+        >>> exporter = MetricsExporter()
+        >>> exporter.add_counter('files_scanned', lambda: scanner.count, help='Files scanned.')
+        >>> print(exporter.render())
+    """
+
+    def __init__(
+            self,
+            timers: Optional[TimerRegistry] = None,
+            prefix: str = DEFAULT_PREFIX,
+            buckets: Iterable[float] = DEFAULT_BUCKETS
+    ):
+        self.__timers = REGISTRY if timers is None else None if timers is False else timers
+        self.__prefix = prefix
+        self.__buckets = tuple(sorted(buckets))
+        self.__lock = Lock()
+
+        # name -> (type, help, unit, [(labels, source)])
+        self.__families: Dict[str, Tuple[str, str, str, List[Tuple[Labels, Callable]]]] = {}
+
+    @property
+    def prefix(self) -> str:
+        """The prefix of every metric's name."""
+        return self.__prefix
+
+    def __name(self, name: str) -> str:
+        return f'{self.__prefix}_{name}' if self.__prefix else name
+
+    def __add(self, kind: str, name: str, source: Callable, help: str, unit: str, labels: Optional[Labels]) -> str:
+        name = self.__name(name)
+
+        with self.__lock:
+            family = self.__families.setdefault(name, (kind, help, unit, []))
+
+            if family[0] != kind:
+                raise ValueError(f'{name} has already been added as a {family[0]}.')
+
+            family[3].append((dict(labels or {}), source))
+
+        return name
+
+    def add_counter(
+            self,
+            name: str,
+            source: Source,
+            help: str = '',
+            unit: str = '',
+            labels: Optional[Labels] = None
+    ) -> str:
+        """
+        Add a counter; a value that only ever goes up (e.g. the number of files scanned).
+
+        Several sources can be added under the same name, with different labels.
+
+        Parameters:
+            name (str):
+                The name of the counter, without the prefix or the '_total' suffix.
+
+            source (Callable[[], Union[int, float]]):
+                Called to read the counter's value each time the metrics are generated.
+
+            help (str):
+                A description of the counter.
+
+            unit (str):
+                The counter's unit (e.g. 'bytes'); if given, the name should end with it.
+
+            labels (Optional[Labels]):
+                The labels of this source.
+
+        Returns:
+            str:
+                The full name of the metric family.
+
+        Raises:
+            ValueError:
+                If the name has already been added as another type of metric.
+        """
+        return self.__add('counter', name, source, help, unit, labels)
+
+    def add_gauge(
+            self,
+            name: str,
+            source: Source,
+            help: str = '',
+            unit: str = '',
+            labels: Optional[Labels] = None
+    ) -> str:
+        """
+        Add a gauge; a value that can go up and down (e.g. a cache's hit ratio).
+
+        Parameters are as for :meth:`add_counter`.
+
+        Returns:
+            str:
+                The full name of the metric family.
+        """
+        return self.__add('gauge', name, source, help, unit, labels)
+
+    def add_histogram(
+            self,
+            name: str,
+            source: Callable[[], LatencyHistogram],
+            help: str = '',
+            labels: Optional[Labels] = None
+    ) -> str:
+        """
+        Add a latency histogram (in nanoseconds), exported in seconds.
+
+        Parameters:
+            name (str):
+                The name of the histogram, without the prefix; it should end with '_seconds'.
+
+            source (Callable[[], LatencyHistogram]):
+                Called to get the histogram each time the metrics are generated. Histograms are exported as
+                cumulative, so it shouldn't forget what it has recorded between calls.
+
+            help (str):
+                A description of the histogram.
+
+            labels (Optional[Labels]):
+                The labels of this source.
+
+        Returns:
+            str:
+                The full name of the metric family.
+        """
+        return self.__add('histogram', name, source, help, 'seconds', labels)
+
+    def add_directory_index(self, index, name: str = 'directory_index', labels: Optional[Labels] = None) -> None:
+        """
+        Export a directory index's cache hits and misses, and its hit ratio.
+
+        Parameters:
+            index (DirectoryIndex):
+                The index (or anything with `hits` and `misses` attributes).
+
+            name (str):
+                The name the metrics are made from: '<name>_hits', '<name>_misses' and '<name>_hit_ratio'. Defaults
+                to 'directory_index'.
+
+            labels (Optional[Labels]):
+                The labels of this index, e.g. to tell several apart.
+
+        Returns:
+            None
+        """
+
+        def hit_ratio():
+            lookups = index.hits + index.misses
+            return index.hits / lookups if lookups else 0.0
+
+        self.add_counter(f'{name}_hits', lambda: index.hits, 'Directory listings served from the index.', '', labels)
+        self.add_counter(f'{name}_misses', lambda: index.misses, 'Directory listings read from disk.', '', labels)
+        self.add_gauge(f'{name}_hit_ratio', hit_ratio, 'The share of directory listings served from the index.', '',
+                       labels)
+
+    def add_throughput_meter(self, meter, name: str, labels: Optional[Labels] = None) -> None:
+        """
+        Export the number of bytes a throughput meter has seen, and its current rate.
+
+        Parameters:
+            meter (ThroughputMeter):
+                The meter.
+
+            name (str):
+                What the bytes are, e.g. 'hashed'; the metrics are '<name>_bytes' (a counter) and
+                '<name>_bytes_per_second' (a gauge of the moving average rate).
+
+            labels (Optional[Labels]):
+                The labels of this meter.
+
+        Returns:
+            None
+        """
+        self.add_counter(f'{name}_bytes', lambda: meter.done, f'Bytes {name}.', 'bytes', labels)
+        self.add_gauge(f'{name}_bytes_per_second', lambda: meter.ewma_rate, f'The rate of bytes {name}.', '',
+                       labels)
+
+    def generate(self) -> Iterator[str]:
+        """
+        Generate the exposition, a line at a time.
+
+        Sources that raise an error are left out of the exposition, rather than spoiling the rest of it.
+
+        Returns:
+            Iterator[str]:
+                The lines, each with a trailing newline, ending with '# EOF'.
+        """
+        with self.__lock:
+            families = [(name, kind, help, unit, list(sources))
+                        for name, (kind, help, unit, sources) in sorted(self.__families.items())]
+
+        if self.__timers is not None:
+            name = self.__name('timer_seconds')
+
+            yield f'# TYPE {name} histogram\n'
+            yield f'# UNIT {name} seconds\n'
+            yield f'# HELP {name} Durations recorded by the named timers.\n'
+
+            for timer_name in self.__timers.names():
+                # Looked up without creating, so a timer removed meanwhile (e.g. by `TimerRegistry.clear`) stays gone.
+                timer = self.__timers.find(timer_name)
+
+                if timer is None:
+                    continue
+
+                for line in histogram_lines(name, timer.live_histogram, {'timer': timer_name}, self.__buckets):
+                    yield line + '\n'
+
+        for name, kind, help, unit, sources in families:
+            yield f'# TYPE {name} {kind}\n'
+
+            if unit:
+                yield f'# UNIT {name} {unit}\n'
+
+            if help:
+                yield f'# HELP {name} {help}\n'
+
+            for labels, source in sources:
+                try:
+                    value = source()
+                except Exception:
+                    continue
+
+                if kind == 'histogram':
+                    for line in histogram_lines(name, value, labels, self.__buckets):
+                        yield line + '\n'
+                else:
+                    suffix = '_total' if kind == 'counter' else ''
+                    yield f'{name}{suffix}{format_labels(labels)} {format_value(value)}\n'
+
+        yield '# EOF\n'
+
+    def render(self) -> str:
+        """
+        Get the whole exposition as a string.
+
+        Returns:
+            str:
+                The exposition.
+        """
+        return ''.join(self.generate())
+
+    def write_textfile(self, path: Union[str, Path]) -> Path:
+        """
+        Write the exposition to a file (e.g. for node_exporter's textfile collector).
+
+        The exposition is streamed to a temporary file, which is then moved into place, so a reader never sees a
+        half-written file.
+
+        Parameters:
+            path (Union[str, Path]):
+                The file to write.
+
+        Returns:
+            Path:
+                The file written.
+        """
+        path = Path(path).expanduser()
+        tmp_path = path.with_name(f'{path.name}.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            file.writelines(self.generate())
+
+        os.replace(tmp_path, path)
+
+        return path
+
+    def serve(self, port: int = 0, address: str = '127.0.0.1', path: str = '/metrics') -> ThreadingHTTPServer:
+        """
+        Serve the exposition over HTTP, from a background thread.
+
+        Parameters:
+            port (int):
+                The port to listen on. 0 picks a free one (see the server's `server_port`). Defaults to 0.
+
+            address (str):
+                The address to listen on. Defaults to '127.0.0.1'.
+
+            path (str):
+                The path to serve the exposition at. Defaults to '/metrics'.
+
+        Returns:
+            ThreadingHTTPServer:
+                The server, already running. Call its `shutdown` method to stop it.
+        """
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != path:
+                    self.send_error(404)
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.end_headers()
+
+                # HTTP/1.0, so the body is simply streamed until the connection closes.
+                for line in exporter.generate():
+                    self.wfile.write(line.encode('utf-8'))
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((address, port), Handler)
+        server.daemon_threads = True
+
+        Thread(target=server.serve_forever, name='MetricsExporter', daemon=True).start()
+
+        return server
+
+    def __repr__(self):
+        return f'<MetricsExporter@{hex(id(self))}: {len(self.__families)} families | Prefix: {self.__prefix}>'
+
+
+__all__ = [
+    'CONTENT_TYPE',
+    'DEFAULT_BUCKETS',
+    'MetricsExporter',
+    'format_labels',
+    'format_value',
+    'histogram_lines',
+]
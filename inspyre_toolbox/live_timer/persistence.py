@@ -0,0 +1,306 @@
+"""
+
+Streaming persistence for timer histories.
+
+A :class:`HistorySink` appends :class:`~inspyre_toolbox.live_timer.history.HistoryEntry` records to a JSON Lines file
+(one compact JSON object per line), through a write buffer, and rotates the file once it grows past a size limit. As
+the file is only ever appended to, a long-lived timer can checkpoint its history as often as it likes, at a cost
+proportional to the entries added since the last checkpoint (see :meth:`TimerHistory.write`).
+
+:func:`load_history` streams the entries back, one line at a time, so files of any size can be read in constant memory:
+
+    >>> sink = HistorySink('timings/ledger.jsonl', max_bytes=1 << 20, backup_count=3)
+    >>> history = TimerHistory(sink=sink)
+    >>> ...
+    >>> history.write()
+    >>>
+    >>> for entry in load_history('timings/ledger.jsonl', include_rotated=True):
+    ...     print(entry.action, entry.rt_at_create)
+
+"""
+import json
+import os
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Iterable, Iterator, List, Optional, Union
+
+from inspyre_toolbox.live_timer.history import DEFAULT_DATA_DIR, HistoryEntry
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+""" The number of bytes a `HistorySink` buffers before writing to its file. """
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+""" The size a `HistorySink`'s file may grow to before it's rotated. """
+
+DEFAULT_BACKUP_COUNT = 5
+""" The number of rotated files a `HistorySink` keeps. """
+
+
+class HistorySink:
+    """
+    An append-only, buffered, rotating JSON Lines file of timer history entries.
+
+    Entries are encoded as they're written and held in a buffer of up to `buffer_size` bytes, which is appended to the
+    file when it fills, on :meth:`flush` and on :meth:`close`. If appending would take the file past `max_bytes`, the
+    file is first rotated: `ledger.jsonl` becomes `ledger.jsonl.1`, `ledger.jsonl.1` becomes `ledger.jsonl.2`, and so
+    on, with the oldest beyond `backup_count` deleted. All methods are thread-safe.
+
+    Parameters:
+        path (Optional[Union[str, Path]]):
+            The file to write to; its directory is created if needed. Defaults to a new file named after the current
+            time in :data:`~inspyre_toolbox.live_timer.history.DEFAULT_DATA_DIR`.
+
+        max_bytes (Optional[int]):
+            The size the file may grow to before it's rotated. None never rotates. Defaults to 16 MiB.
+
+        backup_count (int):
+            The number of rotated files to keep. 0 discards the file's contents on rotation. Defaults to 5.
+
+        buffer_size (int):
+            The number of bytes to buffer before writing to the file. Defaults to 64 KiB.
+
+    Example:
+        >>> with HistorySink('ledger.jsonl') as sink:
+        ...     sink.write(history.entries)
+    """
+
+    def __init__(
+            self,
+            path: Optional[Union[str, Path]] = None,
+            max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+            backup_count: int = DEFAULT_BACKUP_COUNT,
+            buffer_size: int = DEFAULT_BUFFER_SIZE
+    ):
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError('max_bytes must be at least 1, or None to never rotate.')
+
+        if backup_count < 0:
+            raise ValueError('backup_count must not be negative.')
+
+        if path is None:
+            path = DEFAULT_DATA_DIR / f'ledger_{int(time())}.jsonl'
+
+        self.__path = Path(path).expanduser()
+        self.__max_bytes = max_bytes
+        self.__backup_count = backup_count
+        self.__buffer_size = buffer_size
+
+        self.__lock = Lock()
+        self.__buffer: List[bytes] = []
+        self.__buffered = 0
+        self.__size = None
+        self.__closed = False
+
+    @property
+    def path(self) -> Path:
+        """The file being written to."""
+        return self.__path
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        """The size the file may grow to before it's rotated, or None if it's never rotated."""
+        return self.__max_bytes
+
+    @property
+    def backup_count(self) -> int:
+        """The number of rotated files kept."""
+        return self.__backup_count
+
+    @property
+    def closed(self) -> bool:
+        """Whether the sink has been closed."""
+        return self.__closed
+
+    def write(self, entries: Iterable[HistoryEntry]) -> int:
+        """
+        Append entries to the sink.
+
+        Parameters:
+            entries (Iterable[HistoryEntry]):
+                The entries.
+
+        Returns:
+            int:
+                The number of entries appended.
+
+        Raises:
+            ValueError:
+                If the sink has been closed.
+        """
+        lines = [encode_entry(entry) for entry in entries]
+
+        with self.__lock:
+            if self.__closed:
+                raise ValueError('Cannot write to a closed HistorySink.')
+
+            for line in lines:
+                self.__buffer.append(line)
+                self.__buffered += len(line)
+
+            if self.__buffered >= self.__buffer_size:
+                self.__flush()
+
+        return len(lines)
+
+    def flush(self) -> None:
+        """
+        Write any buffered entries to the file.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__flush()
+
+    def close(self) -> None:
+        """
+        Write any buffered entries to the file, and close the sink.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            if not self.__closed:
+                self.__flush()
+                self.__closed = True
+
+    def __flush(self) -> None:
+        # Must be called with `self.__lock` held.
+        if not self.__buffer:
+            return
+
+        data = b''.join(self.__buffer)
+        self.__buffer = []
+        self.__buffered = 0
+
+        if self.__size is None:
+            self.__path.parent.mkdir(parents=True, exist_ok=True)
+
+            try:
+                self.__size = self.__path.stat().st_size
+            except FileNotFoundError:
+                self.__size = 0
+
+        if self.__max_bytes is not None and self.__size and self.__size + len(data) > self.__max_bytes:
+            self.__rotate()
+
+        # Opened per flush, so nothing is held open between checkpoints, and other processes can read (or rotate away)
+        # the file at any time.
+        with open(self.__path, 'ab') as file:
+            file.write(data)
+
+        self.__size += len(data)
+
+    def __rotate(self) -> None:
+        path = str(self.__path)
+
+        if self.__backup_count:
+            for number in range(self.__backup_count - 1, 0, -1):
+                source = f'{path}.{number}'
+
+                if os.path.exists(source):
+                    os.replace(source, f'{path}.{number + 1}')
+
+            os.replace(path, f'{path}.1')
+        else:
+            os.remove(path)
+
+        self.__size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f'<HistorySink@{hex(id(self))}: {self.__path} | {len(self.__buffer)} entries buffered>'
+
+
+def encode_entry(entry: HistoryEntry) -> bytes:
+    """
+    Encode a history entry as a line of JSON.
+
+    Parameters:
+        entry (HistoryEntry):
+            The entry.
+
+    Returns:
+        bytes:
+            The line, including its trailing newline.
+    """
+    return (json.dumps(entry._asdict(), separators=(',', ':')) + '\n').encode()
+
+
+def rotated_paths(path: Union[str, Path]) -> List[Path]:
+    """
+    Get the files a :class:`HistorySink` has written to a path, oldest first.
+
+    Parameters:
+        path (Union[str, Path]):
+            The path the sink writes to.
+
+    Returns:
+        List[Path]:
+            The rotated files that exist (the highest numbered first), then the path itself, if it exists.
+    """
+    path = Path(path).expanduser()
+    backups = []
+
+    for candidate in path.parent.glob(f'{path.name}.*'):
+        suffix = candidate.name[len(path.name) + 1:]
+
+        if suffix.isdigit():
+            backups.append((int(suffix), candidate))
+
+    paths = [candidate for _, candidate in sorted(backups, reverse=True)]
+
+    if path.exists():
+        paths.append(path)
+
+    return paths
+
+
+def load_history(path: Union[str, Path], include_rotated: bool = False) -> Iterator[HistoryEntry]:
+    """
+    Stream the entries of a history file written by a :class:`HistorySink`, oldest first.
+
+    Lines that can't be decoded (e.g. the last line of a file whose writer crashed part-way through a write) are
+    skipped.
+
+    Parameters:
+        path (Union[str, Path]):
+            The file to read.
+
+        include_rotated (bool):
+            A flag indicating whether to read the file's rotated backups (`path.N` ... `path.1`) first. Defaults to
+            False.
+
+    Returns:
+        Iterator[HistoryEntry]:
+            The entries.
+    """
+    paths = rotated_paths(path) if include_rotated else [Path(path).expanduser()]
+
+    for file_path in paths:
+        with open(file_path, 'rb') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+
+                try:
+                    yield HistoryEntry(**json.loads(line))
+                except (ValueError, TypeError):
+                    continue
+
+
+__all__ = [
+    'DEFAULT_BACKUP_COUNT',
+    'DEFAULT_BUFFER_SIZE',
+    'DEFAULT_MAX_BYTES',
+    'HistorySink',
+    'encode_entry',
+    'load_history',
+    'rotated_paths',
+]
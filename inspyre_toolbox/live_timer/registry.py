@@ -0,0 +1,471 @@
+"""
+
+A process-wide registry of named timers, for latency reporting.
+
+Wrap a function or a block of code with :func:`timed` and each call's duration is recorded into a
+:class:`~inspyre_toolbox.live_timer.histogram.LatencyHistogram` kept under that name, from which percentiles, rates
+and counts can be reported at any time:
+
+    >>> from inspyre_toolbox.live_timer import timed, REGISTRY
+    >>>
+    >>> @timed('db.query')
+    ... def query(sql):
+    ...     ...
+    >>>
+    >>> with timed('render'):
+    ...     render_page()
+    >>>
+    >>> REGISTRY.report()['db.query']['p99']
+
+Registries can be merged, so timings gathered separately (e.g. in other processes) can be combined into one report.
+
+"""
+from functools import wraps
+from threading import Lock, local
+from typing import Callable, Dict, Iterable, List, Optional
+
+from inspyre_toolbox.live_timer.clock import Clock, DEFAULT_CLOCK, ns_to_seconds
+from inspyre_toolbox.live_timer.histogram import DEFAULT_SIGNIFICANT_BITS, LatencyHistogram, ShardedHistogram
+
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+
+class NamedTimer:
+    """
+    A named timer, which records durations into a latency histogram.
+
+    Timers can be shared between threads; each thread records into its own shard of the histogram (see
+    :class:`~inspyre_toolbox.live_timer.histogram.ShardedHistogram`), which are merged when the timer is read.
+
+    NamedTimers are usually made by a :class:`TimerRegistry` (see :meth:`TimerRegistry.get`), rather than directly.
+
+    Parameters:
+        name (str):
+            The name of the timer.
+
+        clock (Optional[Clock]):
+            The monotonic clock, returning integer nanoseconds, to time with. Defaults to
+            :data:`~inspyre_toolbox.live_timer.clock.DEFAULT_CLOCK`.
+
+        significant_bits (int):
+            The precision of the histogram. (See :class:`LatencyHistogram`)
+    """
+
+    def __init__(self, name: str, clock: Optional[Clock] = None, significant_bits: int = DEFAULT_SIGNIFICANT_BITS):
+        self.__name = name
+        self.__clock = clock or DEFAULT_CLOCK
+        self.__histogram = ShardedHistogram(significant_bits)
+        self.__created_ns = self.__clock()
+
+    @property
+    def name(self) -> str:
+        """The name of the timer."""
+        return self.__name
+
+    @property
+    def clock(self) -> Clock:
+        """The clock the timer times with."""
+        return self.__clock
+
+    @property
+    def histogram(self) -> LatencyHistogram:
+        """A copy of the timer's histogram, with every thread's durations merged."""
+        return self.__histogram.snapshot()
+
+    @property
+    def live_histogram(self) -> ShardedHistogram:
+        """
+        The timer's histogram itself (not a copy), e.g. to read its non-empty buckets without merging every thread's
+        durations into a new histogram.
+        """
+        return self.__histogram
+
+    @property
+    def count(self) -> int:
+        """The number of durations recorded."""
+        return self.__histogram.count
+
+    def record(self, duration_ns: int) -> None:
+        """
+        Record a duration.
+
+        Parameters:
+            duration_ns (int):
+                The duration, in nanoseconds.
+
+        Returns:
+            None
+        """
+        self.__histogram.record(duration_ns)
+
+    def merge(self, histogram: LatencyHistogram) -> None:
+        """
+        Add the durations recorded in a histogram (e.g. one from another process) to this timer.
+
+        Parameters:
+            histogram (LatencyHistogram):
+                The histogram to merge in.
+
+        Returns:
+            None
+        """
+        self.__histogram.merge(histogram)
+
+    def drain(self) -> LatencyHistogram:
+        """
+        Get the timer's histogram and forget its durations, in one step, so none recorded meanwhile are lost.
+
+        Unlike :meth:`reset`, the rate keeps being measured from when the timer was created.
+
+        Returns:
+            LatencyHistogram:
+                The durations recorded since the timer was created (or last drained or reset).
+        """
+        return self.__histogram.drain()
+
+    def reset(self) -> None:
+        """
+        Forget every recorded duration, and start measuring the rate afresh.
+
+        Returns:
+            None
+        """
+        self.__histogram.clear()
+        self.__created_ns = self.__clock()
+
+    def report(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict:
+        """
+        Report the timer's statistics.
+
+        Parameters:
+            percentiles (Iterable[float]):
+                The percentiles to report. Defaults to (50, 95, 99).
+
+        Returns:
+            dict:
+                The 'count'; the 'rate' (durations recorded per second since the timer was created or reset); the
+                'total', 'min', 'mean' and 'max' durations; and each percentile, keyed as e.g. 'p99' (or 'p99.9').
+                Durations are in seconds, and are None if nothing has been recorded.
+        """
+        histogram = self.__histogram.snapshot()
+        lifetime_ns = self.__clock() - self.__created_ns
+
+        def seconds(ns):
+            return None if ns is None else ns_to_seconds(ns)
+
+        report = {
+                'count': histogram.count,
+                'rate':  histogram.count / ns_to_seconds(lifetime_ns) if lifetime_ns > 0 else 0.0,
+                'total': ns_to_seconds(histogram.sum),
+                'min':   seconds(histogram.min),
+                'mean':  seconds(histogram.mean),
+                'max':   seconds(histogram.max),
+                }
+
+        for percentile, value in histogram.percentiles(percentiles).items():
+            report[f'p{percentile:g}'] = seconds(value)
+
+        return report
+
+    def time(self) -> 'timed':
+        """
+        Get a context manager (or decorator) that records durations into this timer.
+
+        Returns:
+            timed:
+                The context manager.
+        """
+        return timed(self)
+
+    def __repr__(self):
+        return f'<NamedTimer@{hex(id(self))}: {self.__name} | {self.count} durations>'
+
+
+class TimerRegistry:
+    """
+    A registry of named timers.
+
+    Most code should use the process-wide :data:`REGISTRY` (through :func:`timed` and :func:`get_timer`).
+
+    Parameters:
+        clock (Optional[Clock]):
+            The monotonic clock, returning integer nanoseconds, for the registry's timers to time with. Defaults to
+            :data:`~inspyre_toolbox.live_timer.clock.DEFAULT_CLOCK`.
+
+        significant_bits (int):
+            The precision of the timers' histograms. (See :class:`LatencyHistogram`)
+    """
+
+    def __init__(self, clock: Optional[Clock] = None, significant_bits: int = DEFAULT_SIGNIFICANT_BITS):
+        self.__clock = clock or DEFAULT_CLOCK
+        self.__significant_bits = significant_bits
+        self.__timers: Dict[str, NamedTimer] = {}
+        self.__lock = Lock()
+
+    def get(self, name: str) -> NamedTimer:
+        """
+        Get a timer by name, creating it if needed.
+
+        Parameters:
+            name (str):
+                The name of the timer.
+
+        Returns:
+            NamedTimer:
+                The timer.
+        """
+        try:
+            return self.__timers[name]
+        except KeyError:
+            with self.__lock:
+                if name not in self.__timers:
+                    self.__timers[name] = NamedTimer(name, self.__clock, self.__significant_bits)
+
+                return self.__timers[name]
+
+    def find(self, name: str) -> Optional[NamedTimer]:
+        """
+        Get a timer by name, without creating it.
+
+        Parameters:
+            name (str):
+                The name of the timer.
+
+        Returns:
+            Optional[NamedTimer]:
+                The timer, or None if there's no timer by that name.
+        """
+        return self.__timers.get(name)
+
+    def names(self) -> List[str]:
+        """
+        Get the names of the registered timers.
+
+        Returns:
+            List[str]:
+                The names, sorted.
+        """
+        with self.__lock:
+            names = list(self.__timers)
+
+        return sorted(names)
+
+    def histograms(self) -> Dict[str, LatencyHistogram]:
+        """
+        Get a copy of each timer's histogram, e.g. to send to another process to be merged.
+
+        Returns:
+            Dict[str, LatencyHistogram]:
+                The histograms, by timer name.
+        """
+        return {name: timer.histogram for name, timer in list(self.__timers.items())}
+
+    def drain(self) -> Dict[str, LatencyHistogram]:
+        """
+        Get each timer's histogram and forget its durations (see :meth:`NamedTimer.drain`), e.g. to send them to
+        another process without counting any duration twice.
+
+        Returns:
+            Dict[str, LatencyHistogram]:
+                The histograms, by timer name.
+        """
+        return {name: timer.drain() for name, timer in list(self.__timers.items())}
+
+    def merge(self, histograms: Dict[str, LatencyHistogram]) -> None:
+        """
+        Merge histograms (e.g. from another registry's :meth:`histograms`) into this registry's timers.
+
+        Parameters:
+            histograms (Dict[str, LatencyHistogram]):
+                The histograms, by timer name.
+
+        Returns:
+            None
+        """
+        for name, histogram in histograms.items():
+            self.get(name).merge(histogram)
+
+    def report(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, dict]:
+        """
+        Report every timer's statistics.
+
+        Parameters:
+            percentiles (Iterable[float]):
+                The percentiles to report. Defaults to (50, 95, 99).
+
+        Returns:
+            Dict[str, dict]:
+                Each timer's report (see :meth:`NamedTimer.report`), by name.
+        """
+        percentiles = tuple(percentiles)
+
+        with self.__lock:
+            timers = sorted(self.__timers.items())
+
+        return {name: timer.report(percentiles) for name, timer in timers}
+
+    def format_report(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> str:
+        """
+        Format every timer's statistics as a table, with durations in milliseconds.
+
+        Parameters:
+            percentiles (Iterable[float]):
+                The percentiles to report. Defaults to (50, 95, 99).
+
+        Returns:
+            str:
+                The table.
+        """
+        percentiles = tuple(percentiles)
+        columns = ['count', 'rate', 'mean', 'max'] + [f'p{percentile:g}' for percentile in percentiles]
+        reports = self.report(percentiles)
+        width = max([len('name')] + [len(name) for name in reports])
+
+        lines = [f"{'name':<{width}}" + ''.join(f'{column:>12}' for column in columns)]
+
+        for name, report in reports.items():
+            cells = [f"{report['count']:>12,}", f"{report['rate']:>10,.1f}/s"]
+
+            for column in columns[2:]:
+                value = report[column]
+                cells.append(f'{"-":>12}' if value is None else f'{value * 1000:>10,.3f}ms')
+
+            lines.append(f'{name:<{width}}' + ''.join(cells))
+
+        return '\n'.join(lines)
+
+    def reset(self) -> None:
+        """
+        Reset every timer. (See :meth:`NamedTimer.reset`)
+
+        Returns:
+            None
+        """
+        for timer in list(self.__timers.values()):
+            timer.reset()
+
+    def clear(self) -> None:
+        """
+        Remove every timer.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__timers.clear()
+
+    def __contains__(self, name):
+        return name in self.__timers
+
+    def __len__(self):
+        return len(self.__timers)
+
+
+REGISTRY = TimerRegistry()
+""" The process-wide timer registry. """
+
+
+def get_timer(name: str) -> NamedTimer:
+    """
+    Get a named timer from the process-wide registry, creating it if needed.
+
+    Parameters:
+        name (str):
+            The name of the timer.
+
+    Returns:
+        NamedTimer:
+            The timer.
+    """
+    return REGISTRY.get(name)
+
+
+class timed:
+    """
+    Time a block of code or a function, recording each duration into a named timer.
+
+    Use it as a context manager:
+
+        >>> with timed('render'):
+        ...     render_page()
+
+    or as a decorator (when no name is given, the function's qualified name is used):
+
+        >>> @timed('db.query')
+        ... def query(sql):
+        ...     ...
+        >>>
+        >>> @timed
+        ... def parse(text):
+        ...     ...
+
+    One `timed` context manager can be shared between threads, and nested (e.g. in a recursive function); each
+    thread keeps its own stack of start times.
+
+    Parameters:
+        name (Optional[Union[str, NamedTimer]]):
+            The name of the timer (or the timer itself). Required when used as a context manager.
+
+        registry (Optional[TimerRegistry]):
+            The registry to find the timer in. Defaults to the process-wide :data:`REGISTRY`.
+    """
+    __slots__ = ('__name', '__registry', '__timer', '__local')
+
+    def __new__(cls, name=None, registry: Optional[TimerRegistry] = None):
+        # Used as a bare decorator (@timed), the function to time is passed in place of the name.
+        if callable(name) and not isinstance(name, (str, NamedTimer)):
+            return cls(registry=registry)(name)
+
+        return super().__new__(cls)
+
+    def __init__(self, name=None, registry: Optional[TimerRegistry] = None):
+        self.__name = name
+        self.__registry = REGISTRY if registry is None else registry
+        self.__timer = None
+        self.__local = local()
+
+    def __resolve(self, default_name: Optional[str] = None) -> NamedTimer:
+        if isinstance(self.__name, NamedTimer):
+            return self.__name
+
+        name = self.__name or default_name
+
+        if name is None:
+            raise ValueError('A name is needed to use timed() as a context manager.')
+
+        return self.__registry.get(name)
+
+    def __enter__(self):
+        timer = self.__timer
+
+        if timer is None:
+            timer = self.__timer = self.__resolve()
+
+        try:
+            starts = self.__local.starts
+        except AttributeError:
+            starts = self.__local.starts = []
+
+        starts.append(timer.clock())
+
+        return timer
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        timer = self.__timer
+        timer.record(timer.clock() - self.__local.starts.pop())
+
+    def __call__(self, func: Callable) -> Callable:
+        timer = self.__resolve(f'{func.__module__}.{func.__qualname__}')
+        clock = timer.clock
+        record = timer.record
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start_ns = clock()
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(clock() - start_ns)
+
+        return wrapper
@@ -0,0 +1,203 @@
+"""
+
+A low-overhead stopwatch for timing hot code paths.
+
+:class:`Stopwatch` has the same start/pause/unpause/stop semantics as :class:`~inspyre_toolbox.live_timer.Timer`, but
+keeps no history, does no logging and has no per-instance `__dict__`, so a start/stop pair costs well under a
+microsecond. Use `Timer` when you want a history of actions or a live display; use `Stopwatch` inside loops.
+
+"""
+from typing import Optional
+
+from inspyre_toolbox.live_timer.clock import Clock, DEFAULT_CLOCK, ns_to_seconds
+from inspyre_toolbox.live_timer.errors import TimerNotRunningError, TimerNotStartedError
+
+
+class Stopwatch:
+    """
+    A lightweight stopwatch.
+
+    Parameters:
+        clock (Optional[Clock]):
+            The monotonic clock, returning integer nanoseconds, to time with. Defaults to
+            :data:`~inspyre_toolbox.live_timer.clock.DEFAULT_CLOCK`.
+
+        auto_start (bool):
+            Start the stopwatch straight away. Defaults to False.
+
+    Example:
+        >>> stopwatch = Stopwatch(auto_start=True)
+        >>> do_work()
+        >>> stopwatch.stop()
+        >>> stopwatch.elapsed
+        0.0123
+
+        It can also be used as a context manager, which starts it on entry and stops it on exit:
+
+        >>> with Stopwatch() as stopwatch:
+        ...     do_work()
+    """
+    __slots__ = ('__clock', '__start_ns', '__stop_ns', '__pause_start_ns', '__paused_ns')
+
+    def __init__(self, clock: Optional[Clock] = None, auto_start: bool = False):
+        self.__clock = clock or DEFAULT_CLOCK
+        self.__start_ns = None
+        self.__stop_ns = None
+        self.__pause_start_ns = None
+        self.__paused_ns = 0
+
+        if auto_start:
+            self.start()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.running:
+            self.stop()
+
+    @property
+    def started(self) -> bool:
+        """Whether the stopwatch has been started."""
+        return self.__start_ns is not None
+
+    @property
+    def running(self) -> bool:
+        """Whether the stopwatch has been started and not stopped (it may be paused)."""
+        return self.__start_ns is not None and self.__stop_ns is None
+
+    @property
+    def paused(self) -> bool:
+        """Whether the stopwatch is paused."""
+        return self.__pause_start_ns is not None
+
+    @property
+    def stopped(self) -> bool:
+        """Whether the stopwatch has been stopped."""
+        return self.__stop_ns is not None
+
+    @property
+    def elapsed_ns(self) -> int:
+        """
+        The time elapsed since the stopwatch was started (until it was stopped), less any time spent paused, in
+        integer nanoseconds.
+        """
+        if self.__start_ns is None:
+            raise TimerNotStartedError(skip_print=True)
+
+        end = self.__clock() if self.__stop_ns is None else self.__stop_ns
+        paused = self.__paused_ns
+
+        if self.__pause_start_ns is not None:
+            paused += end - self.__pause_start_ns
+
+        return end - self.__start_ns - paused
+
+    @property
+    def elapsed(self) -> float:
+        """The elapsed time (see `elapsed_ns`), in seconds."""
+        return ns_to_seconds(self.elapsed_ns)
+
+    def start(self) -> None:
+        """
+        Start (or start over) the stopwatch.
+
+        Returns:
+            None
+        """
+        self.__start_ns = self.__clock()
+        self.__stop_ns = None
+        self.__pause_start_ns = None
+        self.__paused_ns = 0
+
+    def pause(self) -> bool:
+        """
+        Pause the running stopwatch.
+
+        Returns:
+            bool:
+                True if the stopwatch was paused, False if it already was.
+
+        Raises:
+            TimerNotStartedError:
+                If the stopwatch hasn't been started.
+
+            TimerNotRunningError:
+                If the stopwatch has been stopped.
+        """
+        now = self.__clock()
+        self.__check_running()
+
+        if self.__pause_start_ns is not None:
+            return False
+
+        self.__pause_start_ns = now
+        return True
+
+    def unpause(self) -> bool:
+        """
+        Un-pause the running stopwatch.
+
+        Returns:
+            bool:
+                True if the stopwatch was un-paused, False if it wasn't paused.
+
+        Raises:
+            TimerNotStartedError:
+                If the stopwatch hasn't been started.
+
+            TimerNotRunningError:
+                If the stopwatch has been stopped.
+        """
+        now = self.__clock()
+        self.__check_running()
+
+        if self.__pause_start_ns is None:
+            return False
+
+        self.__paused_ns += now - self.__pause_start_ns
+        self.__pause_start_ns = None
+        return True
+
+    def stop(self) -> int:
+        """
+        Stop the stopwatch.
+
+        Returns:
+            int:
+                The elapsed time, in nanoseconds.
+
+        Raises:
+            TimerNotStartedError:
+                If the stopwatch hasn't been started.
+
+            TimerNotRunningError:
+                If the stopwatch has already been stopped.
+        """
+        now = self.__clock()
+        self.__check_running()
+
+        if self.__pause_start_ns is not None:
+            self.__paused_ns += now - self.__pause_start_ns
+            self.__pause_start_ns = None
+
+        self.__stop_ns = now
+
+        return now - self.__start_ns - self.__paused_ns
+
+    def __check_running(self) -> None:
+        if self.__start_ns is None:
+            raise TimerNotStartedError(skip_print=True)
+
+        if self.__stop_ns is not None:
+            raise TimerNotRunningError(skip_print=True)
+
+    def __repr__(self):
+        if not self.started:
+            state = 'Not Started'
+        else:
+            state = 'Stopped' if self.stopped else 'Paused' if self.paused else 'Running'
+            state += f' | Elapsed: {self.elapsed:.6f}s'
+
+        return f'<Stopwatch@{hex(id(self))}: {state}>'
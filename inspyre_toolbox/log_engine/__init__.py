@@ -1,4 +1,4 @@
-from inspy_logger import InspyLogger
+from inspy_logger import InspyLogger, Loggable
 
 from inspyre_toolbox.common.about.package import PLATFORM_DIRS
 from inspyre_toolbox.settings import log_level as INSPY_LOG_LEVEL
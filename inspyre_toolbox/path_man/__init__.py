@@ -1,14 +1,40 @@
 import os
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, TypeVar, Union
+from typing import Dict, Iterable, List, NamedTuple, Optional, TypeVar, Union
 from warnings import warn
 
+from inspyre_toolbox.path_man.index import DirectoryIndex
 from inspyre_toolbox.syntactic_sweets.classes.decorators import validate_type
 from inspyre_toolbox.syntactic_sweets.classes.decorators.freeze import freeze_property
 
 PathLike = TypeVar("PathLike", str, bytes, Path, None)
 
 
+class PathCheckResult(NamedTuple):
+    """
+    The result of checking a single path with :func:`check_paths`.
+
+    Attributes:
+        path (Path):
+            The provisioned path that was checked.
+
+        exists (bool):
+            Whether the path exists.
+
+        type (Optional[str]):
+            One of 'file', 'directory', or 'other'. `None` if the path does not exist.
+
+        size (Optional[int]):
+            The size of the file, in bytes. `None` if the path is not a file.
+    """
+    path: Path
+    exists: bool
+    type: Optional[str] = None
+    size: Optional[int] = None
+
+
 def __normalize_file_types(file_types: Optional[Union[str, List[str]]]) -> List[str]:
     """Normalize file types to a list of strings."""
     if file_types is None:
@@ -102,6 +128,164 @@ class ISTB_Path:
         return str(self.path)
 
 
+@lru_cache(maxsize=4096)
+def _resolve_interned(path: Path) -> Path:
+    """Resolve an absolute path once, and hand back the same result every time it's resolved after that."""
+    return path.resolve()
+
+
+def _intern_prepared_path(
+        path: Union[str, Path],
+        do_not_expand: bool = False,
+        do_not_resolve: bool = False,
+        do_not_convert: bool = False,
+        do_not_provision: bool = False,
+        **kwargs
+        ) -> Path:
+    """
+    Prepare a path as :func:`prepare_path` does, interning the resolved path.
+
+    Only resolving is interned; it's the expensive part, and has no side effects. The path is still checked (and
+    created, if need be) every time.
+    """
+    if do_not_provision or do_not_resolve or (isinstance(path, str) and do_not_convert):
+        return prepare_path(path, do_not_expand=do_not_expand, do_not_resolve=do_not_resolve,
+                            do_not_convert=do_not_convert, do_not_provision=do_not_provision, **kwargs)
+
+    path = Path(path)
+
+    if not do_not_expand:
+        path = path.expanduser()
+
+    # Interned by absolute path, so a relative path is resolved against the current working directory every time.
+    path = _resolve_interned(Path(os.getcwd(), path))
+
+    # The path is already resolved, so an existing one needs no more than the one check.
+    if not kwargs.get('do_not_check_if_exists') and path.exists():
+        kwargs['do_not_check_if_exists'] = True
+
+    return prepare_path(path, do_not_provision=True, **kwargs)
+
+
+class ISTB_FastPath:
+    """
+    A lightweight, `__slots__`-based take on :class:`ISTB_Path`.
+
+    `ISTB_FastPath` behaves like :class:`ISTB_Path`, but skips the property decorator stack on construction and
+    interns resolved paths, so preparing the same path many times only resolves it once. Use it when creating large
+    numbers of path objects.
+
+    Note:
+        Because resolved paths are interned, a symlink changed after a path through it was prepared isn't followed
+        again. Call :meth:`clear_prepared_cache` to start over.
+
+    Parameters:
+        path (Union[str, Path]):
+            The path.
+
+        auto_prepare (bool):
+            Whether to prepare the path on creation. Defaults to False.
+
+        **kwargs:
+            Keyword arguments passed to :func:`prepare_path` if `auto_prepare` is True.
+
+    Example:
+        >>> paths = ISTB_FastPath.prepare_all(['~/Documents', '~/Pictures'])
+        >>> paths[0].path
+        PosixPath('/home/taylor/Documents')
+    """
+    __slots__ = ('__path', '__prepared', '__auto_prepare')
+
+    def __init__(self, path: Union[str, Path], auto_prepare: bool = False, **kwargs):
+        if not isinstance(auto_prepare, bool):
+            raise TypeError(f"Value must be of type bool, got type {type(auto_prepare).__name__}")
+
+        self.__path = path
+        self.__prepared = False
+        self.__auto_prepare = auto_prepare
+
+        if auto_prepare:
+            self.prepare(**kwargs)
+
+    @classmethod
+    def prepare_all(cls, paths: Iterable[Union[str, Path]], **kwargs) -> List['ISTB_FastPath']:
+        """
+        Create and prepare a path object for each of the given paths.
+
+        Parameters:
+            paths (Iterable[Union[str, Path]]):
+                The paths.
+
+            **kwargs:
+                Keyword arguments passed to :func:`prepare_path`.
+
+        Returns:
+            List[ISTB_FastPath]:
+                The prepared path objects, in the same order as `paths`.
+        """
+        results = []
+
+        for path in paths:
+            obj = cls.__new__(cls)
+            obj.__path = _intern_prepared_path(path, **kwargs)
+            obj.__prepared = True
+            obj.__auto_prepare = False
+            results.append(obj)
+
+        return results
+
+    @staticmethod
+    def clear_prepared_cache() -> None:
+        """
+        Forget every interned resolved path.
+        """
+        _resolve_interned.cache_clear()
+
+    @property
+    def auto_prepare(self) -> bool:
+        return self.__auto_prepare
+
+    @property
+    def exists(self) -> bool:
+        return self.__path.exists()
+
+    @property
+    def parent(self) -> Path:
+        return self.__path.parent
+
+    @property
+    def path(self) -> Union[str, Path]:
+        return self.__path
+
+    @property
+    def prepared(self) -> bool:
+        return self.__prepared
+
+    def prepare(self, **kwargs) -> Path:
+        """
+        Prepare the path with :func:`prepare_path`, if it hasn't been prepared already.
+
+        Parameters:
+            **kwargs:
+                Keyword arguments passed to :func:`prepare_path`.
+
+        Returns:
+            Path:
+                The prepared path.
+        """
+        if not self.__prepared:
+            self.__path = _intern_prepared_path(self.__path, **kwargs)
+            self.__prepared = True
+
+        return self.__path
+
+    def __str__(self):
+        return str(self.__path)
+
+    def __repr__(self):
+        return f'<ISTB_FastPath@{hex(id(self))}: {self.__path} | Prepared: {self.__prepared}>'
+
+
 def create_directory(
         directory: Union[str, bytes, os.PathLike],
         do_not_prepare: bool = False,
@@ -203,6 +387,25 @@ def check_path(
     return path.exists() if isinstance(path, Path) else False
 
 
+def __provision_for_check(
+        path: Union[str, Path],
+        do_not_expand: bool = False,
+        do_not_resolve: bool = False,
+        do_not_convert: bool = False,
+        do_not_provision: bool = False,
+        ) -> Optional[Path]:
+    """Provision a path for one of the `check_*` functions, returning `None` if it can't be checked."""
+    if not do_not_provision:
+        path = provision_path(
+                path,
+                do_not_convert=do_not_convert,
+                do_not_expand=do_not_expand,
+                do_not_resolve=do_not_resolve
+                )
+
+    return path if isinstance(path, Path) else None
+
+
 def check_directory(
         path: Union[str, Path],
         **kwargs
@@ -222,13 +425,15 @@ def check_directory(
             The directory to check.
 
         **kwargs:
-            Additional keyword arguments.
+            Additional keyword arguments, passed along to :func:`provision_path`.
 
     Returns:
         bool:
             A flag indicating whether the directory is valid.
     """
-    return path.is_dir() if check_path(path, **kwargs) else False
+    path = __provision_for_check(path, **kwargs)
+
+    return path is not None and path.is_dir()
 
 
 def check_file(
@@ -244,13 +449,155 @@ def check_file(
             The file to check.
 
         **kwargs:
-            Additional keyword arguments.
+            Additional keyword arguments, passed along to :func:`provision_path`.
 
     Returns:
         bool:
             A flag indicating whether the file is valid.
     """
-    return path.is_file() if check_path(path, **kwargs) else False
+    path = __provision_for_check(path, **kwargs)
+
+    return path is not None and path.is_file()
+
+
+def __check_entry(path: Path, entry: os.DirEntry) -> PathCheckResult:
+    """Build a check result from a directory entry gathered by `os.scandir`."""
+    try:
+        if entry.is_dir():
+            return PathCheckResult(path, True, 'directory')
+
+        if entry.is_file():
+            return PathCheckResult(path, True, 'file', entry.stat().st_size)
+
+        # Neither a file nor a directory; make sure it isn't a dangling symlink.
+        entry.stat()
+    except OSError:
+        return PathCheckResult(path, False)
+
+    return PathCheckResult(path, True, 'other')
+
+
+def __check_single(path: Path) -> PathCheckResult:
+    """Build a check result for a single path with one `stat` call."""
+    try:
+        st = path.stat()
+    except (OSError, ValueError):
+        return PathCheckResult(path, False)
+
+    if stat.S_ISDIR(st.st_mode):
+        return PathCheckResult(path, True, 'directory')
+
+    if stat.S_ISREG(st.st_mode):
+        return PathCheckResult(path, True, 'file', st.st_size)
+
+    return PathCheckResult(path, True, 'other')
+
+
+def check_paths(
+        paths: Iterable[Union[str, Path]],
+        do_not_expand: bool = False,
+        do_not_resolve: bool = False,
+        do_not_convert: bool = False,
+        do_not_provision: bool = False,
+        ) -> Dict[Union[str, Path], PathCheckResult]:
+    """
+    Check the existence, type, and size of many paths at once.
+
+    Rather than stat-ing each path on its own, the paths are grouped by their parent directory and each parent is
+    listed with a single `os.scandir` call. Parents that only hold one of the requested paths are checked with a
+    plain `stat`, as that is cheaper than listing the whole directory. Paths the listing doesn't name exactly are
+    `stat`-ed too, so they're found on case-insensitive filesystems.
+
+    Note:
+        Provisioning a path involves converting it to a Path object, expanding it, and resolving it.
+
+    Parameters:
+        paths (Iterable[Union[str, Path]]):
+            The paths to check.
+
+        do_not_expand (bool):
+            A flag indicating whether to expand the paths.
+
+        do_not_resolve (bool):
+            A flag indicating whether to resolve the paths.
+
+        do_not_convert (bool):
+            A flag indicating whether to convert the paths to Path objects.
+
+        do_not_provision (bool):
+            A flag indicating whether to provision the paths.
+
+    Returns:
+        Dict[Union[str, Path], PathCheckResult]:
+            A mapping of each path, as it was passed in, to its :class:`PathCheckResult`.
+
+    Raises:
+        ValueError:
+            If any of the paths are invalid.
+
+    Example:
+        >>> results = check_paths(['~/.bashrc', '~/Documents', '~/not-a-thing'])
+        >>> results['~/.bashrc']
+        PathCheckResult(path=PosixPath('/home/taylor/.bashrc'), exists=True, type='file', size=3771)
+        >>> results['~/not-a-thing'].exists
+        False
+    """
+    results = {}
+    by_parent = {}
+
+    for original in paths:
+        if original in results:
+            continue
+
+        path = __provision_for_check(
+                original,
+                do_not_expand=do_not_expand,
+                do_not_resolve=do_not_resolve,
+                do_not_convert=do_not_convert,
+                do_not_provision=do_not_provision
+                )
+
+        if path is None:
+            raise ValueError(f"Invalid path: {original}!")
+
+        # Placeholder, to keep the results in the order the paths were given.
+        results[original] = None
+
+        if path.name and path.name not in ('.', '..'):
+            by_parent.setdefault(path.parent, {}).setdefault(path.name, []).append((original, path))
+        else:
+            # Filesystem roots, and unresolved paths ending in '.' or '..', have no name to look up in their parent.
+            results[original] = __check_single(path)
+
+    for parent, wanted in by_parent.items():
+        if len(wanted) == 1:
+            for original, path in next(iter(wanted.values())):
+                results[original] = __check_single(path)
+            continue
+
+        try:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    for original, path in wanted.pop(entry.name, ()):
+                        results[original] = __check_entry(path, entry)
+
+                    if not wanted:
+                        break
+        except OSError:
+            # The parent couldn't be listed (missing, not a directory, or not readable), so fall back to stat-ing
+            # whatever is left one at a time.
+            for pending in wanted.values():
+                for original, path in pending:
+                    results[original] = __check_single(path)
+            continue
+
+        # Anything left over wasn't in the listing under that exact name, but may still be there under another (e.g. in
+        # another case, on a case-insensitive filesystem), so stat it to be sure.
+        for pending in wanted.values():
+            for original, path in pending:
+                results[original] = __check_single(path)
+
+    return results
 
 
 def prepare_path(
@@ -398,6 +745,7 @@ def gather_files_in_dir(
         ignore_dirs: Optional[List[str]] = None,
         ignore_case: bool = False,
         parent_logger=None,
+        index: Optional[DirectoryIndex] = None,
         **kwargs
         ) -> List[Path]:
     """
@@ -426,6 +774,10 @@ def gather_files_in_dir(
         parent_logger:
             The parent logger to use for the logger for this function.
 
+        index (Optional[DirectoryIndex]):
+            A :class:`DirectoryIndex` to read directory listings from. Directories that haven't changed since the
+            index last saw them are not listed again. If None, the directory is walked with `os.walk`.
+
     Returns:
         List[Path]:
             A list of file-paths for files in the directory.
@@ -445,7 +797,9 @@ def gather_files_in_dir(
     ignore_dirs = __normalize_ignore_dirs(ignore_dirs, ignore_case)
 
     files = []
-    for dir_path, dir_names, file_names in os.walk(directory):
+    walker = os.walk(directory) if index is None else index.walk(directory)
+
+    for dir_path, dir_names, file_names in walker:
         dir_names[:] = __filter_dirs(dir_names, ignore_dirs, ignore_case)
 
         if not recursive:
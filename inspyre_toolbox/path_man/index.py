@@ -0,0 +1,306 @@
+"""
+A persistent, mtime-keyed index of directory listings.
+
+:class:`DirectoryIndex` remembers the listing of every directory it has walked, keyed by that directory's
+``st_mtime_ns``. Adding, removing or renaming an entry bumps a directory's mtime, so on a rescan any directory whose
+mtime hasn't moved can be served straight from the index with a single ``stat`` instead of a full ``scandir``. This
+turns rescans of mostly static trees into work proportional to the number of directories that actually changed.
+
+Note:
+    A directory's mtime does not change when the *contents* of a file in it change, only when entries are added,
+    removed or renamed. The index only caches names, so that is all it needs.
+
+Since:
+    1.6.0
+"""
+import json
+import os
+from pathlib import Path
+from time import time_ns
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+RACY_WINDOW_NS = 2_000_000_000
+"""
+Listings of directories modified less than this many nanoseconds before they were scanned aren't trusted on the next
+scan, since a change landing within the same mtime tick as the scan would otherwise go unnoticed.
+"""
+
+INDEX_FORMAT_VERSION = 2
+""" The version of the index file format; files of any other version are discarded on load. """
+
+
+def _is_names(value) -> bool:
+    return isinstance(value, list) and all(isinstance(name, str) for name in value)
+
+
+def _is_valid_entry(key, entry) -> bool:
+    """
+    Check that an entry read from an index file has the shape `DirectoryIndex` stores: [mtime_ns, dirs, files, links].
+    """
+    if not (isinstance(key, str) and isinstance(entry, list) and len(entry) == 4):
+        return False
+
+    mtime_ns, dir_names, file_names, link_names = entry
+
+    if not isinstance(mtime_ns, int) or isinstance(mtime_ns, bool):
+        return False
+
+    return _is_names(dir_names) and _is_names(file_names) and _is_names(link_names)
+
+
+class DirectoryIndex:
+    """
+    A cache of directory listings that can be persisted between runs.
+
+    Parameters:
+        index_file (Optional[Union[str, Path]]):
+            Where to persist the index. If `None`, the index only lives in memory.
+
+        auto_load (bool):
+            Whether to load `index_file` (if it exists) on creation. Defaults to True.
+
+    Attributes:
+        hits (int):
+            The number of directory listings that were served from the index.
+
+        misses (int):
+            The number of directory listings that had to be read from disk.
+
+    Example:
+        >>> index = DirectoryIndex('~/.cache/my-app/dir-index.json')
+        >>> files = gather_files_in_dir('~/Pictures', recursive=True, index=index)
+        >>> index.save()
+    """
+
+    def __init__(self, index_file: Optional[Union[str, Path]] = None, auto_load: bool = True):
+        self.__index_file = Path(index_file).expanduser() if index_file is not None else None
+        # Each directory's mtime, sub-directory names, file names, and the names of the sub-directories that are
+        # symlinks (which are among the sub-directory names too).
+        self.__entries: Dict[str, Tuple[int, List[str], List[str], List[str]]] = {}
+        self.__dirty = False
+
+        self.hits = 0
+        self.misses = 0
+
+        if auto_load and self.__index_file is not None and self.__index_file.is_file():
+            self.load()
+
+    @classmethod
+    def in_cache_dir(cls, name: str = 'directory_index.json', **kwargs) -> 'DirectoryIndex':
+        """
+        Create an index persisted in the toolbox's user cache directory.
+
+        Parameters:
+            name (str):
+                The name of the index file. Defaults to 'directory_index.json'.
+
+        Returns:
+            DirectoryIndex:
+                The index.
+        """
+        from inspyre_toolbox.common.about.package import PLATFORM_DIRS
+
+        return cls(PLATFORM_DIRS.user_cache_path.joinpath(name), **kwargs)
+
+    @property
+    def index_file(self) -> Optional[Path]:
+        return self.__index_file
+
+    @property
+    def dirty(self) -> bool:
+        """
+        Whether the index has changed since it was last loaded or saved.
+        """
+        return self.__dirty
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, directory):
+        return os.fspath(directory) in self.__entries
+
+    def clear(self) -> None:
+        """
+        Forget every cached listing.
+        """
+        if self.__entries:
+            self.__entries.clear()
+            self.__dirty = True
+
+    def listdir(self, directory: Union[str, Path]) -> Tuple[List[str], List[str]]:
+        """
+        List a directory, using the cached listing if the directory hasn't changed.
+
+        Parameters:
+            directory (Union[str, Path]):
+                The directory to list.
+
+        Returns:
+            Tuple[List[str], List[str]]:
+                The names of the sub-directories and the names of the non-directory entries, split the same way
+                `os.walk` splits them (so symlinks to directories are among the sub-directories).
+
+        Raises:
+            OSError:
+                If the directory can't be stat-ed or listed.
+        """
+        dir_names, file_names, _ = self.__list(os.fspath(directory))
+
+        return dir_names, file_names
+
+    def __list(self, key: str) -> Tuple[List[str], List[str], List[str]]:
+        mtime_ns = os.stat(key).st_mtime_ns
+
+        cached = self.__entries.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            self.hits += 1
+            return list(cached[1]), list(cached[2]), cached[3]
+
+        self.misses += 1
+
+        dir_names = []
+        file_names = []
+        link_names = []
+
+        with os.scandir(key) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if not is_dir:
+                    file_names.append(entry.name)
+                    continue
+
+                dir_names.append(entry.name)
+
+                if entry.is_symlink():
+                    link_names.append(entry.name)
+
+        if time_ns() - mtime_ns >= RACY_WINDOW_NS:
+            self.__entries[key] = (mtime_ns, dir_names, file_names, link_names)
+        else:
+            self.__entries.pop(key, None)
+
+        self.__dirty = True
+
+        return list(dir_names), list(file_names), link_names
+
+    def walk(self, top: Union[str, Path]) -> Iterator[Tuple[str, List[str], List[str]]]:
+        """
+        Walk a directory tree top-down, like `os.walk`, using cached listings where possible.
+
+        As with `os.walk`, callers may prune the walk by modifying the yielded list of directory names in place, and
+        symlinks to directories are listed among the directory names but not descended into.
+
+        Parameters:
+            top (Union[str, Path]):
+                The directory to start from.
+
+        Yields:
+            Tuple[str, List[str], List[str]]:
+                The directory path, its sub-directory names, and its file names.
+        """
+        stack = [os.fspath(top)]
+
+        while stack:
+            dir_path = stack.pop()
+
+            try:
+                dir_names, file_names, link_names = self.__list(dir_path)
+            except OSError:
+                if self.__entries.pop(dir_path, None) is not None:
+                    self.__dirty = True
+                continue
+
+            yield dir_path, dir_names, file_names
+
+            stack.extend(os.path.join(dir_path, name) for name in reversed(dir_names) if name not in link_names)
+
+    def load(self) -> None:
+        """
+        Load the index from `index_file`, replacing whatever is held in memory.
+
+        An index file that can't be read, was written by another version, or holds a malformed entry is discarded,
+        leaving the index empty.
+
+        Raises:
+            ValueError:
+                If there's no `index_file` to load from.
+        """
+        if self.__index_file is None:
+            raise ValueError('This index has no index file to load from!')
+
+        try:
+            with open(self.__index_file, 'r', encoding='utf-8') as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            data = {}
+
+        self.__entries = {}
+        self.__dirty = False
+
+        if not isinstance(data, dict) or data.get('version') != INDEX_FORMAT_VERSION:
+            return
+
+        directories = data.get('directories', {})
+
+        if not isinstance(directories, dict):
+            return
+
+        entries = {}
+
+        for key, entry in directories.items():
+            if not _is_valid_entry(key, entry):
+                return
+
+            mtime_ns, dir_names, file_names, link_names = entry
+            entries[key] = (mtime_ns, dir_names, file_names, link_names)
+
+        self.__entries = entries
+
+    def save(self, force: bool = False) -> None:
+        """
+        Write the index to `index_file`.
+
+        The index is written to a temporary file first and then moved into place, so an interrupted save never leaves
+        a half-written index behind.
+
+        Parameters:
+            force (bool):
+                Write the index even if nothing has changed since it was loaded or last saved. Defaults to False.
+
+        Raises:
+            ValueError:
+                If there's no `index_file` to save to.
+        """
+        if self.__index_file is None:
+            raise ValueError('This index has no index file to save to!')
+
+        if not (self.__dirty or force):
+            return
+
+        self.__index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.__index_file.with_name(f'{self.__index_file.name}.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as fp:
+            json.dump(
+                    {
+                            'version':     INDEX_FORMAT_VERSION,
+                            'directories': self.__entries,
+                            },
+                    fp,
+                    separators=(',', ':')
+                    )
+
+        os.replace(tmp_path, self.__index_file)
+        self.__dirty = False
+
+    def __repr__(self):
+        return f'<DirectoryIndex@{hex(id(self))}: {len(self)} directories | Index file: {self.__index_file}>'
+
+
+__all__ = [
+    'DirectoryIndex',
+    ]
@@ -1,6 +1,6 @@
 #  Copyright (c) 2021. Taylor-Jayde Blackstone <t.blackstone@inspyre.tech> https://inspyre.tech
-import contextlib
 import os
+import signal
 from datetime import datetime
 
 import psutil
@@ -10,6 +10,10 @@ import inspyre_toolbox.settings as it_settings
 from inspyre_toolbox.core_helpers.logging import ISL as InspyLogger, add_isl_child, force_lowkey_log_name
 from inspyre_toolbox.humanize import Numerical
 from inspyre_toolbox.proc_man.errors import NoFoundProcessesError
+from inspyre_toolbox.proc_man.scanner import ProcessInfo, get_username, iter_processes
+from inspyre_toolbox.proc_man.table import ProcessTable
+from inspyre_toolbox.proc_man.terminate import DEFAULT_GRACE, TerminationReport, terminate_processes
+from inspyre_toolbox.proc_man.tree import TreeUsage, descendants, find_tree, kill_tree, tree_usage
 
 fts = datetime.fromtimestamp
 
@@ -56,7 +60,7 @@ def get_own_pid():
     return os.getpid()
 
 
-def get_pid_by_name(name: str = None, case_sensitive=False):
+def get_pid_by_name(name: str = None, case_sensitive=False, table=None):
     """
     Get the process ID (PID) of a process by its name.
 
@@ -65,17 +69,24 @@ def get_pid_by_name(name: str = None, case_sensitive=False):
             The name of the process to find. Defaults to None.
         case_sensitive (bool, optional):
             Whether the search should be case-sensitive. Defaults to False.
+        table (ProcessTable, optional):
+            A process table snapshot to search, so that many lookups share one scan. Defaults to scanning afresh.
 
     Returns:
         list: A list of PIDs matching the given name, or the PID of the current process if no name is provided.
     """
-    return find_all_by_name(name, case_sensitive, ) if name else get_own_pid()
+    return find_all_by_name(name, case_sensitive, table=table) if name else get_own_pid()
 
 
-def find_all_by_name(name, case_sensitive=False, inspy_logger_device=None, on_the_dl=False, colorful_logging=False):
+def find_all_by_name(name, case_sensitive=False, inspy_logger_device=None, on_the_dl=False, colorful_logging=False,
+                     use_procfs=None, table=None):
     """
     Find all running processes by name.
 
+    On Linux, the process table is read straight from /proc (see :mod:`inspyre_toolbox.proc_man.scanner`), reading
+    one small file per process; the owner of each matching process is then looked up, with usernames cached by uid.
+    Elsewhere, psutil is used.
+
     Args:
         name (str):
             The name of the process to find.
@@ -87,17 +98,15 @@ def find_all_by_name(name, case_sensitive=False, inspy_logger_device=None, on_th
             Whether to exclude 'InspyreToolbox' from the logger name. Defaults to False.
         colorful_logging (bool, optional):
             Whether to enable colorful logging. Defaults to False.
+        use_procfs (bool, optional):
+            Whether to read /proc directly. Defaults to doing so where it's available.
+        table (ProcessTable, optional):
+            A process table snapshot to search instead of scanning, so that many lookups share one scan. (See
+            :class:`~inspyre_toolbox.proc_man.table.ProcessTable`)
 
     Returns:
         list: A list of dictionaries containing information about the found processes.
     """
-
-    def add_readable_times(process_list):
-        for proc in process_list:
-            proc['create_time_readable'] = fts(proc['create_time'])
-
-        return process_list
-
     isl_dev = inspy_logger_device
 
     prefix = '' if on_the_dl else 'InspyreToolbox.'
@@ -105,80 +114,89 @@ def find_all_by_name(name, case_sensitive=False, inspy_logger_device=None, on_th
 
     log = add_isl_child(log_name, isl_dev)
 
-    r_null = force_lowkey_log_name or not colorful_logging
     colors = Colors(return_null=not colorful_logging)
 
     procs_found = []
 
     # If we're not being case-sensitive we'll lower the case on 'name'
     if not case_sensitive:
-        log.debug('Searching in case insensitive mode!')
         name = name.lower()
 
-    log.debug(f'Search query: {name}')
-
-    # Iterate through the process list
-    for proc in psutil.process_iter():
-        with contextlib.suppress(psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            # Gather the information of all the currently running processes
-            proc_info = proc.as_dict(
-                    attrs=['pid', 'name', 'create_time', 'username'])
-            log.debug(proc_info)
-
-            # If we're not caring about case let's go ahead and make both
-            # things we're comparing lowercase.
-            proc_name = proc_info['name'] if case_sensitive else proc_info['name'].lower()
-            if name in proc_name:
-                log.debug(f'{colors.green}Found match: {colors.blue}{proc_info["name"]}'
-                          f'({colors.yellow}{proc_info["pid"]}{colors.blue})')
-
-                # Add find to the list we're returning to the caller.
-                procs_found.append(proc_info)
+    # Only the name of each process is looked at while scanning; the rest is only gathered for matches.
+    if table is not None:
+        candidates = table.find_by_name(name, case_sensitive, exact=False)
+    else:
+        candidates = (
+                proc for proc in iter_processes(use_procfs)
+                if name in (proc.name if case_sensitive else proc.name.lower())
+        )
+
+    for proc in candidates:
+        username = get_username(proc.pid)
+
+        # The process went away between the scan and now.
+        if username is None and not psutil.pid_exists(proc.pid):
+            continue
+
+        procs_found.append({
+                'pid':                  proc.pid,
+                'name':                 proc.name,
+                'create_time':          proc.create_time,
+                'username':             username,
+                'create_time_readable': fts(proc.create_time),
+                })
 
-                log.debug(
-                        f'{colors.green}Added {proc_info["pid"]} to found process list')
     num_found = Numerical(len(procs_found), noun='process')
 
-    log.debug(f'Found: {colors.yellow}{num_found.count_noun()}')
-
-    procs_found = add_readable_times(procs_found)
+    # A single log line per search; logging is far costlier than the scan itself.
+    log.debug(f'Found: {colors.yellow}{num_found.count_noun()}{colors.end_color} matching "{name}" '
+              f'(case {"sensitive" if case_sensitive else "insensitive"})')
 
     # Return found process list to caller
     return procs_found
 
 
-def kill_all_in_list(kill_list, inspy_logger_device=None, on_the_dl=False, colorful_logging=False):
+def kill_all_in_list(kill_list, inspy_logger_device=None, on_the_dl=False, colorful_logging=False,
+                     grace=DEFAULT_GRACE, sig=signal.SIGTERM):
     """
     Kill all processes in the provided list.
 
+    Every process is signalled at once, and then all are waited for together; any still running after 'grace'
+    seconds are killed. (See :func:`~inspyre_toolbox.proc_man.terminate.terminate_processes`)
+
     Args:
         kill_list (list):
-            A list of dictionaries containing information about the processes to kill.
+            A list of dictionaries containing information about the processes to kill (as returned by
+            'find_all_by_name'), or of PIDs.
         inspy_logger_device (inspy_logger.InspyLogger().device, optional):
             An instantiated InspyLogger device for logging. Defaults to None.
         on_the_dl (bool, optional):
             Whether to exclude 'InspyreToolbox' from the logger name. Defaults to False.
         colorful_logging (bool, optional):
             Whether to enable colorful logging. Defaults to False.
+        grace (float, optional):
+            The number of seconds to give the processes to exit before they're killed. Defaults to 5.
+        sig (int, optional):
+            The signal to send first. Defaults to SIGTERM.
 
     Returns:
-        None
+        TerminationReport: What happened to each process.
     """
 
     prefix = '' if on_the_dl else 'InspyreToolbox.'
     log_name = f'{prefix}ProcMan.kill_all_in_list'
 
-    log = add_isl_child(log_name, ISL.device)
-
-    log.debug('Logging active')
+    log = add_isl_child(log_name, inspy_logger_device or ISL.device)
 
     colors = Colors(return_null=not colorful_logging)
 
-    missing = 0
+    report = terminate_processes(kill_list, grace=grace, sig=sig)
 
-    for proc in kill_list:
-        log.debug(f'Killing {colors.yellow}{proc["pid"]}')
-        os.kill(proc['pid'], 2)
+    log.debug(f'Stopped {colors.yellow}{len(report.terminated)}{colors.end_color} gracefully, killed '
+              f'{colors.yellow}{len(report.killed)}{colors.end_color}, {len(report.survived)} survived, '
+              f'{len(report.missing)} already gone and {len(report.denied)} denied, in {report.elapsed:.2f}s')
+
+    return report
 
 
 def kill_all_by_name(
@@ -186,11 +204,15 @@ def kill_all_by_name(
         case_sensitive=False,
         inspy_logger_device=None,
         on_the_dl=False,
-        colorful_logging=False
+        colorful_logging=False,
+        grace=DEFAULT_GRACE,
+        sig=signal.SIGTERM
 ):
     """
     Kill all running processes with names containing the given string.
 
+    Unless the current user is an administrator, only their own processes are killed.
+
     Args:
         name (str):
             The name of the process to kill.
@@ -202,12 +224,14 @@ def kill_all_by_name(
             Whether to exclude 'InspyreToolbox' from the logger name. Defaults to False.
         colorful_logging (bool, optional):
             Whether to enable colorful logging. Defaults to False.
+        grace (float, optional):
+            The number of seconds to give the processes to exit before they're killed. Defaults to 5.
+        sig (int, optional):
+            The signal to send first. Defaults to SIGTERM.
 
     Returns:
-        None
+        TerminationReport: What happened to each process.
     """
-    from time import sleep
-
     # Get a logger for logging in logging is enabled.
     log = add_isl_child('proc_man.kill_all_by_name', inspy_logger_device)
 
@@ -221,32 +245,13 @@ def kill_all_by_name(
     procs = find_all_by_name(name, case_sensitive,
                              inspy_logger_device, on_the_dl, colorful_logging)
 
-    log.debug(procs)
-
-    sleep(5)
-
-    # Get the number of running processes found.
-    num_running = Numerical(len(procs), noun='process')
-
-    log.debug(f'Found {num_running.count_noun()}')
-
-    # Gather the username of the current user.
-    username = os.getlogin()
-
-    # Find out if they are an administrator or not.
-    __is_admin = is_admin()
-
-    started_by_user = []
-
-    if not __is_admin:
-        for proc in procs:
-            log.debug(proc['username'])
-            if proc['username'].endswith(username):
-                started_by_user.append(proc)
-
-    started_by_user.reverse()
+    if not is_admin():
+        # The owner of this process, rather than os.getlogin(), which fails without a controlling terminal (e.g.
+        # under a daemon or a service manager).
+        username = get_username(os.getpid())
+        procs = [proc for proc in procs if proc['username'] and proc['username'].endswith(username)]
 
-    kill_all_in_list(started_by_user)
+    return kill_all_in_list(procs, inspy_logger_device, on_the_dl, colorful_logging, grace=grace, sig=sig)
 
 
 def find_by_pid(pid, inspy_logger_device=None):
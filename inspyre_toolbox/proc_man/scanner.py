@@ -0,0 +1,275 @@
+"""
+
+A fast scanner of the process table.
+
+On Linux, :func:`iter_processes` reads each process's name, parent and start time from the one file
+`/proc/<pid>/stat`, rather than going through `psutil.Process` (which reads several files per process for
+`as_dict`). Anything more expensive, like the owner's username, is left for the caller to look up for the processes it
+actually wants, with :func:`get_username` (which caches uid to name lookups). Elsewhere, the scanner falls back to
+`psutil.process_iter`, so callers needn't care which platform they're on.
+
+    >>> [proc.pid for proc in iter_processes() if proc.name == 'python3']
+
+"""
+import os
+import sys
+from functools import lru_cache
+from typing import Iterator, List, NamedTuple, Optional
+
+import psutil
+
+PROC_ROOT = '/proc'
+
+HAS_PROCFS = sys.platform.startswith('linux') and os.path.isdir(os.path.join(PROC_ROOT, 'self'))
+""" Whether the fast, /proc based scanner can be used. """
+
+COMM_LENGTH = 15
+""" The length process names are truncated to in /proc/<pid>/stat. """
+
+
+class ProcessInfo(NamedTuple):
+    """
+    What the scanner knows about a process.
+
+    Attributes:
+        pid (int):
+            The process ID.
+
+        name (str):
+            The process name (as `psutil.Process.name` would report it).
+
+        ppid (int):
+            The process ID of the parent process (0 if it has none).
+
+        create_time (float):
+            The time the process started, in seconds since the epoch.
+    """
+    pid: int
+    name: str
+    ppid: int
+    create_time: float
+
+
+@lru_cache(maxsize=1)
+def _boot_time() -> float:
+    return psutil.boot_time()
+
+
+@lru_cache(maxsize=1)
+def _clock_ticks() -> int:
+    return os.sysconf('SC_CLK_TCK')
+
+
+def _read_stat(pid: int) -> Optional[ProcessInfo]:
+    try:
+        with open(f'{PROC_ROOT}/{pid}/stat', 'rb') as file:
+            data = file.read()
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        return None
+
+    # The name is in parentheses, and may itself contain spaces and parentheses, so split around the last ')'.
+    open_paren = data.find(b'(')
+    close_paren = data.rfind(b')')
+    name = data[open_paren + 1:close_paren].decode('utf-8', 'replace')
+    fields = data[close_paren + 2:].split()
+
+    # Fields after the name, counting from 0: 0 is the state, 1 the parent's pid and 19 the start time in clock ticks.
+    try:
+        ppid = int(fields[1])
+        create_time = _boot_time() + int(fields[19]) / _clock_ticks()
+    except (IndexError, ValueError):
+        return None
+
+    if len(name) >= COMM_LENGTH:
+        name = _extend_name(pid, name)
+
+    return ProcessInfo(pid, name, ppid, create_time)
+
+
+def _extend_name(pid: int, name: str) -> str:
+    # Names are truncated in /proc/<pid>/stat; like psutil, take the full one from the command line if it matches.
+    try:
+        with open(f'{PROC_ROOT}/{pid}/cmdline', 'rb') as file:
+            argv0 = file.read().split(b'\0', 1)[0].decode('utf-8', 'replace')
+    except OSError:
+        return name
+
+    extended = os.path.basename(argv0)
+
+    return extended if extended.startswith(name) else name
+
+
+def _iter_procfs() -> Iterator[ProcessInfo]:
+    for entry in os.listdir(PROC_ROOT):
+        if entry.isdigit():
+            info = _read_stat(int(entry))
+
+            if info is not None:
+                yield info
+
+
+def _iter_psutil() -> Iterator[ProcessInfo]:
+    for proc in psutil.process_iter(['pid', 'name', 'ppid', 'create_time']):
+        info = proc.info
+
+        if info['name'] is None:
+            continue
+
+        yield ProcessInfo(info['pid'], info['name'], info['ppid'] or 0, info['create_time'] or 0.0)
+
+
+def iter_processes(use_procfs: Optional[bool] = None) -> Iterator[ProcessInfo]:
+    """
+    Iterate over the running processes.
+
+    Processes that exit while the table is being read are left out.
+
+    Parameters:
+        use_procfs (Optional[bool]):
+            A flag indicating whether to read /proc directly. Defaults to doing so where it's available (see
+            `HAS_PROCFS`), and using psutil elsewhere.
+
+    Returns:
+        Iterator[ProcessInfo]:
+            The processes.
+    """
+    if use_procfs is None:
+        use_procfs = HAS_PROCFS
+
+    return _iter_procfs() if use_procfs else _iter_psutil()
+
+
+def list_pids(use_procfs: Optional[bool] = None) -> List[int]:
+    """
+    List the IDs of the running processes, without reading anything about them.
+
+    Parameters:
+        use_procfs (Optional[bool]):
+            A flag indicating whether to read /proc directly. Defaults to doing so where it's available.
+
+    Returns:
+        List[int]:
+            The process IDs.
+    """
+    if use_procfs is None:
+        use_procfs = HAS_PROCFS
+
+    if use_procfs:
+        return [int(entry) for entry in os.listdir(PROC_ROOT) if entry.isdigit()]
+
+    return psutil.pids()
+
+
+def read_process(pid: int, use_procfs: Optional[bool] = None) -> Optional[ProcessInfo]:
+    """
+    Read what the scanner knows about a single process.
+
+    Parameters:
+        pid (int):
+            The process ID.
+
+        use_procfs (Optional[bool]):
+            A flag indicating whether to read /proc directly. Defaults to doing so where it's available.
+
+    Returns:
+        Optional[ProcessInfo]:
+            The process, or None if there's no such process (or it can't be read).
+    """
+    if HAS_PROCFS if use_procfs is None else use_procfs:
+        return _read_stat(pid)
+
+    try:
+        proc = psutil.Process(pid)
+
+        with proc.oneshot():
+            return ProcessInfo(pid, proc.name(), proc.ppid(), proc.create_time())
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return None
+
+
+def get_uid(pid: int) -> Optional[int]:
+    """
+    Get the (real) user ID a process runs as.
+
+    Parameters:
+        pid (int):
+            The process ID.
+
+    Returns:
+        Optional[int]:
+            The user ID, or None if the process is gone (or it can't be read).
+    """
+    if HAS_PROCFS:
+        try:
+            with open(f'{PROC_ROOT}/{pid}/status', 'rb') as file:
+                for line in file:
+                    if line.startswith(b'Uid:'):
+                        return int(line.split()[1])
+        except OSError:
+            return None
+
+        return None
+
+    try:
+        return psutil.Process(pid).uids().real
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, AttributeError):
+        return None
+
+
+@lru_cache(maxsize=256)
+def username_for_uid(uid: int) -> str:
+    """
+    Get the name of a user, by ID. Lookups are cached.
+
+    Parameters:
+        uid (int):
+            The user ID.
+
+    Returns:
+        str:
+            The user's name, or the ID as a string if it has no name (as `psutil.Process.username` does).
+    """
+    try:
+        import pwd
+    except ImportError:
+        return str(uid)
+
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+def get_username(pid: int) -> Optional[str]:
+    """
+    Get the name of the user a process runs as.
+
+    Parameters:
+        pid (int):
+            The process ID.
+
+    Returns:
+        Optional[str]:
+            The username, or None if the process is gone (or it can't be read).
+    """
+    if not HAS_PROCFS:
+        try:
+            return psutil.Process(pid).username()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+
+    uid = get_uid(pid)
+
+    return None if uid is None else username_for_uid(uid)
+
+
+__all__ = [
+    'HAS_PROCFS',
+    'ProcessInfo',
+    'get_uid',
+    'get_username',
+    'iter_processes',
+    'list_pids',
+    'read_process',
+    'username_for_uid',
+]
@@ -0,0 +1,265 @@
+"""
+
+A cached, indexed snapshot of the process table.
+
+Supervisors that look up dozens of processes by name every few seconds shouldn't rescan the whole process table for
+each lookup. A :class:`ProcessTable` scans once, indexes the processes by pid, by exact and case-folded name, and by
+parent, and serves every lookup from those indexes until the snapshot is older than its `ttl`:
+
+    >>> table = ProcessTable(ttl=2.0)
+    >>> table.pids_by_name('nginx')
+    [812, 813, 814]
+    >>> table.children(812)
+    [813, 814]
+
+Refreshing is incremental: the current pids are listed (a single directory read on Linux), and only processes that
+have appeared since the last refresh are read. Processes that have gone are dropped from the indexes without being
+read. As a pid's name can change when the process execs (e.g. just after a fork), processes started shortly before
+the last refresh are read again.
+
+"""
+from threading import RLock
+from time import monotonic, time
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+from inspyre_toolbox.proc_man.scanner import ProcessInfo, list_pids, read_process
+
+DEFAULT_TTL = 2.0
+""" The number of seconds a `ProcessTable` snapshot is used for, by default, before it's refreshed. """
+
+RECENT_WINDOW = 5.0
+""" Processes started less than this many seconds before a refresh are read again on the next refresh. """
+
+
+class ProcessTable:
+    """
+    A snapshot of the process table, indexed by pid, name and parent.
+
+    Lookups refresh the snapshot first if it's older than `ttl` seconds. All methods are thread-safe.
+
+    Parameters:
+        ttl (Optional[float]):
+            The number of seconds a snapshot is used for before lookups refresh it. None never refreshes
+            automatically (call :meth:`refresh`). Defaults to 2.
+
+        use_procfs (Optional[bool]):
+            A flag indicating whether to read /proc directly. Defaults to doing so where it's available.
+
+        clock (Callable[[], float]):
+            The monotonic clock, in seconds, that snapshots are aged with. Defaults to `time.monotonic`.
+    """
+
+    def __init__(
+            self,
+            ttl: Optional[float] = DEFAULT_TTL,
+            use_procfs: Optional[bool] = None,
+            clock: Callable[[], float] = monotonic
+    ):
+        self.__ttl = ttl
+        self.__use_procfs = use_procfs
+        self.__clock = clock
+        self.__lock = RLock()
+
+        self.__by_pid: Dict[int, ProcessInfo] = {}
+        self.__by_name: Dict[str, Set[int]] = {}
+        self.__by_folded_name: Dict[str, Set[int]] = {}
+        self.__children: Dict[int, Set[int]] = {}
+
+        self.__refreshed_at = None
+        self.__last_reads = 0
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """The number of seconds a snapshot is used for, or None if it's never refreshed automatically."""
+        return self.__ttl
+
+    @property
+    def age(self) -> Optional[float]:
+        """The number of seconds since the snapshot was taken, or None if it hasn't been yet."""
+        return None if self.__refreshed_at is None else self.__clock() - self.__refreshed_at
+
+    @property
+    def stale(self) -> bool:
+        """Whether the next lookup will refresh the snapshot."""
+        if self.__refreshed_at is None:
+            return True
+
+        return self.__ttl is not None and self.__clock() - self.__refreshed_at >= self.__ttl
+
+    @property
+    def last_reads(self) -> int:
+        """The number of processes read by the last refresh (the rest were carried over)."""
+        return self.__last_reads
+
+    def __index(self, info: ProcessInfo) -> None:
+        self.__by_pid[info.pid] = info
+        self.__by_name.setdefault(info.name, set()).add(info.pid)
+        self.__by_folded_name.setdefault(info.name.casefold(), set()).add(info.pid)
+        self.__children.setdefault(info.ppid, set()).add(info.pid)
+
+    def __unindex(self, pid: int) -> None:
+        info = self.__by_pid.pop(pid)
+
+        for index, key in ((self.__by_name, info.name),
+                           (self.__by_folded_name, info.name.casefold()),
+                           (self.__children, info.ppid)):
+            pids = index[key]
+            pids.discard(pid)
+
+            if not pids:
+                del index[key]
+
+    def refresh(self, full: bool = False) -> 'ProcessTable':
+        """
+        Bring the snapshot up to date.
+
+        Parameters:
+            full (bool):
+                A flag indicating whether to read every process again, rather than only new (and recently started)
+                ones. A full refresh also catches a pid that was reused between refreshes. Defaults to False.
+
+        Returns:
+            ProcessTable:
+                The table.
+        """
+        with self.__lock:
+            pids = set(list_pids(self.__use_procfs))
+            recent_since = time() - RECENT_WINDOW
+            reads = 0
+
+            for pid in list(self.__by_pid):
+                if full or pid not in pids or self.__by_pid[pid].create_time >= recent_since:
+                    self.__unindex(pid)
+
+            for pid in pids.difference(self.__by_pid):
+                info = read_process(pid, self.__use_procfs)
+                reads += 1
+
+                if info is not None:
+                    self.__index(info)
+
+            self.__last_reads = reads
+            self.__refreshed_at = self.__clock()
+
+        return self
+
+    def __fresh(self) -> None:
+        if self.stale:
+            self.refresh()
+
+    def get(self, pid: int) -> Optional[ProcessInfo]:
+        """
+        Get a process by pid.
+
+        Parameters:
+            pid (int):
+                The process ID.
+
+        Returns:
+            Optional[ProcessInfo]:
+                The process, or None if it wasn't running when the snapshot was taken.
+        """
+        with self.__lock:
+            self.__fresh()
+            return self.__by_pid.get(pid)
+
+    def pids_by_name(self, name: str, case_sensitive: bool = False, exact: bool = True) -> List[int]:
+        """
+        Get the pids of the processes with a name.
+
+        Parameters:
+            name (str):
+                The name.
+
+            case_sensitive (bool):
+                A flag indicating whether names must match in case. Defaults to False.
+
+            exact (bool):
+                A flag indicating whether names must match whole. If False, processes whose names contain `name` are
+                found, as :func:`~inspyre_toolbox.proc_man.find_all_by_name` does; that looks through every distinct
+                name, rather than every process. Defaults to True.
+
+        Returns:
+            List[int]:
+                The pids, lowest first.
+        """
+        with self.__lock:
+            self.__fresh()
+            index = self.__by_name if case_sensitive else self.__by_folded_name
+            key = name if case_sensitive else name.casefold()
+
+            if exact:
+                return sorted(index.get(key, ()))
+
+            return sorted(pid for indexed_name, pids in index.items() if key in indexed_name for pid in pids)
+
+    def find_by_name(self, name: str, case_sensitive: bool = False, exact: bool = True) -> List[ProcessInfo]:
+        """
+        Get the processes with a name. (See :meth:`pids_by_name`)
+
+        Returns:
+            List[ProcessInfo]:
+                The processes, lowest pid first.
+        """
+        with self.__lock:
+            return [self.__by_pid[pid] for pid in self.pids_by_name(name, case_sensitive, exact)]
+
+    def children(self, pid: int) -> List[int]:
+        """
+        Get the pids of a process's children.
+
+        Parameters:
+            pid (int):
+                The process ID.
+
+        Returns:
+            List[int]:
+                The children's pids, lowest first.
+        """
+        with self.__lock:
+            self.__fresh()
+            return sorted(self.__children.get(pid, ()))
+
+    def processes(self) -> List[ProcessInfo]:
+        """
+        Get every process in the snapshot.
+
+        Returns:
+            List[ProcessInfo]:
+                The processes, lowest pid first.
+        """
+        with self.__lock:
+            self.__fresh()
+            return [self.__by_pid[pid] for pid in sorted(self.__by_pid)]
+
+    def children_map(self) -> Dict[int, List[int]]:
+        """
+        Get the pids of every process's children.
+
+        Returns:
+            Dict[int, List[int]]:
+                The children's pids, by parent pid.
+        """
+        with self.__lock:
+            self.__fresh()
+            return {ppid: sorted(pids) for ppid, pids in self.__children.items()}
+
+    def __contains__(self, pid):
+        return self.get(pid) is not None
+
+    def __iter__(self) -> Iterator[ProcessInfo]:
+        return iter(self.processes())
+
+    def __len__(self):
+        with self.__lock:
+            self.__fresh()
+            return len(self.__by_pid)
+
+    def __repr__(self):
+        return f'<ProcessTable@{hex(id(self))}: {len(self.__by_pid)} processes | TTL: {self.__ttl}>'
+
+
+__all__ = [
+    'DEFAULT_TTL',
+    'ProcessTable',
+]
@@ -0,0 +1,258 @@
+"""
+
+Terminate many processes at once, gracefully.
+
+:func:`terminate_processes` signals every target at once, then waits for all of them together with
+`psutil.wait_procs`, for up to a grace period. Any that are still running after that are killed (SIGKILL), and waited
+for again. So stopping 500 workers takes about as long as the slowest of them takes to exit (at most the grace period
+plus the kill timeout), rather than 500 times anything.
+
+    >>> report = terminate_processes(pids, grace=5.0)
+    >>> report.ok
+    True
+    >>> report.killed
+    [4242]
+
+"""
+import os
+import signal
+from time import monotonic
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import psutil
+
+DEFAULT_GRACE = 5.0
+""" The number of seconds processes are given to exit after the first signal, by default, before they're killed. """
+
+DEFAULT_KILL_TIMEOUT = 2.0
+""" The number of seconds to wait for killed processes to go, by default. """
+
+# How often the wait checks for processes that have become zombies we can't reap.
+ZOMBIE_POLL = 0.1
+
+# Matches a process's create time to the one it was found with, to tell a reused pid from the original process.
+CREATE_TIME_TOLERANCE = 0.05
+
+Target = Union[int, dict, psutil.Process]
+
+
+class TerminationReport(NamedTuple):
+    """
+    What happened to each of the processes :func:`terminate_processes` was asked to stop.
+
+    Attributes:
+        terminated (List[int]):
+            The pids of the processes that exited within the grace period.
+
+        killed (List[int]):
+            The pids of the processes that had to be killed.
+
+        survived (List[int]):
+            The pids of the processes still running after being killed (e.g. stuck in uninterruptible sleep).
+
+        missing (List[int]):
+            The pids of the processes that had already gone (or whose pid now belongs to another process).
+
+        denied (List[int]):
+            The pids of the processes we weren't allowed to signal.
+
+        returncodes (Dict[int, Optional[int]]):
+            The exit codes of the processes that went, where they're known (only for our own children, on POSIX).
+
+        elapsed (float):
+            The number of seconds the whole termination took.
+    """
+    terminated: List[int]
+    killed: List[int]
+    survived: List[int]
+    missing: List[int]
+    denied: List[int]
+    returncodes: Dict[int, Optional[int]]
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        """Whether every process that was running (and that we could signal) is gone."""
+        return not (self.survived or self.denied)
+
+    @property
+    def stopped(self) -> List[int]:
+        """The pids of every process stopped, whether it exited on its own or had to be killed."""
+        return sorted(self.terminated + self.killed)
+
+
+def _as_process(target: Target) -> psutil.Process:
+    if isinstance(target, psutil.Process):
+        return target
+
+    if isinstance(target, dict):
+        proc = psutil.Process(target['pid'])
+        create_time = target.get('create_time')
+
+        if create_time is not None and abs(proc.create_time() - create_time) > CREATE_TIME_TOLERANCE:
+            raise psutil.NoSuchProcess(target['pid'])
+
+        return proc
+
+    return psutil.Process(target)
+
+
+def _send(
+        procs: List[psutil.Process],
+        sig: Optional[int],
+        missing: List[int],
+        denied: List[int]
+) -> List[psutil.Process]:
+    sent = []
+
+    for proc in procs:
+        try:
+            if sig is None:
+                proc.kill()
+            else:
+                proc.send_signal(sig)
+        except psutil.NoSuchProcess:
+            missing.append(proc.pid)
+        except psutil.AccessDenied:
+            denied.append(proc.pid)
+        else:
+            sent.append(proc)
+
+    return sent
+
+
+def _is_zombie(proc: psutil.Process) -> bool:
+    try:
+        return proc.status() == psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return True
+    except psutil.AccessDenied:
+        return False
+
+
+def _wait(procs: List[psutil.Process], timeout: float, callback) -> Tuple[List[psutil.Process], List[psutil.Process]]:
+    # Like psutil.wait_procs, except that zombies count as gone. Only its parent can reap a zombie, and a process that
+    # isn't our child stays one until its parent (or, once that's gone, init) does; which may be never, e.g. in a
+    # container whose init doesn't reap.
+    deadline = monotonic() + timeout
+    gone = []
+    alive = procs
+
+    while alive:
+        done, alive = psutil.wait_procs(alive, timeout=max(0.0, min(ZOMBIE_POLL, deadline - monotonic())),
+                                        callback=callback)
+        gone.extend(done)
+
+        zombies = [proc for proc in alive if _is_zombie(proc)]
+
+        if zombies:
+            gone.extend(zombies)
+            alive = [proc for proc in alive if proc not in zombies]
+
+        if monotonic() >= deadline:
+            break
+
+    return gone, alive
+
+
+def terminate_processes(
+        targets: Iterable[Target],
+        grace: float = DEFAULT_GRACE,
+        kill_timeout: float = DEFAULT_KILL_TIMEOUT,
+        sig: int = signal.SIGTERM,
+        escalate: bool = True,
+        resume: bool = False
+) -> TerminationReport:
+    """
+    Stop many processes at once; signal them all, wait for them all, and kill any that don't exit in time.
+
+    Parameters:
+        targets (Iterable[Union[int, dict, psutil.Process]]):
+            The processes to stop; pids, `psutil.Process` objects, or the dictionaries
+            :func:`~inspyre_toolbox.proc_man.find_all_by_name` returns (whose create time is checked, so a pid that has
+            since been reused by another process is left alone).
+
+        grace (float):
+            The number of seconds to give the processes to exit after the first signal. Defaults to 5.
+
+        kill_timeout (float):
+            The number of seconds to wait for killed processes to go. Defaults to 2.
+
+        sig (int):
+            The signal to send first. Defaults to SIGTERM (on Windows, where there are no signals, processes are
+            terminated).
+
+        escalate (bool):
+            A flag indicating whether to kill (SIGKILL) the processes still running after the grace period. If False,
+            they're reported as survivors. Defaults to True.
+
+        resume (bool):
+            A flag indicating whether to continue (SIGCONT) the processes just after signalling them, for processes
+            that were stopped (suspended) first, so they can act on the signal. Defaults to False.
+
+    Returns:
+        TerminationReport:
+            What happened to each process.
+    """
+    started = monotonic()
+    missing: List[int] = []
+    denied: List[int] = []
+    procs = []
+    seen = {os.getpid()}
+
+    for target in targets:
+        try:
+            proc = _as_process(target)
+        except psutil.NoSuchProcess as error:
+            missing.append(error.pid)
+            continue
+        except psutil.AccessDenied as error:
+            denied.append(error.pid)
+            continue
+
+        # Never signal the same process twice, and never ourselves.
+        if proc.pid not in seen:
+            seen.add(proc.pid)
+            procs.append(proc)
+
+    returncodes = {}
+
+    def on_terminate(proc):
+        returncodes[proc.pid] = proc.returncode
+
+    signalled = _send(procs, sig, missing, denied)
+
+    if resume:
+        for proc in signalled:
+            try:
+                proc.resume()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+    gone, alive = _wait(signalled, grace, on_terminate)
+    terminated = [proc.pid for proc in gone]
+    killed = []
+
+    if alive and escalate:
+        # Anything that exits between the wait and the kill counts as having gone on its own.
+        killable = _send(alive, None, terminated, denied)
+        gone, alive = _wait(killable, kill_timeout, on_terminate)
+        killed = [proc.pid for proc in gone]
+
+    return TerminationReport(
+            terminated=sorted(terminated),
+            killed=sorted(killed),
+            survived=sorted(proc.pid for proc in alive),
+            missing=sorted(missing),
+            denied=sorted(denied),
+            returncodes=returncodes,
+            elapsed=monotonic() - started
+    )
+
+
+__all__ = [
+    'DEFAULT_GRACE',
+    'DEFAULT_KILL_TIMEOUT',
+    'TerminationReport',
+    'terminate_processes',
+]
@@ -0,0 +1,339 @@
+"""
+
+Find, inspect and stop whole process trees.
+
+Stopping a service usually means stopping a process and everything it started. Every function here builds the tree
+from a single scan of the process table (a map of each process's children, by parent pid), rather than asking each
+process for its children in turn:
+
+    >>> [proc.pid for proc in find_tree(812)]
+    [812, 813, 814, 901]
+    >>> tree_usage(812, interval=0.5).rss
+    52461568
+    >>> kill_tree(812).ok
+    True
+
+:func:`kill_tree` stops (SIGSTOP) the whole tree, parents first, before signalling any of it; a stopped process can't
+start any more children, or exit and leave its children to be re-parented out of the tree, while the rest are found
+and signalled. The tree is scanned again after it's stopped, to catch children started while it was being stopped.
+Then every process is signalled, continued (SIGCONT) so it can act on the signal, and waited for, and any that don't
+exit in time are killed. (See :func:`~inspyre_toolbox.proc_man.terminate.terminate_processes`)
+
+"""
+import os
+import signal
+from collections import deque
+from time import monotonic, sleep
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import psutil
+
+from inspyre_toolbox.proc_man.scanner import ProcessInfo, iter_processes
+from inspyre_toolbox.proc_man.table import ProcessTable
+from inspyre_toolbox.proc_man.terminate import (
+    DEFAULT_GRACE,
+    DEFAULT_KILL_TIMEOUT,
+    TerminationReport,
+    _as_process,
+    terminate_processes,
+)
+
+FREEZE_PASSES = 5
+""" The most times :func:`kill_tree` scans a tree again for children started while it was being stopped. """
+
+
+class TreeUsage(NamedTuple):
+    """
+    The resources a process tree is using.
+
+    Attributes:
+        pids (List[int]):
+            The pids of the processes in the tree that were measured.
+
+        rss (int):
+            The total resident set size of the processes, in bytes. (Memory the processes share is counted once per
+            process.)
+
+        cpu_time (float):
+            The total CPU time (user and system) the processes have used, in seconds.
+
+        cpu_percent (Optional[float]):
+            The processes' total CPU utilisation over the measuring interval, as a percentage of one CPU (so it can
+            exceed 100), or None if no interval was given.
+    """
+    pids: List[int]
+    rss: int
+    cpu_time: float
+    cpu_percent: Optional[float]
+
+
+def _scan(
+        table: Optional[ProcessTable],
+        use_procfs: Optional[bool]
+) -> Tuple[Dict[int, ProcessInfo], Dict[int, List[int]]]:
+    if table is not None:
+        # The tree has to be current, however recently the table was refreshed.
+        table.refresh()
+
+        return {info.pid: info for info in table.processes()}, table.children_map()
+
+    by_pid = {}
+    children = {}
+
+    for info in iter_processes(use_procfs):
+        by_pid[info.pid] = info
+        children.setdefault(info.ppid, []).append(info.pid)
+
+    return by_pid, children
+
+
+def _walk(pid: int, by_pid: Dict[int, ProcessInfo], children: Dict[int, List[int]]) -> List[ProcessInfo]:
+    found = []
+    seen = {pid}
+    queue = deque([pid])
+
+    while queue:
+        current = queue.popleft()
+
+        if current in by_pid:
+            found.append(by_pid[current])
+
+        for child in children.get(current, ()):
+            # pid 0 is its own parent on some platforms.
+            if child not in seen:
+                seen.add(child)
+                queue.append(child)
+
+    return found
+
+
+def find_tree(
+        pid: int,
+        include_root: bool = True,
+        table: Optional[ProcessTable] = None,
+        use_procfs: Optional[bool] = None
+) -> List[ProcessInfo]:
+    """
+    Find a process and all of its descendants.
+
+    Parameters:
+        pid (int):
+            The process ID of the root of the tree.
+
+        include_root (bool):
+            A flag indicating whether to include the root process itself. Defaults to True.
+
+        table (Optional[ProcessTable]):
+            A process table to scan with (it's refreshed first). Defaults to scanning the process table afresh.
+
+        use_procfs (Optional[bool]):
+            A flag indicating whether to read /proc directly, when not scanning with a table. Defaults to doing so
+            where it's available.
+
+    Returns:
+        List[ProcessInfo]:
+            The processes, parents before their children (the root first), or an empty list if there's no such
+            process.
+    """
+    by_pid, children = _scan(table, use_procfs)
+
+    if pid not in by_pid:
+        return []
+
+    found = _walk(pid, by_pid, children)
+
+    return found if include_root else found[1:]
+
+
+def descendants(pid: int, table: Optional[ProcessTable] = None, use_procfs: Optional[bool] = None) -> List[int]:
+    """
+    Get the pids of all of a process's descendants. (See :func:`find_tree`)
+
+    Returns:
+        List[int]:
+            The pids, parents before their children.
+    """
+    return [info.pid for info in find_tree(pid, False, table, use_procfs)]
+
+
+def _measure(procs: List[psutil.Process]) -> Tuple[Dict[psutil.Process, float], int]:
+    cpu_times = {}
+    rss = 0
+
+    for proc in procs:
+        try:
+            with proc.oneshot():
+                times = proc.cpu_times()
+                rss += proc.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+
+        cpu_times[proc] = times.user + times.system
+
+    return cpu_times, rss
+
+
+def tree_usage(
+        pid: int,
+        interval: Optional[float] = None,
+        table: Optional[ProcessTable] = None,
+        use_procfs: Optional[bool] = None
+) -> TreeUsage:
+    """
+    Add up the memory and CPU a process and all of its descendants are using.
+
+    Parameters:
+        pid (int):
+            The process ID of the root of the tree.
+
+        interval (Optional[float]):
+            The number of seconds to measure CPU utilisation over (this blocks for that long). If None, only the
+            total CPU time is measured. Defaults to None.
+
+        table (Optional[ProcessTable]):
+            A process table to scan with (it's refreshed first). Defaults to scanning the process table afresh.
+
+        use_procfs (Optional[bool]):
+            A flag indicating whether to read /proc directly, when not scanning with a table. Defaults to doing so
+            where it's available.
+
+    Returns:
+        TreeUsage:
+            The processes' resource usage. Processes that exit while they're being measured (or that can't be read)
+            are left out.
+    """
+    procs = []
+
+    for info in find_tree(pid, table=table, use_procfs=use_procfs):
+        try:
+            procs.append(_as_process(info._asdict()))
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+    started = monotonic()
+    before, rss = _measure(procs)
+    cpu_percent = None
+
+    if interval:
+        sleep(interval)
+        after, rss = _measure(list(before))
+        elapsed = monotonic() - started
+        used = sum(after[proc] - before[proc] for proc in after)
+        cpu_percent = used / elapsed * 100 if elapsed > 0 else 0.0
+        before = after
+
+    return TreeUsage(
+            pids=sorted(proc.pid for proc in before),
+            rss=rss,
+            cpu_time=sum(before.values()),
+            cpu_percent=cpu_percent
+    )
+
+
+def _freeze(procs: List[psutil.Process]) -> None:
+    for proc in procs:
+        if proc.pid == os.getpid():
+            continue
+
+        try:
+            proc.suspend()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+
+def kill_tree(
+        pid: int,
+        include_root: bool = True,
+        grace: float = DEFAULT_GRACE,
+        kill_timeout: float = DEFAULT_KILL_TIMEOUT,
+        sig: int = signal.SIGTERM,
+        escalate: bool = True,
+        freeze: bool = True,
+        table: Optional[ProcessTable] = None,
+        use_procfs: Optional[bool] = None
+) -> TerminationReport:
+    """
+    Stop a process and all of its descendants.
+
+    Parameters:
+        pid (int):
+            The process ID of the root of the tree.
+
+        include_root (bool):
+            A flag indicating whether to stop the root process itself, as well as its descendants. Defaults to True.
+
+        grace (float):
+            The number of seconds to give the processes to exit after the first signal. Defaults to 5.
+
+        kill_timeout (float):
+            The number of seconds to wait for killed processes to go. Defaults to 2.
+
+        sig (int):
+            The signal to send first. Defaults to SIGTERM.
+
+        escalate (bool):
+            A flag indicating whether to kill (SIGKILL) the processes still running after the grace period. Defaults
+            to True.
+
+        freeze (bool):
+            A flag indicating whether to stop (SIGSTOP) the whole tree before signalling it, so it can't change while
+            it's being signalled. Defaults to True.
+
+        table (Optional[ProcessTable]):
+            A process table to scan with (it's refreshed first). Defaults to scanning the process table afresh.
+
+        use_procfs (Optional[bool]):
+            A flag indicating whether to read /proc directly, when not scanning with a table. Defaults to doing so
+            where it's available.
+
+    Returns:
+        TerminationReport:
+            What happened to each process. A tree whose root isn't running is reported with its root missing.
+    """
+    infos = find_tree(pid, include_root, table, use_procfs)
+
+    if not infos and include_root:
+        return terminate_processes([pid], grace, kill_timeout, sig, escalate)
+
+    procs = []
+
+    for info in infos:
+        try:
+            procs.append(_as_process(info._asdict()))
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+    if freeze:
+        _freeze(procs)
+        seen = {info.pid for info in infos}
+
+        # Children started while the tree was being stopped weren't in the first scan.
+        for _ in range(FREEZE_PASSES):
+            newcomers = []
+
+            for info in find_tree(pid, include_root, table, use_procfs):
+                if info.pid not in seen:
+                    seen.add(info.pid)
+
+                    try:
+                        newcomers.append(_as_process(info._asdict()))
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue
+
+            if not newcomers:
+                break
+
+            procs.extend(newcomers)
+            _freeze(newcomers)
+
+    return terminate_processes(procs, grace, kill_timeout, sig, escalate, resume=freeze)
+
+
+__all__ = [
+    'FREEZE_PASSES',
+    'TreeUsage',
+    'descendants',
+    'find_tree',
+    'kill_tree',
+    'tree_usage',
+]
@@ -1,10 +1,18 @@
+from weakref import finalize
+
+
 class FreezeProperty:
     """
-    A descriptor that provides a property which can only be set once.
+    A descriptor that provides a property which can only be set once per instance.
 
     Attributes:
         fset (function): The setter function for the property.
-        is_set (bool): A flag to indicate if the property has been set.
+        frozen_ids (set): The IDs of the instances, without a `__dict__`, on which the property has already been set.
+
+    Note:
+        The frozen flag is kept in each instance's `__dict__`, under a name unique to the descriptor, so instances are
+        told apart by identity (not equality). Instances without a `__dict__` (i.e. of classes with `__slots__`) are
+        tracked by ID instead, until they're garbage-collected; so they must support weak references.
     """
 
     def __init__(self, fset):
@@ -15,7 +23,31 @@ class FreezeProperty:
             fset (function): The setter function for the property.
         """
         self.fset = fset
-        self.is_set = False
+        self.frozen_ids = set()
+        self.__flag = f'__frozen_{fset.__name__}_{id(self):x}'
+
+    def is_set(self, instance) -> bool:
+        """
+        Check whether the property has already been set on an instance.
+
+        Args:
+            instance (object): The instance to check.
+
+        Returns:
+            bool: True if the property has been set on `instance`.
+        """
+        try:
+            return self.__flag in vars(instance)
+        except TypeError:
+            return id(instance) in self.frozen_ids
+
+    def __freeze(self, instance):
+        try:
+            vars(instance)[self.__flag] = True
+        except TypeError:
+            # Forget the ID when the instance goes, so a later instance given the same ID isn't frozen.
+            finalize(instance, self.frozen_ids.discard, id(instance))
+            self.frozen_ids.add(id(instance))
 
     def __call__(self, instance, value):
         """
@@ -27,12 +59,17 @@ class FreezeProperty:
 
         Raises:
             AttributeError: If the property has already been set.
+            TypeError: If the instance has neither a `__dict__` nor support for weak references.
         """
-        if self.is_set:
+        if self.is_set(instance):
             raise AttributeError(
                 f"{instance.__class__.__name__}.{self.fset.__name__} is frozen and cannot be modified.")
+        if not hasattr(instance, '__dict__') and not type(instance).__weakrefoffset__:
+            raise TypeError(
+                f"{instance.__class__.__name__}.{self.fset.__name__} can't be frozen; "
+                f"{instance.__class__.__name__} instances need a '__dict__' or '__weakref__' slot.")
         self.fset(instance, value)
-        self.is_set = True
+        self.__freeze(instance)
 
     def __get__(self, instance, owner):
         """
@@ -60,7 +97,7 @@ class FreezeProperty:
         Raises:
             AttributeError: If the property has already been set.
         """
-        if self.is_set:
+        if self.is_set(instance):
             raise AttributeError(f"Property {self.fset.__name__} is frozen and cannot be modified.")
         self.__call__(instance, value)
 
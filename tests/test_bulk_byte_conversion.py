@@ -0,0 +1,63 @@
+import random
+from array import array
+
+import pytest
+
+from inspyre_toolbox.conversions.bytes import convert_many, convert_value, lowest_safe_conversion, lowest_units_many
+
+
+def _corpus():
+    rng = random.Random(1234)
+    values = [0, 1, 7, 8, 124, 125, 999, 1000, 1001, 10 ** 24, 10 ** 27, -5, 0.5]
+    values += [10 ** exponent for exponent in range(0, 27)]
+    values += [10 ** exponent - 1 for exponent in range(1, 27)]
+    values += [125 * 10 ** exponent for exponent in range(0, 24)]
+    values += [rng.randrange(0, 10 ** rng.randrange(1, 26)) for _ in range(2000)]
+    values += [rng.random() * 10 ** rng.randrange(0, 20) for _ in range(2000)]
+    return values
+
+
+@pytest.mark.parametrize("unit", ['byte', 'bit', 'kilobyte'])
+@pytest.mark.parametrize("keep_family", [True, False])
+def test_lowest_units_many_matches_scalar(unit, keep_family):
+    values = _corpus()
+
+    converted, units = lowest_units_many(values, unit, keep_family)
+
+    for value, got_value, got_unit in zip(values, converted, units):
+        expected_unit, expected_value = lowest_safe_conversion(value, unit, keep_family)
+        assert (got_unit, got_value) == (expected_unit, expected_value)
+
+
+def test_containers_are_preserved():
+    values = array('q', [1, 1000, 10 ** 6])
+
+    assert convert_many(values, 'byte', 'kilobyte') == array('d', [0.001, 1.0, 1000.0])
+
+    converted, units = lowest_units_many(values)
+    assert isinstance(converted, array)
+    assert units == ['byte', 'kilobyte', 'megabyte']
+
+
+def test_numpy_arrays():
+    np = pytest.importorskip('numpy')
+    values = _corpus()
+    as_floats = [float(value) for value in values]
+
+    converted, units = lowest_units_many(np.array(as_floats), 'byte', False)
+    expected = [lowest_safe_conversion(value, 'byte', False) for value in as_floats]
+
+    assert list(units) == [unit for unit, _ in expected]
+    assert list(converted) == [value for _, value in expected]
+
+    assert list(convert_many(np.array(as_floats), 'byte', 'megabit')) == [
+            convert_value(value, 'byte', 'megabit') for value in as_floats
+            ]
+
+
+def test_invalid_units():
+    with pytest.raises(ValueError):
+        convert_many([1], 'byte', 'nibble')
+
+    with pytest.raises(ValueError):
+        lowest_units_many([1], 'nibble')
@@ -0,0 +1,88 @@
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from inspyre_toolbox.conversions.bytes import (
+    ByteConverter,
+    UNIT_CONVERSIONS,
+    convert_value,
+    convert_value_exact,
+    lowest_safe_conversion,
+    lowest_safe_conversion_exact,
+    )
+
+
+@pytest.mark.parametrize(
+        "value, unit, keep_family, expected",
+        [
+                (0, 'byte', False, ('byte', 0)),
+                (200, 'byte', False, ('kilobit', 1.6)),
+                (200, 'byte', True, ('byte', 200)),
+                (1500000, 'byte', True, ('megabyte', 1.5)),
+                (8, 'bit', False, ('byte', 1.0)),
+                (8000, 'bit', True, ('kilobit', 8.0)),
+                (10, 'yottabyte', True, ('yottabyte', 10)),
+                ],
+        ids=["zero", "bytes_to_bits", "bytes_keep_family", "megabytes", "bits_to_bytes", "bits_keep_family",
+             "largest_unit"]
+        )
+def test_lowest_safe_conversion(value, unit, keep_family, expected):
+    assert lowest_safe_conversion(value, unit, keep_family) == pytest.approx(expected)
+    assert ByteConverter(value, unit).get_lowest_safe_conversion(keep_family) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("to_unit", list(UNIT_CONVERSIONS))
+def test_convert_value_matches_byte_converter(to_unit):
+    assert convert_value(123456789, 'kilobyte', to_unit) == ByteConverter(123456789, 'kilobyte').convert(to_unit)
+
+
+def test_invalid_units_raise_value_error():
+    with pytest.raises(ValueError):
+        convert_value(1, 'byte', 'nibble')
+
+    with pytest.raises(ValueError):
+        lowest_safe_conversion(1, 'nibble')
+
+    with pytest.raises(ValueError):
+        ByteConverter(1, 'byte').convert('nibble')
+
+
+def test_exact_conversions_do_not_lose_precision():
+    assert convert_value_exact(3, 'yottabyte', 'bit') == 24 * 10 ** 24
+    assert convert_value_exact(convert_value_exact(7, 'zetabit', 'byte'), 'byte', 'zetabit') == 7
+    assert convert_value_exact('0.1', 'kilobyte', 'bit') == 800
+    assert convert_value_exact(1, 'bit', 'kilobyte', as_decimal=True) == Decimal('0.000125')
+
+
+def test_exact_lowest_safe_conversion():
+    assert lowest_safe_conversion_exact(1500000, 'byte', keep_family=True) == ('megabyte', Fraction(3, 2))
+    assert lowest_safe_conversion_exact(0, 'byte') == ('byte', 0)
+
+
+@pytest.mark.parametrize(
+        "arithmetic, expected_type",
+        [('float', float), ('fraction', Fraction), ('decimal', Decimal)]
+        )
+def test_byte_converter_arithmetic_modes(arithmetic, expected_type):
+    converter = ByteConverter(123456789, 'yottabyte', arithmetic=arithmetic)
+
+    assert converter.arithmetic == arithmetic
+    assert isinstance(converter.convert('bit'), expected_type)
+    assert converter.get_lowest_safe_conversion()[0] == 'yottabyte'
+
+    if arithmetic != 'float':
+        assert converter.convert('bit') == 123456789 * 8 * 10 ** 24
+
+
+def test_invalid_arithmetic_mode():
+    with pytest.raises(ValueError):
+        ByteConverter(1, 'byte', arithmetic='double')
+
+
+def test_float_arithmetic_accepts_decimals():
+    converter = ByteConverter(Decimal('0.1'), 'kilobyte')
+
+    assert converter.convert('bit') == pytest.approx(800.0)
+    assert isinstance(converter.convert('bit'), float)
+    assert converter.get_lowest_safe_conversion() == ('byte', pytest.approx(100.0))
@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from inspyre_toolbox.path_man import PathCheckResult, check_directory, check_file, check_paths
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'a.txt').write_bytes(b'12345')
+    (tmp_path / 'b.bin').write_bytes(b'')
+    (tmp_path / 'sub' / 'c.txt').write_bytes(b'abc')
+    os.symlink(tmp_path / 'missing', tmp_path / 'dangling')
+    return tmp_path
+
+
+def test_check_paths_reports_existence_type_and_size(tree):
+    paths = [
+            str(tree / 'a.txt'),
+            tree / 'b.bin',
+            tree / 'sub',
+            tree / 'sub' / 'c.txt',
+            tree / 'nope',
+            tree / 'dangling',
+            tree / 'sub' / 'nope' / 'deeper',
+            ]
+
+    results = check_paths(paths)
+
+    assert list(results) == paths
+    assert results[str(tree / 'a.txt')] == PathCheckResult(tree / 'a.txt', True, 'file', 5)
+    assert results[tree / 'b.bin'] == PathCheckResult(tree / 'b.bin', True, 'file', 0)
+    assert results[tree / 'sub'] == PathCheckResult(tree / 'sub', True, 'directory')
+    assert results[tree / 'sub' / 'c.txt'].size == 3
+    assert not results[tree / 'nope'].exists
+    assert not results[tree / 'dangling'].exists
+    assert results[tree / 'sub' / 'nope' / 'deeper'].type is None
+
+
+def test_check_paths_rejects_invalid_paths():
+    with pytest.raises(ValueError):
+        check_paths([123])
+
+
+def test_check_directory_and_check_file_accept_strings(tree):
+    assert check_directory(str(tree / 'sub'))
+    assert not check_directory(str(tree / 'a.txt'))
+    assert check_file(str(tree / 'a.txt'))
+    assert not check_file(str(tree / 'sub'))
+    assert not check_file(str(tree / 'nope'))
+
+
+def test_check_paths_unresolved_dot_dot_alongside_siblings(tree):
+    up = tree / 'sub' / '..'
+    results = check_paths([up, tree / 'sub' / 'c.txt', tree / 'sub' / 'nope'], do_not_resolve=True)
+
+    assert results[up].exists and results[up].type == 'directory'
+    assert results[tree / 'sub' / 'c.txt'].exists
+    assert not results[tree / 'sub' / 'nope'].exists
+
+
+def test_check_paths_falls_back_to_stat_for_names_missing_from_the_listing(tree, monkeypatch):
+    real_scandir = os.scandir
+
+    class Entries:
+        # A listing that names everything in upper case, as a case-insensitive filesystem might.
+        def __init__(self, path):
+            self.entries = list(real_scandir(path))
+
+        def __enter__(self):
+            return [type('Entry', (), {'name': entry.name.upper()})() for entry in self.entries]
+
+        def __exit__(self, *exc_info):
+            return False
+
+    monkeypatch.setattr(os, 'scandir', Entries)
+    results = check_paths([tree / 'a.txt', tree / 'b.bin', tree / 'nope'])
+
+    assert results[tree / 'a.txt'] == PathCheckResult(tree / 'a.txt', True, 'file', 5)
+    assert results[tree / 'b.bin'].exists
+    assert not results[tree / 'nope'].exists
@@ -0,0 +1,113 @@
+import json
+import os
+
+import pytest
+
+from inspyre_toolbox.path_man import gather_files_in_dir
+from inspyre_toolbox.path_man.index import DirectoryIndex, INDEX_FORMAT_VERSION
+
+OLD_NS = 1_000_000_000_000_000_000
+
+
+def _age(path, offset=0):
+    """Push a directory's mtime into the past so the index will trust its listing."""
+    os.utime(path, ns=(OLD_NS + offset, OLD_NS + offset))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / 'root'
+    (root / 'a' / 'b').mkdir(parents=True)
+    (root / 'skip').mkdir()
+    (root / 'one.txt').write_text('1')
+    (root / 'a' / 'two.py').write_text('2')
+    (root / 'a' / 'b' / 'three.txt').write_text('3')
+    (root / 'skip' / 'four.txt').write_text('4')
+
+    for directory in (root / 'a' / 'b', root / 'a', root / 'skip', root):
+        _age(directory)
+
+    return root
+
+
+def _walk(index, top):
+    return sorted((d, sorted(dn), sorted(fn)) for d, dn, fn in index.walk(top))
+
+
+def test_walk_matches_os_walk(tree):
+    expected = sorted((d, sorted(dn), sorted(fn)) for d, dn, fn in os.walk(tree))
+
+    assert _walk(DirectoryIndex(), tree) == expected
+
+
+def test_symlinked_directories_are_listed_but_not_descended_into(tree):
+    os.symlink(tree / 'a', tree / 'link')
+    _age(tree)
+    expected = sorted((d, sorted(dn), sorted(fn)) for d, dn, fn in os.walk(tree))
+    index = DirectoryIndex()
+
+    assert _walk(index, tree) == expected
+    # Again, from the index.
+    assert _walk(index, tree) == expected
+    assert index.hits == 4
+
+
+def test_unchanged_directories_are_served_from_the_index(tree):
+    index = DirectoryIndex()
+    _walk(index, tree)
+    assert (index.hits, index.misses) == (0, 4)
+
+    _walk(index, tree)
+    assert (index.hits, index.misses) == (4, 4)
+
+    (tree / 'a' / 'new.txt').write_text('new')
+    _age(tree / 'a', offset=1)
+
+    listing = dict((d, fn) for d, _, fn in index.walk(tree))
+    assert 'new.txt' in listing[str(tree / 'a')]
+    assert (index.hits, index.misses) == (7, 5)
+
+
+def test_index_persists_between_instances(tree, tmp_path):
+    index_file = tmp_path / 'index.json'
+
+    first = DirectoryIndex(index_file)
+    _walk(first, tree)
+    first.save()
+    assert not first.dirty
+
+    second = DirectoryIndex(index_file)
+    assert len(second) == 4
+    _walk(second, tree)
+    assert second.misses == 0
+
+
+@pytest.mark.parametrize('directories', [
+        {'/some/dir': [1, ['a'], ['b'], []], '/other/dir': [1, ['a'], []]},
+        {'/some/dir': {'mtime_ns': 1}},
+        {'/some/dir': ['1', [], [], []]},
+        {'/some/dir': [1, 'a', [], []]},
+        ['/some/dir'],
+        ], ids=['too_short', 'not_a_list', 'bad_mtime', 'bad_names', 'not_a_mapping'])
+def test_malformed_index_files_are_discarded(tmp_path, directories):
+    index_file = tmp_path / 'index.json'
+    index_file.write_text(json.dumps({'version': INDEX_FORMAT_VERSION, 'directories': directories}))
+
+    assert len(DirectoryIndex(index_file)) == 0
+
+
+def test_non_mapping_index_files_are_discarded(tmp_path):
+    index_file = tmp_path / 'index.json'
+    index_file.write_text('[1, 2, 3]')
+
+    assert len(DirectoryIndex(index_file)) == 0
+
+
+def test_gather_files_in_dir_with_index(tree):
+    index = DirectoryIndex()
+
+    plain = gather_files_in_dir(tree, recursive=True, ignore_dirs=['skip'])
+    indexed = gather_files_in_dir(tree, recursive=True, ignore_dirs=['skip'], index=index)
+
+    assert sorted(str(f.path) for f in plain) == sorted(str(f.path) for f in indexed)
+    assert str(tree / 'skip') not in index
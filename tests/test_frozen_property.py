@@ -102,3 +102,60 @@ def test_freeze_property_get_without_instance():
     # Optional: Test setting and getting the value
     instance.value = 42
     assert instance.value == 42
+
+
+class Point:
+    def __init__(self, x):
+        self.x = x
+
+    def __eq__(self, other):
+        return isinstance(other, Point) and other.x == self.x
+
+    __hash__ = None
+
+    def _set_label(self, label):
+        self._label = label
+
+    label = property(lambda self: self._label, freeze_property(_set_label))
+
+
+def test_freeze_property_tells_equal_instances_apart():
+    first, second = Point(1), Point(1)
+
+    first.label = 'first'
+    second.label = 'second'
+
+    with pytest.raises(AttributeError):
+        first.label = 'again'
+
+
+class SlottedPoint:
+    __slots__ = ('_label', '__weakref__')
+
+    def _set_label(self, label):
+        self._label = label
+
+    label = property(lambda self: self._label, freeze_property(_set_label))
+
+
+class BareSlottedPoint:
+    __slots__ = ('_label',)
+
+    def _set_label(self, label):
+        self._label = label
+
+    label = property(lambda self: self._label, freeze_property(_set_label))
+
+
+def test_freeze_property_on_slotted_instances():
+    point = SlottedPoint()
+    point.label = 'first'
+    assert point.label == 'first'
+
+    with pytest.raises(AttributeError):
+        point.label = 'again'
+
+    SlottedPoint().label = 'fresh'
+
+    with pytest.raises(TypeError):
+        BareSlottedPoint().label = 'first'
@@ -0,0 +1,94 @@
+import io
+import random
+
+import pytest
+from inflect import engine
+
+from inspyre_toolbox.humanize import (
+    MAX_WORDS_NUMBER,
+    Numerical,
+    clear_plural_cache,
+    commify_many,
+    count_nouns,
+    number_to_words,
+    plural_noun,
+    )
+
+NOUNS = ['file', 'mouse', 'child', 'process', 'directory', 'sheep', 'byte', 'index', 'person', 'bus']
+
+COUNTS = [0, 1, 2, 1.0, 1.5, -1, 1000, '1', 'one', 'a']
+
+
+@pytest.mark.parametrize("noun", NOUNS)
+def test_plural_noun_matches_inflect(noun):
+    clear_plural_cache()
+    inf = engine()
+
+    for count in COUNTS + [None]:
+        assert plural_noun(noun, count) == inf.plural_noun(noun, count)
+
+
+def test_count_noun():
+    assert Numerical(1, 'file').count_noun() == '1 file'
+    assert Numerical(1234, 'mouse').count_noun() == '1,234 mice'
+    assert Numerical(3, 'child').count_noun(only_noun=True, capitalize=True) == 'Children'
+
+
+def test_construction_does_not_create_a_logger(monkeypatch):
+    from inspyre_toolbox import humanize
+
+    def fail(*args, **kwargs):
+        raise AssertionError('A logger was created.')
+
+    monkeypatch.setattr(humanize.ROOT_ISL_DEVICE, 'get_child', fail)
+
+    assert Numerical(2, 'file').count_noun() == '2 files'
+
+
+def _words_corpus():
+    rng = random.Random(35)
+    corpus = [0, 1, -1, 10, 19, 20, 99, 100, 101, 1000, 1001, 1100, 1000001, 1000020, 1001000, 10 ** 35, 10 ** 36 - 1]
+    corpus += [rng.randrange(-10 ** rng.randrange(1, 36), 10 ** rng.randrange(1, 36)) for _ in range(5000)]
+    corpus += [round(rng.uniform(-10 ** 6, 10 ** 6), rng.randrange(0, 8)) for _ in range(3000)]
+    corpus += [rng.random() * 10 ** rng.randrange(-4, 16) for _ in range(2000)]
+
+    # Inflect can't spell out floats written in scientific notation, so those are left out.
+    return [number for number in corpus if 'e' not in repr(number)]
+
+
+def test_number_to_words_matches_inflect():
+    inf = engine()
+
+    for number in _words_corpus():
+        assert number_to_words(number) == inf.number_to_words(str(number)), number
+
+
+def test_number_to_words_beyond_inflect():
+    assert number_to_words(10 ** 60) == 'one novemdecillion'
+    assert number_to_words(1e20) == 'one hundred quintillion point zero'
+    assert number_to_words(2.5e-05) == 'zero point zero zero zero zero two five'
+    assert Numerical(-12.05).to_words() == 'minus twelve point zero five'
+
+    for bad in (MAX_WORDS_NUMBER + 1, float('inf'), float('nan'), '12'):
+        with pytest.raises(ValueError):
+            number_to_words(bad)
+
+
+@pytest.mark.parametrize(
+        "opts",
+        [{}, {'skip_commify': True}, {'to_words': True, 'capitalize': True}, {'only_noun': True, 'period': True},
+         {'round_num': 1}, {'as_int': True, 'full_stop': True}],
+        ids=["default", "skip_commify", "to_words", "only_noun", "round_num", "as_int"]
+        )
+def test_count_nouns_matches_count_noun(opts):
+    values = [0, 1, 2, 1.0, 1.26, 1500, 1234567, -1]
+
+    assert count_nouns(values, 'mouse', **opts) == [Numerical(value, 'mouse').count_noun(**opts) for value in values]
+
+
+def test_batch_functions_write_to_streams():
+    stream = io.StringIO()
+
+    assert count_nouns([1, 2], 'file', stream=stream) is None
+    assert commify_many([1000, 1234567.5], stream=stream, end=';') is None
+    assert stream.getvalue() == '1 file\n2 files\n1,000;1,234,567.5;'
@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# The cumulative time (in microseconds) that `import inspyre_toolbox.humanize` may take. Importing inflect alone blows
+# well past this. Set ISTB_HUMANIZE_IMPORT_BUDGET_US to adjust it for slow machines.
+IMPORT_BUDGET_US = int(os.environ.get('ISTB_HUMANIZE_IMPORT_BUDGET_US', 1_000_000))
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _import_times(module: str) -> dict:
+    """Import `module` in a fresh interpreter with `-X importtime`, and return the cumulative time for each module."""
+    # Run once first, so that the timed run doesn't include compiling bytecode.
+    command = [sys.executable, '-X', 'importtime', '-c', f'import {module}']
+    subprocess.run(command, cwd=REPO_ROOT, capture_output=True, check=True)
+    result = subprocess.run(command, cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+
+    times = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def test_humanize_import_is_lazy_and_within_budget():
+    times = _import_times('inspyre_toolbox.humanize')
+
+    assert 'inflect' not in times
+    assert times['inspyre_toolbox.humanize'] < IMPORT_BUDGET_US
+
+
+def test_engine_is_created_on_first_use():
+    from inspyre_toolbox import humanize
+
+    assert humanize.INF is humanize.get_engine()
+    assert humanize.plural_noun('file', 2) == 'files'
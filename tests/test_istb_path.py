@@ -0,0 +1,67 @@
+import pytest
+
+from inspyre_toolbox.path_man import ISTB_FastPath, ISTB_Path
+
+
+def test_istb_path_instances_freeze_independently(tmp_path):
+    first = ISTB_Path(tmp_path / 'one')
+    second = ISTB_Path(tmp_path / 'two')
+
+    assert str(first) != str(second)
+
+    with pytest.raises(AttributeError):
+        first.path = tmp_path / 'three'
+
+
+def test_fast_path_prepare_matches_istb_path(tmp_path):
+    target = str(tmp_path / 'prepared')
+
+    assert ISTB_FastPath(target).prepare() == ISTB_Path(target).prepare()
+    assert (tmp_path / 'prepared').is_dir()
+
+
+def test_fast_path_prepare_all_interns_results(tmp_path):
+    ISTB_FastPath.clear_prepared_cache()
+    target = str(tmp_path / 'interned')
+
+    first, second = ISTB_FastPath.prepare_all([target, target])
+
+    assert first.prepared and second.prepared
+    assert first.path is second.path
+    assert ISTB_FastPath(target, auto_prepare=True).path is first.path
+
+
+def test_fast_path_is_read_only(tmp_path):
+    path = ISTB_FastPath(tmp_path)
+
+    with pytest.raises(AttributeError):
+        path.path = tmp_path / 'other'
+
+    with pytest.raises(AttributeError):
+        path.anything = True
+
+    with pytest.raises(TypeError):
+        ISTB_FastPath(tmp_path, auto_prepare='yes')
+
+
+def test_fast_path_resolves_relative_paths_against_the_current_directory(tmp_path, monkeypatch):
+    ISTB_FastPath.clear_prepared_cache()
+    (tmp_path / 'a').mkdir()
+    (tmp_path / 'b').mkdir()
+
+    monkeypatch.chdir(tmp_path / 'a')
+    assert ISTB_FastPath('x', auto_prepare=True).path == (tmp_path / 'a' / 'x').resolve()
+
+    monkeypatch.chdir(tmp_path / 'b')
+    assert ISTB_FastPath('x', auto_prepare=True).path == (tmp_path / 'b' / 'x').resolve()
+    assert (tmp_path / 'b' / 'x').is_dir()
+
+
+def test_fast_path_recreates_removed_directories(tmp_path):
+    target = tmp_path / 'removed'
+
+    ISTB_FastPath(str(target), auto_prepare=True)
+    target.rmdir()
+    ISTB_FastPath(str(target), auto_prepare=True)
+
+    assert target.is_dir()
@@ -0,0 +1,185 @@
+import math
+import pickle
+import random
+import threading
+
+import pytest
+
+from inspyre_toolbox.live_timer import LatencyHistogram, REGISTRY, TimerRegistry, timed
+from inspyre_toolbox.live_timer.clock import NS_PER_SECOND
+
+
+def _exact_percentile(values, percentile):
+    return sorted(values)[max(math.ceil(percentile / 100 * len(values)), 1) - 1]
+
+
+def test_percentiles_are_within_precision():
+    rng = random.Random(42)
+    values = [int(rng.lognormvariate(12, 2)) for _ in range(20000)]
+    histogram = LatencyHistogram()
+
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.count == len(values)
+    assert histogram.sum == sum(values)
+    assert histogram.min == min(values)
+    assert histogram.max == max(values)
+
+    for percentile, value in histogram.percentiles((0, 50, 90, 99, 99.9, 100)).items():
+        exact = _exact_percentile(values, percentile)
+        assert abs(value - exact) <= exact / 64 + 1, percentile
+
+
+def test_buckets_cover_every_value_once():
+    histogram = LatencyHistogram(significant_bits=4)
+    previous_high = -1
+    index = 0
+
+    while previous_high < (1 << 64) - 1:
+        low, high = histogram.bucket_bounds(index)
+        assert low == previous_high + 1
+        previous_high = high
+        index += 1
+
+
+def test_merge_and_pickle():
+    first, second = LatencyHistogram(), LatencyHistogram()
+
+    for value in range(1, 1001):
+        (first if value % 2 else second).record(value)
+
+    merged = pickle.loads(pickle.dumps(first)).merge(second)
+
+    assert merged.count == 1000
+    assert merged.min == 1 and merged.max == 1000
+    assert merged.percentile(50) == pytest.approx(500, rel=1 / 64)
+
+    with pytest.raises(ValueError):
+        merged.merge(LatencyHistogram(significant_bits=5))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def test_registry_decorator_and_context_manager():
+    clock = FakeClock()
+    registry = TimerRegistry(clock=clock)
+
+    @timed('work', registry=registry)
+    def work(duration_ms):
+        clock.now += duration_ms * NS_PER_SECOND // 1000
+
+    for duration_ms in range(1, 101):
+        work(duration_ms)
+
+    with timed('block', registry=registry):
+        clock.now += NS_PER_SECOND
+
+    report = registry.report()
+
+    assert registry.names() == ['block', 'work']
+    assert report['work']['count'] == 100
+    assert report['work']['p50'] == pytest.approx(0.050, rel=1 / 64)
+    assert report['work']['p99'] == pytest.approx(0.099, rel=1 / 64)
+    assert report['work']['max'] == 0.1
+    assert report['block']['total'] == 1
+    assert 'work' in registry.format_report()
+
+
+def test_bare_decorator_uses_the_default_registry():
+    @timed
+    def bare():
+        return 'done'
+
+    assert bare() == 'done'
+    assert bare.__name__ == 'bare'
+    assert REGISTRY.get(f'{__name__}.{bare.__qualname__}').count == 1
+
+
+def test_shared_context_manager_nests_and_crosses_threads():
+    clock = FakeClock()
+    registry = TimerRegistry(clock=clock)
+    block = timed('block', registry=registry)
+
+    with block:
+        clock.now += 10
+
+        with block:
+            clock.now += 5
+
+    assert registry.get('block').histogram.max == 15
+    assert registry.get('block').histogram.min == 5
+
+    entered, release = threading.Event(), threading.Event()
+
+    def other_thread():
+        with block:
+            entered.set()
+            release.wait(5)
+            clock.now += 100
+
+    thread = threading.Thread(target=other_thread)
+    clock.now = 1000
+    thread.start()
+    entered.wait(5)
+
+    # Entered (and left) in this thread while the other is inside; their start times are kept apart.
+    with block:
+        clock.now += 1
+
+    release.set()
+    thread.join()
+
+    assert registry.get('block').histogram.max == 101
+
+
+def test_registry_can_be_listed_while_timers_are_added_and_cleared():
+    registry = TimerRegistry()
+    done = threading.Event()
+    errors = []
+
+    def add():
+        for index in range(20000):
+            registry.get(f'timer.{index}')
+
+            if index % 50 == 49 and index < 19950:
+                registry.clear()
+
+        done.set()
+
+    def list_names():
+        try:
+            while not done.is_set():
+                registry.names()
+                registry.report(())
+        except (KeyError, RuntimeError) as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=add), threading.Thread(target=list_names)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(registry.names()) == 50
+
+
+def test_registries_merge():
+    first, second = TimerRegistry(), TimerRegistry()
+    first.get('a').record(10)
+    second.get('a').record(30)
+    second.get('b').record(5)
+
+    first.merge(second.histograms())
+
+    assert first.get('a').count == 2
+    assert first.get('b').report()['max'] == 5 / NS_PER_SECOND
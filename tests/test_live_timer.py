@@ -0,0 +1,189 @@
+import io
+import time
+
+import pytest
+from rich.console import Console
+
+from inspyre_toolbox.live_timer import LiveTimerDisplay, Stopwatch, Timer
+from inspyre_toolbox.live_timer.clock import NS_PER_SECOND
+from inspyre_toolbox.live_timer.errors import TimerNotRunningError, TimerNotStartedError
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self, start_ns=5 * NS_PER_SECOND):
+        self.now = start_ns
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += int(seconds * NS_PER_SECOND)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_elapsed_uses_the_injected_clock(clock):
+    timer = Timer(clock=clock, wall_clock=lambda: 1_700_000_000.0)
+    timer.start()
+
+    clock.advance(1.5)
+
+    assert timer.elapsed_ns == int(1.5 * NS_PER_SECOND)
+    assert timer.get_elapsed(seconds=True) == 1.5
+    assert timer.get_elapsed() == '00:00:01'
+    assert timer.start_time == 1_700_000_000.0
+
+
+def test_pauses_are_excluded_exactly(clock):
+    timer = Timer(clock=clock)
+    timer.start()
+
+    clock.advance(2)
+    timer.pause()
+    clock.advance(10)
+
+    assert timer.elapsed_ns == 2 * NS_PER_SECOND
+
+    timer.unpause()
+    clock.advance(3)
+
+    assert timer.elapsed_ns == 5 * NS_PER_SECOND
+    assert timer.total_pause_time == 10
+
+
+def test_stopped_timer_keeps_its_elapsed_time(clock):
+    timer = Timer(clock=clock)
+    timer.start()
+    clock.advance(4)
+    timer.stop()
+    clock.advance(100)
+
+    assert timer.elapsed == 4
+
+
+def test_history_is_timed_with_the_same_clock(clock):
+    timer = Timer(clock=clock)
+    clock.advance(1)
+    timer.start()
+    clock.advance(2)
+    timer.pause()
+
+    entry = timer.history.entries[-1]
+
+    assert entry.action == 'PAUSE'
+    assert entry.elapsed_since_last == '00:00:02'
+    assert entry.rt_at_create == '00:00:03'
+    assert entry.elapsed_since_last_ns == 2 * NS_PER_SECOND
+    assert entry.rt_at_create_ns == 3 * NS_PER_SECOND
+
+
+def test_history_leaves_paused_time_out(clock):
+    timer = Timer(clock=clock)
+    timer.start()
+    clock.advance(2)
+    timer.pause()
+    clock.advance(60)
+    timer.unpause()
+    clock.advance(1)
+    timer.pause()
+
+    entry = timer.history.entries[-1]
+
+    assert entry.elapsed_since_last == '00:00:01'
+    assert entry.rt_at_create == '00:00:03'
+    assert entry.rt_at_create_ns == 63 * NS_PER_SECOND
+    assert timer.history.entries[0][2:4] == (0.0, '')
+
+
+def test_timer_state_attributes_are_still_writable(clock):
+    timer = Timer(clock=clock, auto_start=True)
+    clock.advance(10)
+
+    timer.total_pause_time = 4
+    assert timer.total_pause_time == 4
+    assert timer.elapsed_ns == 6 * NS_PER_SECOND
+
+    timer.pause_start = 1.5
+    timer.pause_end = None
+    assert (timer.pause_start, timer.pause_end) == (1.5, None)
+
+    timer.stop()
+    timer.mark_2 = timer.mark_2 + 1
+    assert timer.elapsed_ns == 7 * NS_PER_SECOND
+
+
+def test_restarted_timer_keeps_its_clock(clock):
+    timer = Timer(clock=clock, auto_start=True)
+    clock.advance(7)
+    timer.restart()
+    clock.advance(1)
+
+    assert timer.clock is clock
+    assert timer.elapsed_ns == NS_PER_SECOND
+
+
+def test_stopwatch_semantics(clock):
+    stopwatch = Stopwatch(clock=clock, auto_start=True)
+
+    clock.advance(2)
+    assert stopwatch.pause()
+    assert not stopwatch.pause()
+    clock.advance(5)
+    assert stopwatch.unpause()
+    clock.advance(1)
+
+    assert stopwatch.stop() == 3 * NS_PER_SECOND
+
+    clock.advance(10)
+
+    assert stopwatch.elapsed == 3
+    assert stopwatch.stopped and not stopwatch.running
+
+    with pytest.raises(TimerNotRunningError):
+        stopwatch.pause()
+
+
+def test_stopwatch_context_manager_and_slots(clock):
+    with Stopwatch(clock=clock) as stopwatch:
+        clock.advance(0.25)
+
+    assert stopwatch.elapsed_ns == NS_PER_SECOND // 4
+
+    with pytest.raises(AttributeError):
+        stopwatch.anything = True
+
+    with pytest.raises(TimerNotStartedError):
+        Stopwatch().elapsed_ns
+
+
+def test_live_display_only_redraws_when_the_text_changes(clock):
+    timer = Timer(clock=clock)
+    console = Console(file=io.StringIO(), force_terminal=False, width=40)
+    display = timer.live(fps=1000, label='Elapsed', console=console)
+
+    with display:
+        time.sleep(0.05)
+        assert display.text == 'Elapsed: 00:00:00'
+
+        timer.start()
+        clock.advance(0.4)
+        time.sleep(0.05)
+        assert display.renders == 1
+
+        clock.advance(1)
+        time.sleep(0.05)
+        assert display.text == 'Elapsed: 00:00:01'
+
+    assert display.renders == 2
+    assert not display.running
+    assert timer.history.count('QUERY') == 0
+
+
+def test_live_display_rejects_a_bad_frame_rate():
+    with pytest.raises(ValueError):
+        LiveTimerDisplay(Stopwatch(), fps=0)
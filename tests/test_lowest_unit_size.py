@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from inspyre_toolbox.conversions.bytes import ByteConverter, get_lowest_unit_size
+from inspyre_toolbox.filesystem.file import helpers
+
+
+def _legacy_get_lowest_unit_size(size):
+    """The original implementation, which tries every unit from the largest down."""
+    units = ['byte', 'kilobyte', 'megabyte', 'gigabyte', 'terabyte', 'petabyte', 'exabyte', 'zetabyte', 'yottabyte']
+    units.reverse()
+    converter = ByteConverter(size, 'byte')
+
+    for unit in units:
+        converted = converter.convert(unit.lower())
+
+        if converted >= 1:
+            return converted, unit.upper(),
+
+
+def _sizes():
+    rng = random.Random(31)
+    sizes = [1, 2, 999, 1000, 1001, 1023, 1024, 1025]
+    for power in range(1, 30):
+        sizes += [10 ** power - 1, 10 ** power, 10 ** power + 1, 2 ** (power * 3) - 1, 2 ** (power * 3)]
+    sizes += [rng.randrange(1, 10 ** rng.randrange(1, 30)) for _ in range(3000)]
+    sizes += [1 + rng.random() * 10 ** rng.randrange(0, 28) for _ in range(3000)]
+    return sizes
+
+
+def test_agrees_with_legacy_implementation():
+    for size in _sizes():
+        assert get_lowest_unit_size(size) == _legacy_get_lowest_unit_size(size), size
+
+
+def test_binary_units_match_repeated_division():
+    units = ['BYTE', 'KIBIBYTE', 'MEBIBYTE', 'GIBIBYTE', 'TEBIBYTE', 'PEBIBYTE', 'EXBIBYTE', 'ZEBIBYTE', 'YOBIBYTE']
+
+    for size in _sizes():
+        power = max(p for p in range(len(units)) if size / 1024 ** p >= 1)
+        assert get_lowest_unit_size(size, binary=True) == (size / 1024 ** power, units[power]), size
+
+
+@pytest.mark.parametrize(
+        "size, binary, expected",
+        [
+                (0, False, (0, 'B')),
+                (1536, True, (1.5, 'KiB')),
+                (1536, False, (1.536, 'KB')),
+                (5 * 1024 ** 9, True, (5120.0, 'YiB')),
+                (float('inf'), False, (float('inf'), 'YB')),
+                ],
+        ids=["zero", "kibibytes", "kilobytes", "beyond_yobibytes", "infinite"]
+        )
+def test_abbreviations_and_edges(size, binary, expected):
+    assert get_lowest_unit_size(size, binary=binary, abbreviate=True) == expected
+
+
+def test_filesystem_helpers_use_the_canonical_function():
+    assert helpers.get_lowest_unit_size is get_lowest_unit_size
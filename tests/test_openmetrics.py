@@ -0,0 +1,113 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+from inspyre_toolbox.conversions.bytes import ThroughputMeter
+from inspyre_toolbox.live_timer import MetricsExporter, TimerRegistry
+from inspyre_toolbox.live_timer.clock import NS_PER_SECOND
+from inspyre_toolbox.live_timer.histogram import ShardedHistogram
+from inspyre_toolbox.live_timer.openmetrics import CONTENT_TYPE, format_labels
+from inspyre_toolbox.path_man.index import DirectoryIndex
+
+
+@pytest.fixture
+def exporter():
+    timers = TimerRegistry()
+    timer = timers.get('db.query')
+
+    for duration_ms in (0.2, 0.2, 3, 40, 2000):
+        timer.record(int(duration_ms / 1000 * NS_PER_SECOND))
+
+    exporter = MetricsExporter(timers, buckets=(0.001, 0.01, 0.1, 1.0))
+
+    index = DirectoryIndex()
+    index.hits, index.misses = 3, 1
+    exporter.add_directory_index(index)
+
+    meter = ThroughputMeter()
+    meter.update(4096)
+    exporter.add_throughput_meter(meter, 'hashed')
+
+    exporter.add_counter('files_scanned', lambda: 12, help='Files scanned.', labels={'root': '/srv'})
+
+    return exporter
+
+
+def test_timers_are_exported_as_cumulative_histograms(exporter):
+    lines = exporter.render().splitlines()
+
+    assert '# TYPE istb_timer_seconds histogram' in lines
+    assert 'istb_timer_seconds_bucket{timer="db.query",le="0.001"} 2' in lines
+    assert 'istb_timer_seconds_bucket{timer="db.query",le="0.01"} 3' in lines
+    assert 'istb_timer_seconds_bucket{timer="db.query",le="0.1"} 4' in lines
+    assert 'istb_timer_seconds_bucket{timer="db.query",le="1.0"} 4' in lines
+    assert 'istb_timer_seconds_bucket{timer="db.query",le="+Inf"} 5' in lines
+    assert 'istb_timer_seconds_count{timer="db.query"} 5' in lines
+    assert lines[-1] == '# EOF'
+
+
+def test_scrapes_read_timers_without_copying_or_creating_them(monkeypatch):
+    timers = TimerRegistry()
+    timers.get('kept').record(NS_PER_SECOND // 100)
+    exporter = MetricsExporter(timers, buckets=(0.001, 0.1))
+
+    def refuse(self):
+        raise AssertionError('A scrape merged a histogram.')
+
+    monkeypatch.setattr(ShardedHistogram, 'snapshot', refuse)
+
+    # As if 'gone' was removed (e.g. by `TimerRegistry.clear`) just after the scrape listed the timers.
+    monkeypatch.setattr(timers, 'names', lambda: ['gone', 'kept'])
+    rendered = exporter.render()
+
+    assert 'istb_timer_seconds_count{timer="kept"} 1' in rendered
+    assert 'gone' not in rendered
+    assert 'gone' not in timers
+
+
+def test_counters_and_gauges(exporter):
+    lines = exporter.render().splitlines()
+
+    assert 'istb_directory_index_hits_total 3' in lines
+    assert 'istb_directory_index_misses_total 1' in lines
+    assert 'istb_directory_index_hit_ratio 0.75' in lines
+    assert '# UNIT istb_hashed_bytes bytes' in lines
+    assert 'istb_hashed_bytes_total 4096' in lines
+    assert 'istb_files_scanned_total{root="/srv"} 12' in lines
+
+
+def test_a_name_is_only_one_type(exporter):
+    with pytest.raises(ValueError):
+        exporter.add_gauge('files_scanned', lambda: 1)
+
+
+def test_label_values_are_escaped():
+    assert format_labels({'path': 'a"b\\c\nd'}) == '{path="a\\"b\\\\c\\nd"}'
+
+
+def test_textfile(exporter, tmp_path):
+    path = exporter.write_textfile(tmp_path / 'toolbox.prom')
+
+    assert path.read_text() == exporter.render()
+    assert not (tmp_path / 'toolbox.prom.tmp').exists()
+
+
+def test_served_over_http(exporter):
+    server = exporter.serve()
+
+    try:
+        url = f'http://127.0.0.1:{server.server_port}'
+
+        with urllib.request.urlopen(f'{url}/metrics', timeout=10) as response:
+            assert response.headers['Content-Type'] == CONTENT_TYPE
+            body = response.read().decode()
+
+        assert 'istb_timer_seconds_count{timer="db.query"} 5' in body
+        assert body.endswith('# EOF\n')
+
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f'{url}/nope', timeout=10)
+    finally:
+        server.shutdown()
+        server.server_close()
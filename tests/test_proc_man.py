@@ -0,0 +1,217 @@
+import os
+import subprocess
+import sys
+import time
+
+import psutil
+import pytest
+
+from inspyre_toolbox.proc_man import find_all_by_name, kill_all_in_list
+from inspyre_toolbox.proc_man.scanner import HAS_PROCFS, get_username, iter_processes, read_process
+from inspyre_toolbox.proc_man.table import ProcessTable
+from inspyre_toolbox.proc_man.terminate import terminate_processes
+from inspyre_toolbox.proc_man.tree import descendants, find_tree, kill_tree, tree_usage
+
+
+@pytest.fixture
+def sleeper():
+    child = subprocess.Popen(['sleep', '60'])
+
+    # Wait for the exec, so the child has its own name.
+    for _ in range(200):
+        if psutil.Process(child.pid).name() == 'sleep':
+            break
+
+        time.sleep(0.01)
+
+    yield child
+
+    child.kill()
+    child.wait()
+
+
+NEEDS_PROCFS = pytest.mark.skipif(not HAS_PROCFS, reason='No /proc on this platform.')
+
+
+@pytest.mark.parametrize('use_procfs', [pytest.param(True, marks=NEEDS_PROCFS), False])
+def test_scan_agrees_with_psutil(use_procfs):
+    me = psutil.Process()
+    scanned = {proc.pid: proc for proc in iter_processes(use_procfs)}
+
+    info = scanned[os.getpid()]
+    assert info.name == me.name()
+    assert info.ppid == me.ppid()
+    assert info.create_time == pytest.approx(me.create_time(), abs=0.05)
+
+
+def test_read_process_and_username():
+    info = read_process(os.getpid())
+
+    assert info.pid == os.getpid()
+    assert get_username(os.getpid()) == psutil.Process().username()
+    assert read_process(2 ** 22 + 1) is None
+
+
+@pytest.mark.parametrize('use_procfs', [None, False])
+def test_find_all_by_name(sleeper, use_procfs):
+    found = find_all_by_name('SLEEP', use_procfs=use_procfs)
+    match = next(proc for proc in found if proc['pid'] == sleeper.pid)
+
+    assert match['name'] == 'sleep'
+    assert match['username'] == psutil.Process().username()
+    assert match['create_time'] == pytest.approx(psutil.Process(sleeper.pid).create_time(), abs=0.05)
+    assert match['create_time_readable'].year >= 2020
+
+    assert not any(proc['pid'] == sleeper.pid for proc in find_all_by_name('SLEEP', case_sensitive=True))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_process_table_indexes(sleeper):
+    table = ProcessTable(ttl=None)
+
+    assert sleeper.pid in table.pids_by_name('sleep')
+    assert sleeper.pid in table.pids_by_name('SLEEP')
+    assert sleeper.pid not in table.pids_by_name('SLEEP', case_sensitive=True)
+    assert sleeper.pid in table.pids_by_name('lee', exact=False)
+    assert table.get(sleeper.pid).ppid == os.getpid()
+    assert sleeper.pid in table.children(os.getpid())
+    assert sleeper.pid in table
+
+    found = find_all_by_name('sleep', table=table)
+    assert any(proc['pid'] == sleeper.pid for proc in found)
+
+
+def test_process_table_refreshes_incrementally_after_its_ttl(sleeper):
+    clock = FakeClock()
+    table = ProcessTable(ttl=2.0, clock=clock)
+    assert table.stale
+
+    before = len(table)
+    assert table.last_reads == before
+    assert not table.stale
+
+    sleeper.kill()
+    sleeper.wait()
+    newcomer = subprocess.Popen(['sleep', '60'])
+
+    try:
+        # Within the TTL, the snapshot is served as it was.
+        assert sleeper.pid in table
+
+        clock.now += 2.0
+        assert table.stale
+        assert newcomer.pid in table
+        assert sleeper.pid not in table
+        assert table.last_reads < before
+
+        table.refresh(full=True)
+        assert table.last_reads == len(table)
+    finally:
+        newcomer.kill()
+        newcomer.wait()
+
+
+def test_terminate_processes_stops_them_together():
+    children = [subprocess.Popen(['sleep', '60']) for _ in range(20)]
+
+    try:
+        report = terminate_processes([child.pid for child in children], grace=5.0)
+
+        assert report.ok
+        assert report.terminated == sorted(child.pid for child in children)
+        assert not report.killed
+        # Each waited for in turn would take at least as many polls as there are children.
+        assert report.elapsed < 2.0
+    finally:
+        for child in children:
+            child.kill()
+            child.wait()
+
+
+def test_terminate_processes_kills_those_that_ignore_the_signal():
+    stubborn = subprocess.Popen([sys.executable, '-c', 'import signal, sys, time\n'
+                                                       'signal.signal(signal.SIGTERM, signal.SIG_IGN)\n'
+                                                       'print(flush=True)\n'
+                                                       'time.sleep(60)'], stdout=subprocess.PIPE)
+    # Wait until the handler is in place.
+    stubborn.stdout.readline()
+
+    try:
+        report = terminate_processes([stubborn.pid], grace=0.5)
+
+        assert report.killed == [stubborn.pid]
+        assert report.returncodes[stubborn.pid] == -9
+        assert report.ok
+
+        assert terminate_processes([stubborn.pid], grace=0.5, escalate=False).missing == [stubborn.pid]
+    finally:
+        stubborn.kill()
+        stubborn.wait()
+
+
+def test_kill_all_in_list_leaves_reused_pids_alone(sleeper):
+    found = {'pid': sleeper.pid, 'create_time': psutil.Process(sleeper.pid).create_time() - 60}
+    report = kill_all_in_list([found, 2 ** 22 + 1])
+
+    assert report.missing == sorted([sleeper.pid, 2 ** 22 + 1])
+    assert sleeper.poll() is None
+
+    found['create_time'] += 60
+    assert kill_all_in_list([found, os.getpid()]).terminated == [sleeper.pid]
+
+
+@pytest.fixture
+def service():
+    # A parent with two children, as a service's main process might have workers.
+    parent = subprocess.Popen(['sh', '-c', 'sleep 60 & sleep 60 & wait'])
+
+    for _ in range(200):
+        if len(psutil.Process(parent.pid).children()) == 2:
+            break
+
+        time.sleep(0.01)
+
+    yield parent
+
+    if parent.poll() is None:
+        for proc in psutil.Process(parent.pid).children() + [psutil.Process(parent.pid)]:
+            proc.kill()
+
+    parent.wait()
+
+
+def test_find_tree_and_usage(service):
+    workers = sorted(proc.pid for proc in psutil.Process(service.pid).children())
+
+    tree = find_tree(service.pid)
+    assert tree[0].pid == service.pid
+    assert sorted(info.pid for info in tree[1:]) == workers
+    assert sorted(descendants(service.pid, table=ProcessTable())) == workers
+    assert service.pid in descendants(os.getpid())
+    assert find_tree(2 ** 22 + 1) == []
+
+    usage = tree_usage(service.pid, interval=0.05)
+    assert usage.pids == sorted([service.pid] + workers)
+    assert usage.rss > 0
+    assert usage.cpu_percent >= 0
+
+
+@pytest.mark.parametrize('include_root', [True, False])
+def test_kill_tree(service, include_root):
+    workers = sorted(proc.pid for proc in psutil.Process(service.pid).children())
+
+    report = kill_tree(service.pid, include_root=include_root, grace=2.0)
+
+    assert report.ok
+    assert report.stopped == sorted(workers + [service.pid] if include_root else workers)
+    assert not any(psutil.pid_exists(pid) and psutil.Process(pid).status() != psutil.STATUS_ZOMBIE for pid in workers)
+
+    # Without its workers, the service's 'wait' returns.
+    assert service.wait(timeout=5) is not None
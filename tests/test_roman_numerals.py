@@ -0,0 +1,65 @@
+import pytest
+
+from inspyre_toolbox.conversions.roman_numerals import (
+    MAX_ROMAN_NUMERAL,
+    ROMAN_NUMERAL_PATTERN,
+    RomanNumeral,
+    from_roman,
+    from_roman_many,
+    roman_numeral_to_integer,
+    to_roman,
+    to_roman_many,
+    validate_roman_numeral_str,
+    )
+from inspyre_toolbox.conversions.roman_numerals.errors import InvalidRomanNumeralStringError
+
+
+def test_exhaustive_round_trip():
+    numbers = list(range(1, MAX_ROMAN_NUMERAL + 1))
+    numerals = to_roman_many(numbers)
+
+    assert from_roman_many(numerals) == numbers
+    assert from_roman_many([numeral.lower() for numeral in numerals]) == numbers
+
+    for number, numeral in zip(numbers, numerals):
+        assert to_roman(number) == numeral
+        assert ROMAN_NUMERAL_PATTERN.fullmatch(numeral)
+        assert validate_roman_numeral_str(numeral, strict=True)
+        assert RomanNumeral(numeral).as_int == number
+
+
+@pytest.mark.parametrize(
+        "number, numeral",
+        [(1, 'I'), (4, 'IV'), (9, 'IX'), (14, 'XIV'), (40, 'XL'), (90, 'XC'), (400, 'CD'), (1994, 'MCMXCIV'),
+         (3999, 'MMMCMXCIX')]
+        )
+def test_known_numerals(number, numeral):
+    assert to_roman(number) == numeral
+    assert from_roman(numeral) == number
+    assert roman_numeral_to_integer(numeral) == number
+
+
+@pytest.mark.parametrize("numeral", ['', 'IIII', 'VV', 'IC', 'MMMM', 'XM', 'ABC'])
+def test_strict_rejects_non_standard_numerals(numeral):
+    assert not validate_roman_numeral_str(numeral, strict=True)
+
+    with pytest.raises(InvalidRomanNumeralStringError):
+        from_roman(numeral)
+
+
+def test_lenient_parsing_matches_legacy_behaviour():
+    assert from_roman('IIII', strict=False) == 4
+    assert from_roman('MMMM', strict=False) == 4000
+    assert RomanNumeral('iiii').as_int == 4
+
+    with pytest.raises(InvalidRomanNumeralStringError):
+        from_roman('ABC', strict=False)
+
+
+@pytest.mark.parametrize("number, error", [(0, ValueError), (4000, ValueError), (1.0, TypeError), (True, TypeError)])
+def test_to_roman_rejects_bad_numbers(number, error):
+    with pytest.raises(error):
+        to_roman(number)
+
+    with pytest.raises(error):
+        to_roman_many([1, number])
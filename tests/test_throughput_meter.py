@@ -0,0 +1,97 @@
+import subprocess
+import sys
+from pathlib import Path
+from threading import Thread
+
+import pytest
+
+from inspyre_toolbox.conversions.bytes import ThroughputMeter, humanize_rate
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_steady_rate_and_eta():
+    clock = FakeClock()
+    meter = ThroughputMeter(total=10_000_000, window=5, clock=clock)
+
+    for _ in range(10):
+        clock.now += 1
+        meter.update(500_000)
+
+    assert meter.done == 5_000_000
+    assert meter.ewma_rate == pytest.approx(500_000)
+    assert meter.window_rate == pytest.approx(500_000)
+    assert meter.average_rate == pytest.approx(500_000)
+    assert meter.eta == pytest.approx(10)
+    assert meter.eta_str() == '00:00:10'
+    assert meter.rate_str() == '500.00 KB/s'
+
+
+def test_window_forgets_old_bytes_and_ewma_follows():
+    clock = FakeClock()
+    meter = ThroughputMeter(window=4, half_life=1, slots=4, clock=clock)
+
+    for _ in range(10):
+        clock.now += 1
+        meter.update(1_000_000)
+
+    for _ in range(10):
+        clock.now += 1
+        meter.update(1000)
+
+    assert meter.window_rate == pytest.approx(1000)
+    assert meter.ewma_rate < 2000
+
+
+def test_unknown_eta():
+    meter = ThroughputMeter(clock=FakeClock())
+
+    assert meter.eta is None
+    assert meter.eta_str() == '--:--:--'
+
+
+def test_long_eta():
+    clock = FakeClock()
+    meter = ThroughputMeter(total=100 * 3_723 + 100, clock=clock)
+    clock.now += 1
+    meter.update(100)
+
+    assert meter.eta_str() == '01:02:03'
+
+
+def test_importing_conversions_does_not_import_the_timers():
+    code = 'import sys, inspyre_toolbox.conversions.bytes; print("inspyre_toolbox.live_timer" in sys.modules)'
+    result = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == 'False'
+
+
+def test_updates_from_many_threads_are_all_counted():
+    meter = ThroughputMeter()
+
+    def work():
+        for _ in range(10000):
+            meter.update(3)
+
+    threads = [Thread(target=work) for _ in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert meter.done == 8 * 10000 * 3
+
+
+def test_humanize_rate():
+    assert humanize_rate(1536, binary=True) == '1.50 KiB/s'
+    assert humanize_rate(0) == '0.00 B/s'
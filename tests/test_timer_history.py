@@ -0,0 +1,130 @@
+import pytest
+
+from inspyre_toolbox.live_timer import Timer
+from inspyre_toolbox.live_timer.history import HistoryEntry, TimerHistory
+from inspyre_toolbox.live_timer.persistence import HistorySink, load_history
+
+
+def test_history_is_bounded_but_counts_everything():
+    history = TimerHistory(capacity=4)
+
+    for _ in range(10):
+        history.add("QUERY")
+
+    history.add("RESET")
+
+    assert len(history.entries) == 4
+    assert history.entries[-1].action == "RESET"
+    assert history.count("query") == 10
+    assert history.num_resets == 1
+    assert history.counts["CREATE"] == 1
+
+
+def test_queries_can_be_left_out():
+    history = TimerHistory(record_queries=False)
+
+    history.add("START")
+    history.add("QUERY")
+    history.add("STOP")
+
+    assert [entry.action for entry in history.entries] == ["CREATE", "START", "STOP"]
+    assert history.count("QUERY") == 1
+
+
+def test_entries_are_compact_and_timed():
+    history = TimerHistory(capacity=None)
+    entry = history.add("PAUSE")
+
+    assert isinstance(entry, HistoryEntry)
+    assert entry.elapsed_since_last == entry.rt_at_create == '00:00:00'
+    assert entry.rt_at_create_ns >= entry.elapsed_since_last_ns >= 0
+    assert history.ledger[-1] == entry._asdict()
+
+
+def test_elapsed_method_is_deprecated():
+    with pytest.warns(DeprecationWarning):
+        history = TimerHistory(lambda ts: '99:99:99')
+
+    assert history.add("START").elapsed_since_last == '00:00:00'
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        TimerHistory(capacity=0)
+
+
+def test_polled_timer_history_stays_bounded():
+    timer = Timer(auto_start=True, history_capacity=8)
+
+    for _ in range(100):
+        timer.get_elapsed(seconds=True)
+
+    timer.history.add("RESET")
+
+    assert len(timer.history.entries) == 8
+    assert timer.history.count("QUERY") == 100
+    assert timer.num_resets == 1
+
+
+def test_write_appends_only_new_entries(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    history = TimerHistory(sink=HistorySink(path))
+
+    history.add("START")
+    assert history.write() == 2
+
+    history.add("PAUSE")
+    history.add("UNPAUSE")
+    assert history.write() == 2
+    assert history.write() == 0
+
+    assert [entry.action for entry in load_history(path)] == ["CREATE", "START", "PAUSE", "UNPAUSE"]
+    assert list(load_history(path))[1] == history.entries[1]
+
+
+def test_write_skips_entries_dropped_from_the_ring(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    history = TimerHistory(capacity=3, sink=HistorySink(path))
+
+    for _ in range(10):
+        history.add("QUERY")
+
+    assert history.write() == 3
+    assert len(list(load_history(path))) == 3
+
+
+def test_sink_rotates_and_loader_streams_backups(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    sink = HistorySink(path, max_bytes=400, backup_count=2, buffer_size=1)
+    history = TimerHistory(capacity=None, sink=sink)
+
+    for _ in range(40):
+        history.add("QUERY")
+        history.write()
+
+    assert path.exists()
+    assert (tmp_path / "ledger.jsonl.1").exists()
+    assert (tmp_path / "ledger.jsonl.2").exists()
+    assert not (tmp_path / "ledger.jsonl.3").exists()
+    assert path.stat().st_size <= 400
+
+    loaded = list(load_history(path, include_rotated=True))
+    assert loaded == history.entries[-len(loaded):]
+    assert len(loaded) > len(list(load_history(path)))
+
+
+def test_sink_buffers_until_flushed_and_loader_skips_torn_lines(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    history = TimerHistory()
+
+    with HistorySink(path) as sink:
+        sink.write(history.entries)
+        assert not path.exists()
+
+    with pytest.raises(ValueError):
+        sink.write(history.entries)
+
+    with open(path, "a") as file:
+        file.write('{"time": 1.0, "act')
+
+    assert [entry.action for entry in load_history(path)] == ["CREATE"]
@@ -0,0 +1,190 @@
+import multiprocessing
+import queue
+import threading
+
+import pytest
+
+from inspyre_toolbox.live_timer import (
+    LatencyHistogram,
+    ShardedHistogram,
+    Timer,
+    TimerRegistry,
+    collect_timings,
+    send_timings,
+    timed,
+)
+
+
+def _run_threads(target, count=8):
+    barrier = threading.Barrier(count)
+
+    def run(index):
+        barrier.wait()
+        target(index)
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+
+def test_sharded_histogram_counts_every_thread():
+    histogram = ShardedHistogram()
+
+    def record(index):
+        for value in range(1, 5001):
+            histogram.record(value * (index + 1))
+
+    _run_threads(record)
+
+    snapshot = histogram.snapshot()
+    expected = LatencyHistogram()
+
+    for index in range(8):
+        for value in range(1, 5001):
+            expected.record(value * (index + 1))
+
+    assert histogram.count == snapshot.count == 40000
+    assert snapshot.sum == expected.sum
+    assert list(snapshot.nonzero_buckets()) == list(expected.nonzero_buckets())
+    assert histogram.nonzero_buckets() == list(expected.nonzero_buckets())
+    assert histogram.sum == expected.sum
+
+
+def test_sharded_histogram_merge_and_clear():
+    histogram = ShardedHistogram()
+    other = LatencyHistogram()
+    other.record(100, count=3)
+
+    histogram.record(50)
+    histogram.merge(other)
+    assert histogram.snapshot().count == 4
+
+    histogram.clear()
+    assert histogram.count == 0
+
+    histogram.record(7)
+    assert histogram.snapshot().min == 7
+
+
+def test_named_timer_is_thread_safe():
+    registry = TimerRegistry()
+
+    def work(_):
+        for _ in range(2000):
+            with timed('shared', registry=registry):
+                pass
+
+    _run_threads(work)
+
+    assert registry.get('shared').count == 16000
+    assert registry.report()['shared']['count'] == 16000
+
+
+def test_timer_actions_from_many_threads():
+    timer = Timer(auto_start=True)
+
+    def query(_):
+        for _ in range(200):
+            timer.elapsed_ns
+            timer.get_elapsed(seconds=True)
+
+    _run_threads(query)
+
+    assert timer.history.count('QUERY') == 8 * 200
+    assert timer.history.count('START') == 1
+
+
+def _worker(results, index):
+    registry = TimerRegistry()
+
+    for value in range(100):
+        registry.get('work').record((index + 1) * 1000 + value)
+
+    send_timings(results, registry=registry)
+
+
+def test_collect_timings_from_processes():
+    results = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=_worker, args=(results, index)) for index in range(3)]
+
+    for worker in workers:
+        worker.start()
+
+    registry = TimerRegistry()
+    assert collect_timings(results, registry=registry, expected=len(workers), timeout=30) == 3
+
+    for worker in workers:
+        worker.join()
+
+    histogram = registry.get('work').histogram
+    assert histogram.count == 300
+    assert histogram.min == 1000
+    assert histogram.max == 3099
+
+
+def test_send_timings_resets_and_collect_drains():
+    results = queue.Queue()
+    registry = TimerRegistry()
+    registry.get('a').record(10)
+
+    send_timings(results, registry=registry)
+    send_timings(results, registry=registry)
+
+    assert registry.get('a').count == 0
+
+    collected = TimerRegistry()
+    assert collect_timings(results, registry=collected) == 2
+    assert collected.get('a').count == 1
+
+    with pytest.raises(queue.Empty):
+        collect_timings(results, registry=collected, expected=1, timeout=0.01)
+
+
+def test_snapshots_are_never_torn():
+    histogram = ShardedHistogram()
+    stop = threading.Event()
+
+    def record():
+        while not stop.is_set():
+            histogram.record(1000)
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    try:
+        for _ in range(25):
+            snapshot = histogram.snapshot()
+            assert snapshot.count == sum(count for _, count in snapshot.nonzero_buckets())
+            assert snapshot.sum == 1000 * snapshot.count
+    finally:
+        stop.set()
+
+        for thread in threads:
+            thread.join()
+
+
+def test_drain_loses_nothing_while_recording():
+    registry = TimerRegistry()
+    timer = registry.get('busy')
+    drained = []
+
+    def record(_):
+        for _ in range(5000):
+            timer.record(10)
+
+    worker = threading.Thread(target=_run_threads, args=(record, 4))
+    worker.start()
+
+    while worker.is_alive():
+        drained.append(registry.drain()['busy'].count)
+        worker.join(0.001)
+
+    drained.append(registry.drain()['busy'].count)
+
+    assert sum(drained) == 20000